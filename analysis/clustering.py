@@ -0,0 +1,649 @@
+# analysis/clustering.py
+"""
+Motor de agrupamento de termos por similaridade.
+
+Os pares similares são calculados em blocos com ``rapidfuzz.process.cdist``
+(multi-thread) e depois agrupados sem laços O(n²) em Python, seja pela
+atribuição gulosa por semente (comportamento histórico) ou por componentes
+conexas (union-find vetorizado).
+
+Para milhões de termos, ``blocked_similarity_edges`` substitui a matriz densa
+por uma etapa de geração de candidatos (índice invertido de n-gramas, filtro
+de comprimento e vizinhança ordenada) e pontua apenas os pares plausíveis.
+``cosine_edges`` faz o mesmo papel de ``similarity_edges`` para embeddings,
+com produtos de matrizes em faixas; ``lsh_cosine_neighbors`` é a busca
+aproximada dos vizinhos mais próximos (hiperplanos aleatórios), de custo
+linear no número de termos.
+"""
+
+from __future__ import annotations
+
+from itertools import chain, pairwise
+from typing import TYPE_CHECKING
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from config.settings import (
+    FUZZY_BLOCK_MEMORY_MB,
+    FUZZY_MAX_CANDIDATES,
+    FUZZY_MAX_POSTING,
+    FUZZY_NGRAM_SIZE,
+    FUZZY_PREFIX_NGRAMS,
+    FUZZY_SORTED_WINDOW,
+    FUZZY_WORKERS,
+    SEMANTIC_LSH_BUCKET,
+    SEMANTIC_LSH_TABLES,
+    SEMANTIC_NEIGHBORS,
+)
+from core.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+logger = get_logger("clustering")
+
+CLUSTER_METHODS = ("greedy", "components")
+
+
+def _block_rows(n_cols: int, memory_mb: int, itemsize: int = 1) -> int:
+    """Quantidade de linhas por bloco para caber no orçamento de memória (uint8 por padrão)."""
+    budget = max(1, memory_mb) * 1024 * 1024
+    return max(1, min(n_cols, budget // max(1, n_cols * itemsize)))
+
+
+def similarity_edges(
+    terms: Sequence[str],
+    threshold: float,
+    scorer: Callable = fuzz.ratio,
+    workers: int = FUZZY_WORKERS,
+    memory_mb: int = FUZZY_BLOCK_MEMORY_MB,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calcula todos os pares (i, j), com i < j, cuja similaridade atinge o limiar.
+
+    A matriz triangular superior é processada em faixas de linhas, de modo que
+    a memória usada por bloco fica limitada a ``memory_mb``.
+
+    Returns:
+        Tupla (rows, cols) de arrays int64 com os índices dos pares similares.
+    """
+    n = len(terms)
+    if n < 2:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+
+    rows_parts, cols_parts = [], []
+    step = _block_rows(n, memory_mb)
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        if threshold <= 0:
+            r, c = np.nonzero(np.ones((stop - start, n - start), dtype=bool))
+        else:
+            # Scores abaixo do corte voltam como 0; qualquer valor > 0 passou no limiar
+            scores = process.cdist(
+                terms[start:stop],
+                terms[start:],
+                scorer=scorer,
+                score_cutoff=threshold,
+                dtype=np.uint8,
+                workers=workers,
+            )
+            r, c = np.nonzero(scores)
+        mask = c > r
+        rows_parts.append(r[mask].astype(np.int64) + start)
+        cols_parts.append(c[mask].astype(np.int64) + start)
+
+    return np.concatenate(rows_parts), np.concatenate(cols_parts)
+
+
+def _unit_vectors(embeddings) -> np.ndarray:
+    """Vetores com norma L2 igual a 1 (vetores nulos continuam nulos)."""
+    vectors = np.asarray(embeddings)
+    if not np.issubdtype(vectors.dtype, np.floating):
+        vectors = vectors.astype(np.float64)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
+
+
+def cosine_edges(
+    embeddings, threshold: float, memory_mb: int = FUZZY_BLOCK_MEMORY_MB
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pares (i, j), com i < j, cuja similaridade de cosseno atinge o limiar.
+
+    Os vetores são normalizados (norma L2) uma única vez; cada faixa de
+    linhas é comparada com as linhas seguintes num só produto de matrizes,
+    com a matriz de similaridades limitada a ``memory_mb``. Vetores nulos
+    têm similaridade 0 com todos, como em ``sklearn.metrics.pairwise``.
+
+    Returns:
+        Tupla (rows, cols) de arrays int64 com os índices dos pares similares.
+    """
+    vectors = _unit_vectors(embeddings)
+    n = len(vectors)
+    if n < 2:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+
+    rows_parts, cols_parts = [], []
+    step = _block_rows(n, memory_mb, vectors.dtype.itemsize)
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        r, c = np.nonzero(vectors[start:stop] @ vectors[start:].T >= threshold)
+        mask = c > r
+        rows_parts.append(r[mask].astype(np.int64) + start)
+        cols_parts.append(c[mask].astype(np.int64) + start)
+
+    return np.concatenate(rows_parts), np.concatenate(cols_parts)
+
+
+def _top_k(
+    rows: np.ndarray, cols: np.ndarray, sims: np.ndarray, k: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Mantém, por linha, os ``k`` vizinhos distintos mais similares (ordem decrescente)."""
+    order = np.lexsort((cols, -sims, rows))
+    rows, cols, sims = rows[order], cols[order], sims[order]
+    n_cols = int(cols.max()) + 1 if len(cols) else 1
+    _, first = np.unique(rows * n_cols + cols, return_index=True)
+    first.sort()
+    rows, cols, sims = rows[first], cols[first], sims[first]
+    starts = np.r_[True, rows[1:] != rows[:-1]] if len(rows) else np.empty(0, dtype=bool)
+    rank = np.arange(len(rows)) - np.flatnonzero(starts)[np.cumsum(starts) - 1]
+    keep = rank < k
+    return rows[keep], cols[keep], sims[keep]
+
+
+def _block_top_k(
+    sims: np.ndarray, rows: np.ndarray, cols: np.ndarray, threshold: float, k: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Os ``k`` maiores valores de cada linha de ``sims`` que atingem o limiar."""
+    kk = min(k, sims.shape[1])
+    idx = np.argpartition(-sims, kk - 1, axis=1)[:, :kk]
+    vals = np.take_along_axis(sims, idx, axis=1).ravel()
+    keep = vals >= threshold
+    return np.repeat(rows, kk)[keep], cols[idx.ravel()][keep], vals[keep]
+
+
+def cosine_neighbors(
+    embeddings,
+    threshold: float,
+    k: int = SEMANTIC_NEIGHBORS,
+    memory_mb: int = FUZZY_BLOCK_MEMORY_MB,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Até ``k`` vizinhos mais similares de cada vetor, com similaridade >= ``threshold``.
+
+    Busca exata por faixas de linhas contra todos os vetores (custo n²);
+    referência para ``lsh_cosine_neighbors``.
+
+    Returns:
+        Tupla (rows, cols, sims): pares dirigidos i -> j (i != j), agrupados
+        por ``rows`` e em ordem decrescente de similaridade.
+    """
+    vectors = _unit_vectors(embeddings)
+    n = len(vectors)
+    parts = []
+    if n > 1 and k > 0:
+        step = _block_rows(n, memory_mb, vectors.dtype.itemsize)
+        targets = np.arange(n)
+        for start in range(0, n, step):
+            stop = min(start + step, n)
+            sims = vectors[start:stop] @ vectors.T
+            sims[np.arange(stop - start), np.arange(start, stop)] = -np.inf
+            parts.append(_block_top_k(sims, np.arange(start, stop), targets, threshold, k))
+    return _merge_neighbors(parts, k)
+
+
+def _merge_neighbors(parts: list, k: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if not parts:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy(), np.empty(0)
+    rows, cols, sims = (np.concatenate(arrays) for arrays in zip(*parts, strict=True))
+    return _top_k(rows.astype(np.int64), cols.astype(np.int64), sims, k)
+
+
+def lsh_cosine_neighbors(
+    embeddings,
+    threshold: float,
+    k: int = SEMANTIC_NEIGHBORS,
+    *,
+    n_tables: int = SEMANTIC_LSH_TABLES,
+    bucket_size: int = SEMANTIC_LSH_BUCKET,
+    n_bits: int | None = None,
+    seed: int = 0,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Versão aproximada de ``cosine_neighbors`` por LSH de hiperplanos aleatórios.
+
+    Em cada uma das ``n_tables`` tabelas, o sinal da projeção em ``n_bits``
+    hiperplanos aleatórios define o balde do vetor (vetores com ângulo
+    pequeno tendem a cair no mesmo balde). Dentro do balde, ordenado por mais
+    uma projeção, os vetores são comparados de forma exata em blocos de até
+    ``bucket_size``. Os candidatos de todas as tabelas são unidos e ficam os
+    ``k`` mais similares de cada vetor. Sem ``n_bits``, usa baldes com cerca
+    de ``bucket_size`` vetores em média. O custo é linear no número de vetores.
+
+    Returns:
+        Mesmo formato de ``cosine_neighbors``.
+    """
+    vectors = _unit_vectors(embeddings)
+    n = len(vectors)
+    if n < 2 or k <= 0:
+        return _merge_neighbors([], k)
+    dim = vectors.shape[1]
+    if n_bits is None:
+        n_bits = max(1, int(np.ceil(np.log2(max(2, n / bucket_size)))))
+    rng = np.random.default_rng(seed)
+    weights = np.left_shift(1, np.arange(n_bits, dtype=np.int64))
+    parts = []
+    for _ in range(n_tables):
+        projections = vectors @ rng.standard_normal((dim, n_bits + 1)).astype(vectors.dtype)
+        codes = (projections[:, :n_bits] > 0) @ weights
+        order = np.lexsort((projections[:, n_bits], codes))
+        sorted_codes = codes[order]
+        new_bucket = np.r_[True, sorted_codes[1:] != sorted_codes[:-1]]
+        bucket_start = np.flatnonzero(new_bucket)[np.cumsum(new_bucket) - 1]
+        # Baldes grandes são comparados em blocos consecutivos de até bucket_size
+        new_block = new_bucket | ((np.arange(n) - bucket_start) % bucket_size == 0)
+        bounds = np.r_[np.flatnonzero(new_block), n]
+        for start, stop in pairwise(bounds):
+            if stop - start < 2:
+                continue
+            members = order[start:stop]
+            sims = vectors[members] @ vectors[members].T
+            np.fill_diagonal(sims, -np.inf)
+            parts.append(_block_top_k(sims, members, members, threshold, k))
+    return _merge_neighbors(parts, k)
+
+
+def neighbor_pairs(rows: np.ndarray, cols: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Pares (i, j) distintos, com i < j, de uma lista de vizinhos dirigidos."""
+    low, high = np.minimum(rows, cols), np.maximum(rows, cols)
+    n = int(high.max()) + 1 if len(high) else 1
+    keys = np.unique(low * n + high)
+    return keys // n, keys % n
+
+
+def _ngram_entries(
+    terms: Sequence[str], ngram_size: int, chunk: int = 100_000
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Retorna pares (termo, n-grama) distintos como arrays de códigos inteiros.
+
+    Os termos são percorridos em lotes de ``chunk``, com os n-gramas
+    codificados na ordem de primeira aparição; só o vocabulário de n-gramas
+    fica em memória como texto.
+    """
+    vocab: dict[str, int] = {}
+    term_parts, gram_parts = [], []
+    for start in range(0, len(terms), chunk):
+        grams_per_term = []
+        for term in terms[start : start + chunk]:
+            padded = f" {term} "
+            grams_per_term.append(
+                {padded[k : k + ngram_size] for k in range(max(1, len(padded) - ngram_size + 1))}
+            )
+        counts = np.fromiter(
+            (len(g) for g in grams_per_term), dtype=np.int64, count=len(grams_per_term)
+        )
+        term_parts.append(np.repeat(np.arange(start, start + len(counts), dtype=np.int64), counts))
+        gram_parts.append(
+            np.fromiter(
+                (vocab.setdefault(g, len(vocab)) for grams in grams_per_term for g in grams),
+                dtype=np.int64,
+                count=int(counts.sum()),
+            )
+        )
+    if not term_parts:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+    return np.concatenate(term_parts), np.concatenate(gram_parts)
+
+
+def _posting_lists(
+    term_idx: np.ndarray, gram_idx: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Listas invertidas com dois ou mais termos, contíguas num único vetor.
+
+    Returns:
+        ``(termos, inícios, tamanhos)``: os termos de cada lista ficam em
+        ``termos[início : início + tamanho]``, com as listas em ordem de tamanho.
+    """
+    order = np.lexsort((term_idx, gram_idx))
+    terms_sorted, grams_sorted = term_idx[order], gram_idx[order]
+    starts = np.flatnonzero(np.r_[True, grams_sorted[1:] != grams_sorted[:-1]])[: len(order)]
+    sizes = np.diff(np.r_[starts, len(order)])
+    multi = np.flatnonzero(sizes > 1)
+    multi = multi[np.argsort(sizes[multi], kind="stable")]
+    sizes = sizes[multi]
+    new_starts = np.r_[0, np.cumsum(sizes)[:-1]].astype(np.int64)
+    # Posição de cada termo das listas mantidas no vetor ordenado por n-grama
+    entries = np.repeat(starts[multi] - new_starts, sizes) + np.arange(sizes.sum())
+    return terms_sorted[entries], new_starts, sizes
+
+
+def _posting_limit(sizes: np.ndarray, budget: int) -> int:
+    """Maior tamanho de lista tal que todas as listas até ele geram no máximo ``budget`` pares."""
+    pairs = np.cumsum(sizes * (sizes - 1) // 2)
+    fits = int(np.searchsorted(pairs, budget, side="right"))
+    if fits == len(sizes):
+        return int(sizes[-1]) if len(sizes) else 0
+    # Listas do mesmo tamanho entram todas ou nenhuma
+    return int(sizes[fits]) - 1
+
+
+def _posting_pairs(
+    terms: np.ndarray, starts: np.ndarray, sizes: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Todos os pares de termos de cada lista invertida (dadas por início e tamanho)."""
+    if not len(sizes):
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+    base = starts[0]
+    terms = terms[base : starts[-1] + sizes[-1]]
+    position = np.arange(len(terms)) - np.repeat(starts - base, sizes)
+    size_of = np.repeat(sizes, sizes)
+
+    rows_parts, cols_parts = [], []
+    active = np.arange(len(terms))
+    offset = 1
+    while active.size:
+        active = active[position[active] + offset < size_of[active]]
+        rows_parts.append(terms[active])
+        cols_parts.append(terms[active + offset])
+        offset += 1
+    return np.concatenate(rows_parts), np.concatenate(cols_parts)
+
+
+def _posting_batches(
+    terms: np.ndarray, starts: np.ndarray, sizes: np.ndarray, batch_pairs: int
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Pares das listas invertidas, em lotes de listas com cerca de ``batch_pairs`` pares."""
+    pairs = np.cumsum(sizes * (sizes - 1) // 2)
+    first = 0
+    while first < len(sizes):
+        done = pairs[first - 1] if first else 0
+        last = max(int(np.searchsorted(pairs, done + batch_pairs, side="right")), first + 1)
+        yield _posting_pairs(terms, starts[first:last], sizes[first:last])
+        first = last
+
+
+def _sorted_neighborhood_pairs(
+    terms: Sequence[str], window: int
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """Pares vizinhos na ordem lexicográfica dos termos e dos termos invertidos."""
+    if window < 1 or len(terms) < 2:
+        # Janela nula ou menos de dois termos: nenhum par
+        return
+    for keys in (list(terms), [t[::-1] for t in terms]):
+        order = np.argsort(np.array(keys, dtype=object), kind="stable").astype(np.int64)
+        for offset in range(1, min(window, len(order) - 1) + 1):
+            yield order[:-offset], order[offset:]
+
+
+def iter_candidate_pairs(
+    terms: Sequence[str],
+    threshold: float,
+    *,
+    ngram_size: int = FUZZY_NGRAM_SIZE,
+    prefix_ngrams: int = FUZZY_PREFIX_NGRAMS,
+    max_posting: int = FUZZY_MAX_POSTING,
+    window: int = FUZZY_SORTED_WINDOW,
+    max_candidates: int = FUZZY_MAX_CANDIDATES,
+    batch_pairs: int = 1 << 20,
+) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+    """
+    Gera pares candidatos (i < j) em lotes, sem comparar todos contra todos.
+
+    Combina três filtros:
+    - índice invertido com os ``prefix_ngrams`` n-gramas mais raros de cada
+      termo, ignorando n-gramas presentes em mais de ``max_posting`` termos;
+      as listas invertidas entram das menores para as maiores até somar
+      ``max_candidates`` pares por termo, em média (o número de pares cresce
+      com o quadrado do tamanho das listas, e o orçamento o mantém linear);
+    - vizinhança ordenada (janela ``window``) sobre os termos e os termos
+      invertidos, que recupera variações em termos curtos;
+    - limite de comprimento exato para ``fuzz.ratio``: pares com
+      ``200 * min(len) / (len_a + len_b) < threshold`` nunca atingem o limiar.
+
+    Cada lote tem cerca de ``batch_pairs`` pares, sem repetidos dentro dele;
+    um par pode reaparecer em lotes diferentes.
+    """
+    n = len(terms)
+    term_idx, gram_idx = _ngram_entries(terms, ngram_size)
+
+    # Descarta n-gramas muito frequentes e mantém apenas os mais raros de cada termo
+    doc_freq = np.bincount(gram_idx)
+    keep = doc_freq[gram_idx] <= max_posting
+    term_idx, gram_idx = term_idx[keep], gram_idx[keep]
+    order = np.lexsort((gram_idx, doc_freq[gram_idx], term_idx))
+    term_idx, gram_idx = term_idx[order], gram_idx[order]
+    starts = np.flatnonzero(np.r_[True, term_idx[1:] != term_idx[:-1]])[: len(term_idx)]
+    sizes = np.diff(np.r_[starts, len(term_idx)])
+    rank = np.arange(len(term_idx)) - np.repeat(starts, sizes)
+    in_prefix = rank < prefix_ngrams
+    posting_terms, posting_starts, posting_sizes = _posting_lists(
+        term_idx[in_prefix], gram_idx[in_prefix]
+    )
+    limit = _posting_limit(posting_sizes, max_candidates * n)
+    if len(posting_sizes) and limit < posting_sizes[-1]:
+        logger.debug(f"Blocagem fuzzy: listas invertidas limitadas a {limit} termos")
+    within = posting_sizes <= limit
+    posting_starts, posting_sizes = posting_starts[within], posting_sizes[within]
+
+    lengths = np.fromiter((len(t) for t in terms), dtype=np.int64, count=n)
+
+    def finish(parts: list) -> tuple[np.ndarray, np.ndarray]:
+        rows = np.concatenate([r for r, _ in parts])
+        cols = np.concatenate([c for _, c in parts])
+        low, high = np.minimum(rows, cols), np.maximum(rows, cols)
+        keys = np.sort(low[low != high] * n + high[low != high])
+        keys = keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+        rows, cols = keys // n, keys % n
+        if threshold > 0:
+            len_a, len_b = lengths[rows], lengths[cols]
+            total = np.maximum(len_a + len_b, 1)
+            feasible = 200 * np.minimum(len_a, len_b) >= threshold * total
+            rows, cols = rows[feasible], cols[feasible]
+        return rows, cols
+
+    parts, buffered = [], 0
+    batches = chain(
+        _posting_batches(posting_terms, posting_starts, posting_sizes, batch_pairs),
+        _sorted_neighborhood_pairs(terms, window),
+    )
+    for rows, cols in batches:
+        parts.append((rows, cols))
+        buffered += len(rows)
+        if buffered >= batch_pairs:
+            yield finish(parts)
+            parts, buffered = [], 0
+    if parts:
+        yield finish(parts)
+
+
+def candidate_pairs(
+    terms: Sequence[str], threshold: float, **blocking_options
+) -> tuple[np.ndarray, np.ndarray]:
+    """Todos os pares de ``iter_candidate_pairs`` juntos, sem repetidos."""
+    n = len(terms)
+    keys = [
+        rows * n + cols for rows, cols in iter_candidate_pairs(terms, threshold, **blocking_options)
+    ]
+    if not keys:
+        empty = np.empty(0, dtype=np.int64)
+        return empty, empty.copy()
+    keys = np.unique(np.concatenate(keys))
+    return keys // n, keys % n
+
+
+def blocked_similarity_edges(
+    terms: Sequence[str],
+    threshold: float,
+    *,
+    scorer: Callable = fuzz.ratio,
+    workers: int = FUZZY_WORKERS,
+    memory_mb: int = FUZZY_BLOCK_MEMORY_MB,
+    stats: dict | None = None,
+    **blocking_options,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Versão de ``similarity_edges`` que pontua apenas os pares candidatos.
+
+    Os candidatos são gerados e pontuados em lotes (``iter_candidate_pairs``,
+    que recebe ``blocking_options``) de até ``memory_mb``; só os pares
+    similares ficam em memória. Se ``stats`` for um dicionário, ele recebe a
+    contagem de pares possíveis, avaliados (um par repetido em lotes
+    diferentes conta de novo), podados e similares.
+    """
+    n = len(terms)
+    total_pairs = n * (n - 1) // 2
+    step = max(1, max(1, memory_mb) * 1024 * 1024 // 64)
+    blocking_options.setdefault("batch_pairs", step)
+    terms_array = np.array(terms, dtype=object)
+    rows_parts, cols_parts = [], []
+    evaluated = 0
+    for rows, cols in iter_candidate_pairs(terms, threshold, **blocking_options):
+        evaluated += len(rows)
+        for start in range(0, len(rows), step):
+            r, c = rows[start : start + step], cols[start : start + step]
+            scores = process.cpdist(
+                terms_array[r],
+                terms_array[c],
+                scorer=scorer,
+                score_cutoff=threshold,
+                dtype=np.uint8,
+                workers=workers,
+            )
+            hit = scores > 0 if threshold > 0 else np.ones(len(r), dtype=bool)
+            rows_parts.append(r[hit])
+            cols_parts.append(c[hit])
+
+    if rows_parts:
+        keys = np.unique(np.concatenate(rows_parts) * n + np.concatenate(cols_parts))
+        edges_rows, edges_cols = keys // n, keys % n
+    else:
+        edges_rows = edges_cols = np.empty(0, dtype=np.int64)
+    summary = {
+        "termos": n,
+        "pares_possiveis": total_pairs,
+        "pares_avaliados": evaluated,
+        "pares_podados": max(total_pairs - evaluated, 0),
+        "pares_similares": len(edges_rows),
+    }
+    if stats is not None:
+        stats.update(summary)
+    pruned_pct = 100 * summary["pares_podados"] / total_pairs if total_pairs else 0.0
+    logger.info(
+        f"Blocagem fuzzy: {summary['pares_avaliados']} pares avaliados, "
+        f"{summary['pares_podados']} podados ({pruned_pct:.2f}%)"
+    )
+    return edges_rows, edges_cols
+
+
+def greedy_clusters(n: int, rows: np.ndarray, cols: np.ndarray) -> list[list[int]]:
+    """
+    Agrupa por semente, reproduzindo o algoritmo original de ``fuzzy_cluster_terms``.
+
+    Cada índice ainda livre (em ordem) vira semente e absorve todos os vizinhos
+    posteriores ainda livres. O resultado não é transitivo.
+    """
+    order = np.lexsort((cols, rows))
+    rows, cols = rows[order], cols[order]
+    starts = np.searchsorted(rows, np.arange(n + 1))
+    used = np.zeros(n, dtype=bool)
+    clusters = []
+    for i in range(n):
+        if used[i]:
+            continue
+        used[i] = True
+        neighbors = cols[starts[i] : starts[i + 1]]
+        if len(neighbors):
+            neighbors = neighbors[~used[neighbors]]
+            used[neighbors] = True
+        clusters.append([i, *neighbors.tolist()])
+    return clusters
+
+
+def greedy_cosine_clusters(
+    embeddings, threshold: float, memory_mb: int = FUZZY_BLOCK_MEMORY_MB
+) -> list[list[int]]:
+    """
+    Mesmo resultado de ``greedy_clusters`` sobre ``cosine_edges``, sem gerar os pares.
+
+    As faixas de linhas são processadas em ordem e a atribuição gulosa é
+    feita a cada faixa: linhas já absorvidas por uma semente anterior não
+    viram semente e ficam fora do produto, assim como as colunas já usadas.
+    Em dados com grupos grandes, o custo cai de n² para perto de
+    sementes x n, e a memória não depende da quantidade de pares similares.
+    """
+    vectors = _unit_vectors(embeddings)
+    n = len(vectors)
+    used = np.zeros(n, dtype=bool)
+    clusters = []
+    step = _block_rows(n, memory_mb, vectors.dtype.itemsize)
+    for start in range(0, n, step):
+        stop = min(start + step, n)
+        seeds = np.flatnonzero(~used[start:stop]) + start
+        if len(seeds) == 0:
+            continue
+        free = np.flatnonzero(~used[start:]) + start
+        similar = vectors[seeds] @ vectors[free].T >= threshold
+        for k, i in enumerate(seeds):
+            if used[i]:
+                continue
+            used[i] = True
+            neighbors = free[similar[k]]
+            neighbors = neighbors[(neighbors > i) & ~used[neighbors]]
+            used[neighbors] = True
+            clusters.append([int(i), *neighbors.tolist()])
+    return clusters
+
+
+def connected_components(n: int, rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """
+    Rotula as componentes conexas do grafo de pares (union-find vetorizado).
+
+    Alterna "hooking" das raízes pelo menor rótulo e compressão de caminhos
+    até estabilizar. O rótulo de cada componente é o menor índice dela.
+    """
+    labels = np.arange(n, dtype=np.int64)
+    if len(rows) == 0:
+        return labels
+    while True:
+        lr, lc = labels[rows], labels[cols]
+        low = np.minimum(lr, lc)
+        hooked = labels.copy()
+        np.minimum.at(hooked, lr, low)
+        np.minimum.at(hooked, lc, low)
+        while True:
+            jumped = hooked[hooked]
+            if np.array_equal(jumped, hooked):
+                break
+            hooked = jumped
+        if np.array_equal(hooked, labels):
+            return labels
+        labels = hooked
+
+
+def component_clusters(n: int, rows: np.ndarray, cols: np.ndarray) -> list[list[int]]:
+    """Agrupa por componentes conexas, ordenando grupos e membros pelo índice."""
+    if n == 0:
+        return []
+    labels = connected_components(n, rows, cols)
+    order = np.argsort(labels, kind="stable")
+    bounds = np.flatnonzero(np.diff(labels[order])) + 1
+    return [group.tolist() for group in np.split(order, bounds)]
+
+
+def cluster_indices(
+    n: int, rows: np.ndarray, cols: np.ndarray, method: str = "greedy"
+) -> list[list[int]]:
+    """Converte pares similares em grupos de índices segundo o método escolhido."""
+    if method == "greedy":
+        return greedy_clusters(n, rows, cols)
+    if method == "components":
+        return component_clusters(n, rows, cols)
+    raise ValueError(f"Método de agrupamento inválido: {method!r} (use {CLUSTER_METHODS})")
@@ -0,0 +1,177 @@
+# analysis/content.py
+"""
+Tipo de coluna inferido pelos valores, complementando o tipo pelo cabeçalho.
+
+Uma amostra limitada de cada coluna de texto passa por verificações
+vetorizadas (expressões regulares do pandas e dígitos verificadores em
+numpy): CPF, CNPJ, CEP, e-mail, telefone e UUID, além dos números, moedas,
+percentuais e datas de ``core.coercion``. O tipo encontrado decide o ramo de
+análise da coluna: códigos são agrupados sem similaridade aproximada (dois
+CPFs parecidos não são variações do mesmo valor) e números e datas em texto
+vão para os ramos numérico e de datas.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from config.settings import VALUE_TYPE_MIN_MATCH, VALUE_TYPE_SAMPLE_SIZE
+from core.coercion import detect_sample_formats
+from core.dtypes import is_text_column
+
+# Tipos de códigos: agrupados por valor exato, sem similaridade aproximada
+CODE_TYPES = frozenset({"cpf", "cnpj", "cep", "email", "telefone", "uuid"})
+# Tipos de ``core.coercion``: convertidos para os ramos numérico ou de datas
+FORMAT_TYPES = frozenset({"numero", "percentual", "moeda", "data"})
+
+_CPF = r"\d{3}\.?\d{3}\.?\d{3}-?\d{2}"
+_CNPJ = r"\d{2}\.?\d{3}\.?\d{3}/?\d{4}-?\d{2}"
+_CEP = r"\d{5}-\d{3}|\d{2}\.\d{3}-\d{3}"
+_EMAIL = r"[^@\s]+@[^@\s]+\.[A-Za-z]{2,}"
+# DDD entre parênteses ou seguido de separador; nono dígito opcional
+_PHONE = r"(?:\+?55\s?)?(?:\(\d{2}\)\s?|\d{2}[\s-])9?\d{4}[\s-]?\d{4}"
+_UUID = r"[0-9a-fA-F]{8}-(?:[0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}"
+
+_CPF_WEIGHTS = (np.arange(10, 1, -1), np.arange(11, 1, -1))
+_CNPJ_WEIGHTS = (
+    np.array([5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]),
+    np.array([6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]),
+)
+
+
+def _digit_matrix(texts: pd.Series, length: int) -> np.ndarray:
+    """Dígitos de textos com ``length`` dígitos, uma linha por texto (uint8)."""
+    digits = "".join(texts.str.replace(r"\D", "", regex=True))
+    return np.frombuffer(digits.encode("ascii"), dtype=np.uint8).reshape(-1, length) - ord("0")
+
+
+def _check_digits_valid(digits: np.ndarray, weights: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """Confere os dois dígitos verificadores (módulo 11) de cada linha."""
+    valid = np.ones(len(digits), dtype=bool)
+    for weight in weights:
+        n = len(weight)
+        remainder = (digits[:, :n] @ weight) % 11
+        expected = np.where(remainder < 2, 0, 11 - remainder)
+        valid &= digits[:, n] == expected
+    # Sequências repetidas (000.000.000-00) passam no cálculo, mas são inválidas
+    return valid & (digits != digits[:, :1]).any(axis=1)
+
+
+def _document_mask(
+    texts: pd.Series, pattern: str, length: int, weights: tuple[np.ndarray, np.ndarray]
+) -> np.ndarray:
+    shaped = texts.str.fullmatch(pattern).to_numpy(dtype=bool)
+    valid = np.zeros(len(texts), dtype=bool)
+    if shaped.any():
+        valid[shaped] = _check_digits_valid(_digit_matrix(texts[shaped], length), weights)
+    return valid
+
+
+def _cpf_mask(texts: pd.Series) -> np.ndarray:
+    return _document_mask(texts, _CPF, 11, _CPF_WEIGHTS)
+
+
+def _cnpj_mask(texts: pd.Series) -> np.ndarray:
+    return _document_mask(texts, _CNPJ, 14, _CNPJ_WEIGHTS)
+
+
+def _pattern_mask(pattern: str):
+    return lambda texts: texts.str.fullmatch(pattern).to_numpy(dtype=bool)
+
+
+# Códigos com letras
+_TEXT_CHECKS = (
+    ("uuid", _pattern_mask(_UUID)),
+    ("email", _pattern_mask(_EMAIL)),
+)
+# Códigos numéricos, em ordem: CNPJ e CPF (com dígito verificador) antes de telefone
+_NUMERIC_CHECKS = (
+    ("cnpj", _cnpj_mask),
+    ("cpf", _cpf_mask),
+    ("cep", _pattern_mask(_CEP)),
+    ("telefone", _pattern_mask(_PHONE)),
+)
+# Só dígitos, pontuação, espaços e os símbolos de moeda, percentual e data ISO
+_NUMERIC_SHAPE = r"[\d\s().,:/+%$RT-]+"
+
+
+def _sample_frame(
+    df: pd.DataFrame, positions: list[int], size: int
+) -> tuple[pd.Series, np.ndarray]:
+    """
+    Textos amostrados das colunas ``positions``, numa única Series.
+
+    As mesmas ``size`` linhas, espalhadas pela tabela, são lidas de todas as
+    colunas de uma vez; ausentes e textos vazios ficam de fora. Retorna os
+    textos e, para cada um, o índice da coluna em ``positions``.
+    """
+    rows = np.unique(np.linspace(0, len(df) - 1, min(len(df), size)).astype(np.intp))
+    values = df.iloc[rows, positions].to_numpy(dtype=object).T.ravel()
+    codes = np.repeat(np.arange(len(positions)), len(rows))
+    filled = ~pd.isna(values)
+    texts = pd.Series(values[filled], dtype=object).astype(str).str.strip()
+    keep = (texts != "").to_numpy()
+    return texts[keep].reset_index(drop=True), codes[filled][keep]
+
+
+def _share(mask: np.ndarray, codes: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Fração da amostra de cada coluna em que ``mask`` vale."""
+    return np.bincount(codes, weights=mask, minlength=len(counts)) / np.maximum(counts, 1)
+
+
+def detect_value_types(
+    df: pd.DataFrame, columns=None, sample_size: int = VALUE_TYPE_SAMPLE_SIZE
+) -> dict:
+    """
+    Tipo pelos valores de cada coluna de texto; colunas sem tipo ficam de fora.
+
+    Cada verificação roda uma vez sobre as amostras de todas as colunas
+    juntas (até ``sample_size`` linhas por coluna). Um código é aceito se ao
+    menos ``VALUE_TYPE_MIN_MATCH`` da amostra o segue (CPF e CNPJ com dígitos
+    verificadores válidos); números, moedas, percentuais e datas seguem
+    ``core.coercion.detect_sample_formats`` (amostra inteira no formato).
+    """
+    wanted = None if columns is None else set(columns)
+    positions = [
+        i
+        for i, col in enumerate(df.columns)
+        if (wanted is None or col in wanted) and is_text_column(df.iloc[:, i])
+    ]
+    if df.empty or not positions:
+        return {}
+    texts, codes = _sample_frame(df, positions, sample_size)
+    counts = np.bincount(codes, minlength=len(positions))
+
+    numeric = texts.str.fullmatch(_NUMERIC_SHAPE).to_numpy(dtype=bool)
+    numeric_share = _share(numeric, codes, counts)
+    kinds: list[str | None] = [None] * len(positions)
+    for checks, eligible in (
+        (_NUMERIC_CHECKS, numeric_share >= VALUE_TYPE_MIN_MATCH),
+        (_TEXT_CHECKS, numeric_share < VALUE_TYPE_MIN_MATCH),
+    ):
+        for kind, check in checks:
+            pending = eligible & np.array([k is None for k in kinds]) & (counts > 0)
+            if not pending.any():
+                break
+            subset = np.isin(codes, np.flatnonzero(pending))
+            mask = np.zeros(len(texts), dtype=bool)
+            mask[subset] = check(texts[subset])
+            for i in np.flatnonzero(
+                pending & (_share(mask, codes, counts) >= VALUE_TYPE_MIN_MATCH)
+            ):
+                kinds[i] = kind
+
+    # Números e datas em texto: só colunas com a amostra inteira no formato numérico
+    eligible = (numeric_share == 1) & (counts > 0) & np.array([k is None for k in kinds])
+    rows = eligible[codes]
+    formats = detect_sample_formats(texts[rows], codes[rows], len(positions))
+    for i in np.flatnonzero(eligible):
+        if formats[i] is not None:
+            kinds[i] = formats[i].kind
+    return {df.columns[p]: kind for p, kind in zip(positions, kinds, strict=True) if kind}
+
+
+def infer_value_type(series: pd.Series, sample_size: int = VALUE_TYPE_SAMPLE_SIZE) -> str | None:
+    """Tipo de uma coluna de texto pelos valores (ver ``detect_value_types``), ou None."""
+    return detect_value_types(series.to_frame(name=0), sample_size=sample_size).get(0)
@@ -0,0 +1,98 @@
+# analysis/embeddings.py
+"""
+Modelos de embeddings compartilhados, carregados sob demanda.
+
+``get_model`` carrega cada modelo (nome + dispositivo) uma única vez por
+processo, na primeira consulta; chamadas simultâneas esperam o mesmo
+carregamento em vez de repeti-lo. ``sentence_transformers`` (e o torch) só
+são importados nesse momento, então importar os módulos de análise não
+custa nada. ``warm_up`` adianta o carregamento numa thread em segundo plano,
+por exemplo enquanto a interface abre.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+from config.settings import EMBEDDING_DEVICE, EMBEDDING_MODEL, EMBEDDING_THREADS
+from core.logging_config import get_logger
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = get_logger("embeddings")
+
+# (modelo, dispositivo) -> modelo carregado
+_MODELS: dict[tuple[str, str | None], SentenceTransformer] = {}
+# (modelo, dispositivo) -> trava do carregamento; _LOCK protege os dois dicionários
+_LOAD_LOCKS: dict[tuple[str, str | None], threading.Lock] = {}
+_LOCK = threading.Lock()
+
+
+def _load_model(name: str, device: str | None) -> SentenceTransformer:
+    # Importações pesadas (torch) só quando um modelo é de fato carregado
+    from sentence_transformers import SentenceTransformer  # noqa: PLC0415
+
+    if EMBEDDING_THREADS > 0:
+        import torch  # noqa: PLC0415
+
+        torch.set_num_threads(EMBEDDING_THREADS)
+    logger.info(f"Carregando modelo de embeddings '{name}' (dispositivo: {device or 'auto'})")
+    return SentenceTransformer(name, device=device)
+
+
+def get_model(
+    name: str = EMBEDDING_MODEL, device: str | None = EMBEDDING_DEVICE
+) -> SentenceTransformer:
+    """
+    Modelo ``name`` no dispositivo ``device`` (None = escolha automática).
+
+    O primeiro chamador carrega o modelo; os demais, inclusive em outras
+    threads, recebem a mesma instância.
+    """
+    key = (name, device)
+    with _LOCK:
+        model = _MODELS.get(key)
+        if model is not None:
+            return model
+        load_lock = _LOAD_LOCKS.setdefault(key, threading.Lock())
+    with load_lock:
+        model = _MODELS.get(key)
+        if model is None:
+            model = _load_model(name, device)
+            with _LOCK:
+                _MODELS[key] = model
+    return model
+
+
+def is_loaded(name: str = EMBEDDING_MODEL, device: str | None = EMBEDDING_DEVICE) -> bool:
+    """Indica se o modelo já está em memória (sem carregá-lo)."""
+    with _LOCK:
+        return (name, device) in _MODELS
+
+
+def warm_up(name: str = EMBEDDING_MODEL, device: str | None = EMBEDDING_DEVICE) -> threading.Thread:
+    """
+    Carrega o modelo numa thread daemon e retorna a thread já iniciada.
+
+    Falhas são registradas no log; a próxima chamada de ``get_model`` tenta
+    carregar de novo e propaga o erro.
+    """
+
+    def run() -> None:
+        try:
+            get_model(name, device)
+        except Exception as e:
+            logger.warning(f"Pré-carregamento do modelo '{name}' falhou: {e}")
+
+    thread = threading.Thread(target=run, name=f"warm-up {name}", daemon=True)
+    thread.start()
+    return thread
+
+
+def clear_models() -> None:
+    """Descarta os modelos carregados (a próxima consulta carrega de novo)."""
+    with _LOCK:
+        _MODELS.clear()
+        _LOAD_LOCKS.clear()
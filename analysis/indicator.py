@@ -3,12 +3,26 @@
 
 import re
 
+import numpy as np
 import pandas as pd
 import unidecode
-from rapidfuzz import fuzz
 
+from analysis.clustering import blocked_similarity_edges, cluster_indices, similarity_edges
+from analysis.content import CODE_TYPES, detect_value_types
 from analysis.detector import detect_column_types
-from core.id_generator import detect_native_id_column
+from analysis.parallel import run_columns_parallel
+from analysis.tagging import dictionary_matches, synonym_automaton
+from config.settings import (
+    FUZZY_BLOCKING_MIN_TERMS,
+    FUZZY_THRESHOLD,
+    FUZZY_WORKERS,
+    INDICATOR_WORKERS,
+    MAX_TERMS_FUZZY,
+)
+from core.coercion import ColumnFormat, apply_format
+from core.dates import parse_dates
+from core.id_generator import SYNTHETIC_ID_COLUMN, detect_native_id_column, synthetic_ids
+from core.profile import column_profile, distinct_estimate, is_unique_column
 
 # Padrões expandidos para detecção de colunas de ID
 ID_COLUMN_KEYWORDS = [
@@ -56,9 +70,10 @@ def is_id_column(col, df) -> bool:
             return True
 
     # Verifica por unicidade
-    if len(df) > 0:
-        uniqueness = df[col].nunique() / len(df)
-        if uniqueness >= 0.95 and df[col].is_unique:
+    if len(df) > 0 and is_unique_column(df, col):
+        # Coluna única: os distintos são as linhas, menos um se houver ausentes
+        distinct = len(df) - int(df[col].hasnans)
+        if distinct / len(df) >= 0.95:
             return True
 
     return False
@@ -70,7 +85,11 @@ def is_numerical(col, df):
 
 def is_categorical(col, df):
     if is_numerical(col, df):
-        return df[col].nunique() < min(30, len(df) // 5)
+        limit = min(30, len(df) // 5)
+        # Distintos já no prefixo descartam colunas de muitos valores sem a contagem exata
+        if distinct_estimate(df, col, sketch=False).lower >= limit:
+            return False
+        return column_profile(df, col).distinct < limit
     return False
 
 
@@ -79,6 +98,11 @@ def is_date_candidate(col):
     return any(k in unidecode.unidecode(str(col)).lower() for k in keywords)
 
 
+def is_date_column(col, df):
+    """Coluna com nome de data ou já convertida para datas no carregamento."""
+    return is_date_candidate(col) or pd.api.types.is_datetime64_any_dtype(df[col])
+
+
 def normalize_generic(val):
     s = str(val).lower().strip()
     s = unidecode.unidecode(s)
@@ -86,77 +110,241 @@ def normalize_generic(val):
     return s
 
 
-def safe_to_datetime(series):
-    try:
-        sample = series.dropna().astype(str).head(50)
-        if sample.str.match(r"\d{4}-\d{2}-\d{2}").all():
-            return pd.to_datetime(series, format="%Y-%m-%d", errors="coerce")
-        else:
-            return pd.to_datetime(series, errors="coerce")
-    except (ValueError, TypeError):
-        return pd.to_datetime(series, errors="coerce")
+def safe_to_datetime(series, date_format=None):
+    """Converte a coluna em datas (ver ``core.dates.parse_dates``); inválidos viram NaT."""
+    return parse_dates(series, date_format)
+
+
+def fuzzy_cluster_terms(
+    terms,
+    threshold=90,
+    max_terms=MAX_TERMS_FUZZY,
+    *,
+    method="greedy",
+    workers=FUZZY_WORKERS,
+    blocking=None,
+    stats=None,
+):
+    """
+    Agrupa termos parecidos segundo ``fuzz.ratio``.
 
+    As similaridades são calculadas em blocos com ``rapidfuzz.process.cdist``
+    (``workers`` threads). Com ``method="greedy"`` o resultado é idêntico ao
+    algoritmo original (cada termo livre vira semente e absorve os termos
+    posteriores similares); ``method="components"`` usa componentes conexas,
+    agrupando também variações encadeadas.
 
-def fuzzy_cluster_terms(terms, threshold=90, max_terms=500):
+    Com ``blocking=True`` (ou ``None`` e mais de ``FUZZY_BLOCKING_MIN_TERMS``
+    termos) apenas os pares candidatos do índice de blocagem são pontuados;
+    a contagem de pares podados é registrada em ``stats`` quando informado.
+    """
     if len(terms) > max_terms:
         return [[term] for term in terms]
-    clusters, used = [], set()
-    for term in terms:
-        if term in used:
-            continue
-        cluster = [term]
-        used.add(term)
-        for candidate in terms:
-            if candidate in used:
-                continue
-            if fuzz.ratio(term, candidate) >= threshold:
-                cluster.append(candidate)
-                used.add(candidate)
-        clusters.append(cluster)
-    return clusters
-
-
-def _process_categorical_column(df: pd.DataFrame, col: str, id_col: str) -> pd.DataFrame | None:
-    """Processa coluna categórica e retorna tabela de frequência clusterizada."""
+    # Duplicatas eram ignoradas pelo algoritmo original (já marcadas como usadas)
+    unique_terms = list(dict.fromkeys(terms))
+    if blocking is None:
+        blocking = len(unique_terms) > FUZZY_BLOCKING_MIN_TERMS
+    if blocking:
+        rows, cols = blocked_similarity_edges(unique_terms, threshold, workers=workers, stats=stats)
+    else:
+        rows, cols = similarity_edges(unique_terms, threshold, workers=workers)
+    groups = cluster_indices(len(unique_terms), rows, cols, method=method)
+    return [[unique_terms[i] for i in group] for group in groups]
+
+
+def _sorted_unique(keys: np.ndarray) -> np.ndarray:
+    """Equivalente a ``np.unique`` por ordenação (mais rápido para int64 grandes)."""
+    keys = np.sort(keys)
+    return keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys
+
+
+def _ids_in_text_order(ids) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    IDs distintos pela representação textual, e a ordem alfabética desses textos.
+
+    Returns:
+        ``(key, values, order)``: ``key`` leva cada ID ao seu texto distinto,
+        ``values`` tem um ID por texto e ``order`` ordena ``values`` pelo texto.
+        IDs inteiros não negativos (como os sintéticos) são ordenados sem
+        gerar texto, que só é montado para a tabela final.
+    """
+    values = np.asarray(ids)
+    if values.dtype.kind in "iu" and len(values) and values.min() >= 0 and values.max() < 10**18:
+        values = values.astype(np.int64)
+        # Ordem alfabética dos números: completa com zeros à direita até o maior
+        # número de dígitos e desempata pelo comprimento ("1" < "10" < "2")
+        digits = np.searchsorted(10 ** np.arange(1, 19, dtype=np.int64), values, side="right") + 1
+        padded = values * 10 ** (digits.max() - digits)
+        return np.arange(len(values)), values, np.lexsort((digits, padded))
+    key, strings = pd.factorize(pd.Series([str(v) for v in ids]))
+    strings = np.asarray(strings, dtype=object)
+    return key, strings, np.argsort(strings, kind="stable")
+
+
+def categorical_values(series: pd.Series) -> pd.Series:
+    """
+    Valores de uma coluna categórica prontos para ``pd.factorize``.
+
+    Em colunas ``object`` com tipos misturados cada valor vira o seu texto:
+    ``factorize`` juntaria True, 1 e 1.0, que são grupos diferentes pelo texto.
+    """
+    if series.dtype == object and pd.api.types.infer_dtype(series).startswith("mixed"):
+        return series.astype(str)
+    return series
+
+
+def _process_categorical_column(
+    df: pd.DataFrame, col: str, id_col: str, fuzzy: bool = True
+) -> pd.DataFrame | None:
+    """
+    Processa coluna categórica e retorna tabela de frequência clusterizada.
+
+    A coluna é fatorada uma única vez: a normalização roda apenas sobre os
+    valores distintos e os grupos de IDs são montados sobre códigos inteiros,
+    de modo que o custo em Python é proporcional à cardinalidade, não às linhas.
+    Sem ``fuzzy`` (códigos como CPF e e-mail) cada valor normalizado é um
+    grupo, sem comparação de similaridade. Com ``fuzzy``, valores que são
+    inteiros um sinônimo do dicionário ("Pharmacy", "Drugstore") são
+    padronizados pela chave dele antes do agrupamento aproximado.
+    """
     valores = df[[col, id_col]].dropna()
-    vc = valores[col].value_counts()
-    if len(vc) > 200:
-        top = vc.head(100).index
-        valores = valores[valores[col].isin(top)]
-
-    mapping = {}
-    for _, row in valores.iterrows():
-        orig = str(row[col]).strip()
-        norm = normalize_generic(orig)
-        rec = mapping.setdefault(norm, {"originais": set(), "ids": set()})
-        rec["originais"].add(orig)
-        rec["ids"].add(str(row[id_col]))
-
-    clusters = fuzzy_cluster_terms(list(mapping), threshold=88, max_terms=500)
+    valores[col] = categorical_values(valores[col])
+    # Contagem pelos códigos em ordem de aparição (desempate de value_counts,
+    # inclusive em colunas category, cujas categorias sem ocorrência são ignoradas)
+    value_codes, value_uniques = pd.factorize(valores[col])
+    counts = np.bincount(value_codes, minlength=len(value_uniques))
+    if len(counts) > 200:
+        top = np.argsort(-counts, kind="stable")[:100]
+        valores = valores[np.isin(value_codes, top)]
+    if valores.empty:
+        return None
+
+    # Mantém a representação textual do caminho original (iterrows promove os tipos)
+    dtypes = list(valores.dtypes)
+    if dtypes[0] != dtypes[1] and all(isinstance(t, np.dtype) and t.kind in "iuf" for t in dtypes):
+        valores = valores.astype(np.result_type(*dtypes))
+
+    # Valores distintos -> texto original -> termo normalizado
+    codes, uniques = pd.factorize(valores[col])
+    originais = [str(v).strip() for v in uniques]
+    termos = [normalize_generic(o) for o in originais]
+    if fuzzy:
+        automaton = synonym_automaton()
+        for i, orig in enumerate(originais):
+            tipo = automaton.standardize(orig)
+            if tipo is not None:
+                termos[i] = tipo.replace("_", " ")
+    norm_codes, norms = pd.factorize(pd.Series(termos))
+
+    # IDs distintos pela representação textual (como no conjunto de strings original)
+    id_codes, id_uniques = pd.factorize(valores[id_col])
+    id_key, id_values, order = _ids_in_text_order(id_uniques)
+    id_rank = np.empty(len(id_values), dtype=np.int64)
+    id_rank[order] = np.arange(len(id_values))
+
+    clusters = fuzzy_cluster_terms(
+        list(norms), threshold=FUZZY_THRESHOLD, max_terms=MAX_TERMS_FUZZY if fuzzy else 0
+    )
+    cluster_of_norm = np.empty(len(norms), dtype=np.int64)
+    norm_pos = {norm: i for i, norm in enumerate(norms)}
+    for k, cluster in enumerate(clusters):
+        cluster_of_norm[[norm_pos[norm] for norm in cluster]] = k
+    cluster_of_value = cluster_of_norm[norm_codes]
+
+    variantes = [set() for _ in clusters]
+    for orig, k in zip(originais, cluster_of_value, strict=True):
+        variantes[k].add(orig)
+
+    # Pares (cluster, id) distintos, ordenados pelo texto do id dentro do cluster
+    n_ids = len(id_values)
+    pairs = _sorted_unique(
+        cluster_of_value[codes] * n_ids + id_rank[id_key[id_codes]],
+    )
+    pair_cluster = pairs // n_ids
+    pair_ids = id_values[order][pairs % n_ids]
+    bounds = np.searchsorted(pair_cluster, np.arange(len(clusters) + 1))
+
     tabela = []
-    for cluster in clusters:
-        vars_, ids = set(), set()
-        for norm in cluster:
-            vars_.update(mapping[norm]["originais"])
-            ids.update(mapping[norm]["ids"])
+    for k, cluster in enumerate(clusters):
+        ids = pair_ids[bounds[k] : bounds[k + 1]]
         tabela.append(
             {
                 "termo_base": max(cluster, key=len).upper(),
-                "variantes": "; ".join(sorted(vars_)),
+                "variantes": "; ".join(sorted(variantes[k])),
                 "frequencia": len(ids),
-                "ids": ",".join(sorted(ids)),
+                "ids": ",".join(map(str, ids.tolist())),
             }
         )
     df_tab = pd.DataFrame(tabela).sort_values("frequencia", ascending=False)
     return df_tab if not df_tab.empty else None
 
 
-def generate_indicators(df, progress_callback=None):
+def _analyze_column(
+    df: pd.DataFrame, col, label_tipo: str, id_col: str, value_type: str | None = None
+) -> dict:
+    """
+    Analisa uma coluna pelo ramo adequado (data, numérico contínuo ou categórico).
+
+    ``value_type`` é o tipo inferido pelos valores (``detect_value_types``):
+    números e datas em texto seguem os ramos numérico e de datas, e códigos
+    são agrupados sem similaridade aproximada.
+    """
+    if value_type in ("numero", "percentual", "moeda"):
+        df = df.copy(deep=False)
+        df[col] = apply_format(df[col], ColumnFormat(value_type), strict=False)
+
+    # ——— Datas ———
+    if is_date_column(col, df) or value_type == "data":
+        conv = safe_to_datetime(df[col])
+        indicadores = {
+            "coluna": col,
+            "tipo": label_tipo,
+            "estatisticas": {"min": str(conv.min()), "max": str(conv.max())},
+        }
+
+    # ——— Numérico contínuo ———
+    elif is_numerical(col, df) and not is_categorical(col, df):
+        indicadores = {
+            "coluna": col,
+            "tipo": label_tipo,
+            "estatisticas": {
+                "min": float(df[col].min()),
+                "max": float(df[col].max()),
+                "media": float(df[col].mean()),
+            },
+        }
+
+    # ——— Categórico ———
+    else:
+        fuzzy = value_type not in CODE_TYPES
+        df_tab = _process_categorical_column(df, col, id_col, fuzzy=fuzzy)
+        indicadores = {
+            "coluna": col,
+            "tipo": label_tipo,
+            "tabela": df_tab,
+        }
+        if fuzzy:
+            # Linhas por marca do dicionário de sinônimos (só colunas de texto)
+            matches = dictionary_matches(df[[col, id_col]].dropna(), [col]).get(col)
+            if matches is not None:
+                indicadores["dicionario"] = {tag: int(n) for tag, n in matches.items()}
+
+    # Sempre garanta as chaves
+    indicadores.setdefault("tabela", None)
+    indicadores.setdefault("estatisticas", None)
+    indicadores.setdefault("dicionario", None)
+    return indicadores
+
+
+def generate_indicators(df, progress_callback=None, workers=INDICATOR_WORKERS):
     """
     Gera indicadores e, a cada coluna processada, chama:
         progress_callback(processed_count, total_to_process)
     para streaming de progresso na GUI.
 
+    Com ``workers`` diferente de 1 as colunas são analisadas em um pool de
+    processos (0 = todos os núcleos), começando pelas de maior cardinalidade.
+
     IMPORTANTE: Usa identificador único NATIVO da tabela quando disponível.
     Só cria ID sintético se não existir ID nativo.
     """
@@ -168,13 +356,16 @@ def generate_indicators(df, progress_callback=None):
 
     if not id_col:
         # Fallback: busca por nome usando função local
-        id_col = next((c for c in df.columns if is_id_column(c, df)), None)
+        id_col = next(
+            (c for c in df.columns if c != SYNTHETIC_ID_COLUMN and is_id_column(c, df)), None
+        )
 
     if not id_col:
-        # Último recurso: cria ID sintético apenas se realmente necessário
-        df = df.copy()
-        df["_synthetic_id"] = [str(i) for i in range(1, len(df) + 1)]
-        id_col = "_synthetic_id"
+        # Último recurso: usa o ID sintético de ensure_id_column ou cria um
+        if SYNTHETIC_ID_COLUMN not in df.columns:
+            df = df.copy()
+            df[SYNTHETIC_ID_COLUMN] = synthetic_ids(len(df))
+        id_col = SYNTHETIC_ID_COLUMN
         id_is_synthetic = True
 
     indicators = {
@@ -187,48 +378,34 @@ def generate_indicators(df, progress_callback=None):
     skip = {id_col}
     to_process = [c for c in df.columns if c not in skip]
     total = len(to_process)
-    processed = 0
-
-    for col in to_process:
-        label_tipo = col_types.get(col) or "desconhecido"
-
-        # ——— Datas ———
-        if is_date_candidate(col):
-            conv = safe_to_datetime(df[col])
-            indicadores = {
-                "coluna": col,
-                "tipo": label_tipo,
-                "estatisticas": {"min": str(conv.min()), "max": str(conv.max())},
-            }
-            indicators["agrupamentos"].append(indicadores)
-
-        # ——— Numérico contínuo ———
-        elif is_numerical(col, df) and not is_categorical(col, df):
-            indicadores = {
-                "coluna": col,
-                "tipo": label_tipo,
-                "estatisticas": {
-                    "min": float(df[col].min()),
-                    "max": float(df[col].max()),
-                    "media": float(df[col].mean()),
-                },
-            }
-            indicators["agrupamentos"].append(indicadores)
-
-        # ——— Categórico ———
-        else:
-            df_tab = _process_categorical_column(df, col, id_col)
-            indicadores = {
-                "coluna": col,
-                "tipo": label_tipo,
-                "tabela": df_tab,
-            }
-            indicators["agrupamentos"].append(indicadores)
+    # Colunas sem tipo pelo cabeçalho recebem o tipo inferido pelos valores
+    value_types = detect_value_types(df, to_process)
+    tasks = [
+        (
+            col,
+            (
+                col_types.get(col) or value_types.get(col) or "desconhecido",
+                id_col,
+                value_types.get(col),
+            ),
+        )
+        for col in to_process
+    ]
+
+    if workers != 1 and total > 1:
+        indicators["agrupamentos"] = run_columns_parallel(
+            df,
+            tasks,
+            _analyze_column,
+            workers,
+            progress_callback=progress_callback,
+            context_columns=(id_col,),
+        )
+        return indicators
 
-        # Sempre garanta as chaves
-        grp = indicators["agrupamentos"][-1]
-        grp.setdefault("tabela", None)
-        grp.setdefault("estatisticas", None)
+    processed = 0
+    for col, args in tasks:
+        indicators["agrupamentos"].append(_analyze_column(df, col, *args))
 
         # ——— Progresso ———
         processed += 1
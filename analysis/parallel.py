@@ -0,0 +1,161 @@
+# analysis/parallel.py
+"""
+Execução paralela de análises por coluna em um pool de processos.
+
+O DataFrame é gravado uma única vez em um arquivo Arrow IPC temporário que
+cada processo abre por memory-map, evitando serializar cópias da tabela a
+cada tarefa. Sem ``pyarrow`` (ou com colunas que o Arrow não representa),
+o DataFrame é enviado uma vez por processo na inicialização.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pandas as pd
+
+from core.logging_config import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - dependência opcional
+    pa = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+logger = get_logger("parallel")
+
+# Estado de cada processo do pool (preenchido por _init_worker)
+_WORKER_STATE: dict = {}
+
+
+def resolve_workers(workers: int | None) -> int:
+    """Converte a configuração de workers (0/None/negativo = todos os núcleos)."""
+    if not workers or workers < 1:
+        return os.cpu_count() or 1
+    return workers
+
+
+def estimate_column_cost(series: pd.Series, sample_size: int = 10_000) -> float:
+    """
+    Estima o custo relativo de analisar uma coluna a partir da cardinalidade.
+
+    Colunas numéricas custam ~O(linhas); colunas de texto pagam ainda a
+    normalização e o agrupamento por valor distinto, estimado numa amostra.
+    """
+    n = len(series)
+    if n == 0:
+        return 0.0
+    if pd.api.types.is_numeric_dtype(series) or pd.api.types.is_datetime64_any_dtype(series):
+        return float(n)
+    sample = series.iloc[:: max(1, n // sample_size)]
+    distinct = sample.nunique(dropna=True)
+    # Amostra quase toda distinta: extrapola para a coluna inteira
+    if distinct >= 0.5 * len(sample):
+        distinct = distinct * n / len(sample)
+    return float(n + 50 * distinct)
+
+
+@contextmanager
+def _shared_frame(df: pd.DataFrame) -> Iterator[str | pd.DataFrame]:
+    """Disponibiliza o DataFrame para os processos (arquivo Arrow IPC ou o próprio frame)."""
+    if pa is None:
+        yield df
+        return
+    try:
+        table = pa.Table.from_pandas(
+            df.set_axis([str(i) for i in range(df.shape[1])], axis=1), preserve_index=False
+        )
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        logger.debug(f"DataFrame não convertido para Arrow, enviando cópia aos workers: {e}")
+        yield df
+        return
+
+    fd, path = tempfile.mkstemp(suffix=".arrow", prefix="indicadores_")
+    os.close(fd)
+    try:
+        with pa.OSFile(path, "wb") as sink, pa_ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+        del table
+        yield path
+    finally:
+        Path(path).unlink(missing_ok=True)
+
+
+def _init_worker(source: str | pd.DataFrame, columns: list) -> None:
+    """Inicializa o processo: abre o arquivo Arrow por memory-map (sem cópia)."""
+    _WORKER_STATE["columns"] = columns
+    if isinstance(source, pd.DataFrame):
+        _WORKER_STATE["frame"] = source
+    else:
+        _WORKER_STATE["table"] = pa_ipc.open_file(pa.memory_map(source, "r")).read_all()
+
+
+def _worker_frame(needed: Sequence) -> pd.DataFrame:
+    """Materializa no processo apenas as colunas necessárias para a tarefa."""
+    columns = _WORKER_STATE["columns"]
+    if "frame" in _WORKER_STATE:
+        return _WORKER_STATE["frame"][list(needed)]
+    positions = [columns.index(c) for c in needed]
+    frame = _WORKER_STATE["table"].select([str(p) for p in positions]).to_pandas()
+    return frame.set_axis(list(needed), axis=1)
+
+
+def _run_task(func: Callable, col, args: tuple, context_columns: tuple) -> dict:
+    needed = [col, *[c for c in context_columns if c != col]]
+    return func(_worker_frame(needed), col, *args)
+
+
+def run_columns_parallel(
+    df: pd.DataFrame,
+    tasks: Sequence[tuple],
+    func: Callable,
+    workers: int,
+    *,
+    progress_callback: Callable[[int, int], None] | None = None,
+    context_columns: Sequence = (),
+) -> list:
+    """
+    Executa ``func(frame, col, *args)`` para cada tarefa ``(col, args)`` em paralelo.
+
+    As colunas mais caras (``estimate_column_cost``) são submetidas primeiro.
+    ``frame`` contém apenas ``col`` e ``context_columns``. O progresso é
+    reportado no thread chamador como ``progress_callback(processed, total)``
+    e os resultados voltam na ordem original das tarefas.
+    """
+    total = len(tasks)
+    costs = [estimate_column_cost(df[col]) for col, _ in tasks]
+    order = sorted(range(total), key=lambda i: costs[i], reverse=True)
+    results: list = [None] * total
+    workers = min(resolve_workers(workers), max(1, total))
+    logger.info(f"Analisando {total} colunas em {workers} processos")
+
+    with (
+        _shared_frame(df) as source,
+        ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(source, list(df.columns))
+        ) as pool,
+    ):
+        futures = {
+            pool.submit(_run_task, func, tasks[i][0], tasks[i][1], tuple(context_columns)): i
+            for i in order
+        }
+        processed = 0
+        try:
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+                processed += 1
+                if progress_callback:
+                    progress_callback(processed, total)
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return results
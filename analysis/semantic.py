@@ -2,37 +2,53 @@
 from collections import defaultdict
 
 import pandas as pd
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
+from analysis.clustering import (
+    cluster_indices,
+    cosine_edges,
+    greedy_cosine_clusters,
+    lsh_cosine_neighbors,
+    neighbor_pairs,
+)
+from analysis.embeddings import get_model
 from analysis.stopwords import clean_text, remove_stopwords
+from config.settings import EMBEDDING_MODEL, SEMANTIC_ANN_MIN_TERMS, SEMANTIC_THRESHOLD
 
-# Modelo carregado uma vez (pode ser movido para singleton)
-model = SentenceTransformer("paraphrase-multilingual-MiniLM-L12-v2")
 
+def embed_terms(terms, model_name=EMBEDDING_MODEL):
+    # Modelo compartilhado, carregado só no primeiro uso
+    return get_model(model_name).encode(terms, convert_to_tensor=False, show_progress_bar=True)
 
-def embed_terms(terms):
-    return model.encode(terms, convert_to_tensor=False, show_progress_bar=True)
 
+def cluster_terms_by_embedding(terms, threshold=SEMANTIC_THRESHOLD, method="greedy", ann=None):
+    """
+    Agrupa termos pela similaridade de cosseno dos embeddings.
 
-def cluster_terms_by_embedding(terms, threshold=0.8):
+    Com ``method="greedy"`` (padrão), cada termo ainda livre, em ordem, vira
+    semente e absorve os termos seguintes ainda livres com similaridade >=
+    ``threshold``; com ``"components"``, os grupos são as componentes conexas
+    dos pares similares. Similaridades calculadas em blocos de memória limitada.
+
+    Com ``ann=True`` (ou ``None`` e mais de ``SEMANTIC_ANN_MIN_TERMS`` termos)
+    só os ``SEMANTIC_NEIGHBORS`` vizinhos mais próximos de cada termo, achados
+    por LSH (``lsh_cosine_neighbors``), são considerados; nesse caso a
+    semente gulosa só absorve os seus vizinhos e ``"components"`` tende a
+    refazer melhor os grupos grandes.
+    """
+    if len(terms) == 0:
+        return []
     embeddings = embed_terms(terms)
-    clusters = []
-    used = set()
-    for i, emb_i in enumerate(embeddings):
-        if i in used:
-            continue
-        cluster = [terms[i]]
-        used.add(i)
-        for j in range(i + 1, len(terms)):
-            if j in used:
-                continue
-            sim = cosine_similarity([emb_i], [embeddings[j]])[0][0]
-            if sim >= threshold:
-                cluster.append(terms[j])
-                used.add(j)
-        clusters.append(cluster)
-    return clusters
+    if ann is None:
+        ann = len(terms) > SEMANTIC_ANN_MIN_TERMS
+    if ann:
+        rows, cols, _ = lsh_cosine_neighbors(embeddings, threshold)
+        groups = cluster_indices(len(terms), *neighbor_pairs(rows, cols), method)
+    elif method == "greedy":
+        groups = greedy_cosine_clusters(embeddings, threshold)
+    else:
+        rows, cols = cosine_edges(embeddings, threshold)
+        groups = cluster_indices(len(terms), rows, cols, method)
+    return [[terms[k] for k in group] for group in groups]
 
 
 def get_terms_frequency(df, text_columns, custom_stopwords=None):
@@ -0,0 +1,423 @@
+# analysis/streaming.py
+"""
+Análise em fluxo: indicadores calculados bloco a bloco.
+
+Cada coluna ganha um acumulador (mínimo/máximo/média, contagem de valores e
+pares valor-ID distintos) atualizado por bloco e combinável com outros
+acumuladores. Assim ``generate_indicators_streaming`` produz o mesmo formato
+de ``generate_indicators`` sem que o DataFrame completo fique em memória.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from analysis.content import CODE_TYPES, detect_value_types
+from analysis.detector import detect_column_types
+from analysis.indicator import (
+    _process_categorical_column,
+    categorical_values,
+    is_date_column,
+    is_id_column,
+    is_numerical,
+    safe_to_datetime,
+)
+from analysis.tagging import tag_counts
+from config.settings import COERCION_SAMPLE_SIZE, STREAM_CHUNKSIZE
+from core.coercion import ColumnFormat, apply_format
+from core.dates import infer_date_format
+from core.dtypes import is_text_column, plain_values, sample_texts
+from core.id_generator import SYNTHETIC_ID_COLUMN, detect_native_id_column, synthetic_ids
+from core.loader import iter_spreadsheet_chunks
+from core.logging_config import get_logger
+from core.utils import detect_cep_columns, normalize_cep_column
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from pathlib import Path
+
+logger = get_logger("streaming")
+
+# Acima de 200 valores distintos apenas os 100 mais frequentes são agrupados
+_MAX_DISTINCT_FULL = 200
+_TOP_VALUES = 100
+# Colunas numéricas com menos valores distintos que isso podem ser categóricas
+_MAX_NUMERIC_CATEGORIES = 30
+
+
+class CategoricalAccumulator:
+    """
+    Acumula contagem de linhas por valor e pares (valor, ID) distintos.
+
+    Cada valor distinto recebe um código na ordem de primeira aparição, e os
+    pares são guardados como (código, ID), já deduplicados dentro de cada
+    bloco. Os pares pendentes só são unidos aos consolidados quando passam do
+    tamanho deles (crescimento geométrico), então o custo total é linear no
+    número de pares, e o estado guarda um par por (valor, ID) distinto, não
+    por linha.
+    """
+
+    def __init__(self, col, id_col, fuzzy: bool = True):
+        self.col = col
+        self.id_col = id_col
+        self.fuzzy = fuzzy
+        self.codes: dict = {}
+        self.counts: list[int] = []
+        # Valores novos de cada bloco, na ordem dos códigos
+        self.values: list[pd.Series] = []
+        self.pairs: pd.DataFrame | None = None
+        self.pending: list[pd.DataFrame] = []
+        self.pending_rows = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        valores = chunk[[self.col, self.id_col]].dropna()
+        # Blocos e abas podem ter categorias diferentes: acumula os valores em si
+        local, uniques = pd.factorize(categorical_values(plain_values(valores[self.col])))
+        counts = np.bincount(local, minlength=len(uniques))
+        mapping = self._register(pd.Series(uniques), counts)
+        self._append(mapping[local], plain_values(valores[self.id_col]).to_numpy())
+
+    def merge(self, other: CategoricalAccumulator, id_offset: int = 0) -> None:
+        """Incorpora outro acumulador; ``id_offset`` é somado aos IDs (sintéticos) dele."""
+        other._compact()
+        if other.pairs is None:
+            return
+        mapping = self._register(other._value_series(), np.asarray(other.counts))
+        ids = other.pairs["id"].to_numpy()
+        self._append(
+            mapping[other.pairs["codigo"].to_numpy()], ids + id_offset if id_offset else ids
+        )
+
+    def _register(self, uniques: pd.Series, counts: np.ndarray) -> np.ndarray:
+        """Soma as contagens e retorna o código acumulado de cada valor de ``uniques``."""
+        mapping = np.empty(len(uniques), dtype=np.int64)
+        new = []
+        for i, (value, count) in enumerate(zip(uniques, counts.tolist(), strict=True)):
+            code = self.codes.get(value)
+            if code is None:
+                code = self.codes[value] = len(self.counts)
+                self.counts.append(0)
+                new.append(i)
+            self.counts[code] += count
+            mapping[i] = code
+        if new:
+            self.values.append(uniques.iloc[new])
+        return mapping
+
+    def _append(self, codes: np.ndarray, ids: np.ndarray) -> None:
+        if not len(codes):
+            return
+        pairs = pd.DataFrame({"codigo": codes, "id": ids}).drop_duplicates(ignore_index=True)
+        self.pending.append(pairs)
+        self.pending_rows += len(pairs)
+        if self.pairs is None or self.pending_rows >= len(self.pairs):
+            self._compact()
+
+    def _compact(self) -> None:
+        """Une os pares pendentes aos consolidados, sem repetidos e na ordem de aparição."""
+        if not self.pending:
+            return
+        parts = self.pending if self.pairs is None else [self.pairs, *self.pending]
+        self.pairs = pd.concat(parts, ignore_index=True).drop_duplicates(ignore_index=True)
+        self.pending = []
+        self.pending_rows = 0
+
+    def _value_series(self) -> pd.Series:
+        if len(self.values) > 1:
+            self.values = [pd.concat(self.values, ignore_index=True)]
+        return self.values[0].reset_index(drop=True) if self.values else pd.Series()
+
+    def __getstate__(self) -> dict:
+        """Estado enxuto para enviar entre processos: pares consolidados, sem o dicionário."""
+        self._compact()
+        self._value_series()
+        state = self.__dict__.copy()
+        del state["codes"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self.codes = {value: code for code, value in enumerate(self._value_series())}
+
+    @property
+    def n_distinct(self) -> int:
+        return len(self.counts)
+
+    def dictionary(self) -> dict | None:
+        """Linhas por marca do dicionário de sinônimos (``tag_counts``), como em ``generate_indicators``."""
+        values = self._value_series()
+        if not self.fuzzy or not is_text_column(values):
+            return None
+        matches = tag_counts(values, self.counts)
+        return {tag: int(n) for tag, n in matches.items()} or None
+
+    def result(self) -> pd.DataFrame | None:
+        self._compact()
+        if self.pairs is None:
+            return None
+        codes = self.pairs["codigo"].to_numpy()
+        ids = self.pairs["id"].to_numpy()
+        if self.n_distinct > _MAX_DISTINCT_FULL:
+            top = np.argsort(-np.asarray(self.counts), kind="stable")[:_TOP_VALUES]
+            keep = np.isin(codes, top)
+            codes, ids = codes[keep], ids[keep]
+        values = self._value_series().take(codes).reset_index(drop=True)
+        pairs = pd.DataFrame({self.col: values, self.id_col: ids})
+        return _process_categorical_column(pairs, self.col, self.id_col, self.fuzzy)
+
+
+class NumericAccumulator:
+    """Acumula mínimo, máximo e média; guarda os valores enquanto parecer categórica."""
+
+    def __init__(self, col, id_col, fmt: ColumnFormat | None = None):
+        self.col = col
+        # Formato de números em texto (brasileiro), convertidos a cada bloco
+        self.fmt = fmt
+        self.min = None
+        self.max = None
+        self.sum = 0.0
+        self.count = 0
+        self.rows = 0
+        self.categories: CategoricalAccumulator | None = CategoricalAccumulator(col, id_col)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        values = chunk[self.col]
+        if not pd.api.types.is_numeric_dtype(values):
+            if self.fmt is not None:
+                values = apply_format(values, self.fmt, strict=False)
+            else:
+                logger.warning(f"Coluna '{self.col}' deixou de ser numérica; convertendo o bloco")
+                values = pd.to_numeric(values, errors="coerce")
+            chunk = chunk.assign(**{self.col: values})
+        self.rows += len(values)
+        valid = values.dropna()
+        if not valid.empty:
+            self._combine(valid.min(), valid.max(), float(valid.sum()), len(valid))
+        if self.categories is not None:
+            self.categories.update(chunk)
+            self._check_categories()
+
+    def merge(self, other: NumericAccumulator, id_offset: int = 0) -> None:
+        self.rows += other.rows
+        if other.count:
+            self._combine(other.min, other.max, other.sum, other.count)
+        if self.categories is not None and other.categories is not None:
+            self.categories.merge(other.categories, id_offset)
+        else:
+            self.categories = None
+        self._check_categories()
+
+    def _combine(self, vmin, vmax, vsum, count) -> None:
+        self.min = vmin if self.min is None else min(self.min, vmin)
+        self.max = vmax if self.max is None else max(self.max, vmax)
+        self.sum += vsum
+        self.count += count
+
+    def _check_categories(self) -> None:
+        if self.categories is not None and self.categories.n_distinct >= _MAX_NUMERIC_CATEGORIES:
+            self.categories = None
+
+    @property
+    def is_categorical(self) -> bool:
+        """Mesmo critério de ``is_categorical``: poucos valores distintos."""
+        if self.categories is None:
+            return False
+        return self.categories.n_distinct < min(_MAX_NUMERIC_CATEGORIES, self.rows // 5)
+
+    def statistics(self) -> dict:
+        nan = float("nan")
+        return {
+            "min": float(self.min) if self.count else nan,
+            "max": float(self.max) if self.count else nan,
+            "media": self.sum / self.count if self.count else nan,
+        }
+
+
+class DateAccumulator:
+    """Acumula a menor e a maior data convertida."""
+
+    def __init__(self, col):
+        self.col = col
+        self.min = pd.NaT
+        self.max = pd.NaT
+        # Formato inferido no primeiro bloco com valores e reaproveitado nos seguintes
+        self.date_format = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        values = chunk[self.col]
+        if self.date_format is None and is_text_column(values):
+            self.date_format = infer_date_format(sample_texts(values, COERCION_SAMPLE_SIZE))
+        conv = safe_to_datetime(values, self.date_format)
+        self._combine(conv.min(), conv.max())
+
+    def merge(self, other: DateAccumulator, id_offset: int = 0) -> None:  # noqa: ARG002
+        # Sem IDs: id_offset existe só pela interface comum dos acumuladores
+        self._combine(other.min, other.max)
+
+    def _combine(self, vmin, vmax) -> None:
+        if not pd.isna(vmin):
+            self.min = vmin if pd.isna(self.min) else min(self.min, vmin)
+        if not pd.isna(vmax):
+            self.max = vmax if pd.isna(self.max) else max(self.max, vmax)
+
+    def statistics(self) -> dict:
+        return {"min": str(self.min), "max": str(self.max)}
+
+
+def _new_accumulator(col, chunk: pd.DataFrame, id_col, value_type: str | None = None):
+    """Acumulador do mesmo ramo que ``_analyze_column`` escolheria para a coluna."""
+    if is_date_column(col, chunk) or value_type == "data":
+        return DateAccumulator(col)
+    if value_type in ("numero", "percentual", "moeda"):
+        return NumericAccumulator(col, id_col, ColumnFormat(value_type))
+    if is_numerical(col, chunk):
+        return NumericAccumulator(col, id_col)
+    return CategoricalAccumulator(col, id_col, fuzzy=value_type not in CODE_TYPES)
+
+
+class IndicatorAccumulator:
+    """
+    Acumula os indicadores de uma tabela inteira, bloco a bloco.
+
+    Tipos de coluna, coluna de ID e colunas de data são decididos no primeiro
+    bloco. Acumuladores de tabelas com o mesmo layout (por exemplo, abas de
+    uma pasta de trabalho) podem ser combinados com ``merge``.
+    """
+
+    def __init__(self):
+        self.columns: list = []
+        self.col_types: dict = {}
+        self.value_types: dict = {}
+        self.id_col = None
+        self.id_is_synthetic = False
+        self.total_rows = 0
+        self.accumulators: dict = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        if not self.columns:
+            self.columns = list(chunk.columns)
+            self.col_types = detect_column_types(chunk)
+            if SYNTHETIC_ID_COLUMN not in chunk.columns:
+                self.id_col = detect_native_id_column(chunk) or next(
+                    (c for c in chunk.columns if is_id_column(c, chunk)), None
+                )
+            if not self.id_col:
+                self.id_col = SYNTHETIC_ID_COLUMN
+                self.id_is_synthetic = True
+                if SYNTHETIC_ID_COLUMN not in self.columns:
+                    self.columns.append(self.id_col)
+            self.value_types = detect_value_types(
+                chunk, [c for c in self.columns if c != self.id_col]
+            )
+            self.accumulators = {
+                col: _new_accumulator(col, chunk, self.id_col, self.value_types.get(col))
+                for col in self.columns
+                if col != self.id_col
+            }
+        block = chunk
+        if self.id_is_synthetic:
+            # Numeração contínua entre blocos (substitui a de ensure_id_column)
+            ids = synthetic_ids(len(chunk), self.total_rows + 1)
+            block = chunk.assign(**{SYNTHETIC_ID_COLUMN: ids})
+        for acc in self.accumulators.values():
+            acc.update(block)
+        self.total_rows += len(chunk)
+
+    def merge(self, other: IndicatorAccumulator) -> None:
+        """
+        Incorpora os indicadores de outra tabela com o mesmo layout.
+
+        Raises:
+            ValueError: Se colunas, coluna de ID ou tipos de acumulador diferem.
+        """
+        if not other.columns:
+            return
+        if not self.columns:
+            self.__dict__.update(other.__dict__)
+            return
+        if other.columns != self.columns or other.id_col != self.id_col:
+            raise ValueError("Tabelas com colunas ou coluna de ID diferentes")
+        for col, acc in self.accumulators.items():
+            if type(other.accumulators[col]) is not type(acc):
+                raise ValueError(f"Coluna '{col}' tem tipos diferentes nas tabelas")
+        # IDs sintéticos da outra tabela continuam a numeração desta
+        id_offset = self.total_rows if self.id_is_synthetic else 0
+        for col, acc in self.accumulators.items():
+            acc.merge(other.accumulators[col], id_offset)
+        self.total_rows += other.total_rows
+
+    def result(self, progress_callback: Callable[[int, int | None], None] | None = None) -> dict:
+        """Monta os indicadores no formato de ``generate_indicators``."""
+        indicators = {
+            "id_coluna": self.id_col,
+            "id_is_synthetic": self.id_is_synthetic,
+            "total_linhas": self.total_rows,
+            "total_colunas": len(self.columns),
+            "agrupamentos": [],
+        }
+        total = len(self.accumulators)
+        for processed, (col, acc) in enumerate(self.accumulators.items(), start=1):
+            grp = {
+                "coluna": col,
+                "tipo": self.col_types.get(col) or self.value_types.get(col) or "desconhecido",
+            }
+            if isinstance(acc, DateAccumulator) or (
+                isinstance(acc, NumericAccumulator) and not acc.is_categorical
+            ):
+                grp["estatisticas"] = acc.statistics()
+            else:
+                categories = acc.categories if isinstance(acc, NumericAccumulator) else acc
+                grp["tabela"] = categories.result()
+                if isinstance(acc, CategoricalAccumulator):
+                    grp["dicionario"] = acc.dictionary()
+            grp.setdefault("tabela", None)
+            grp.setdefault("estatisticas", None)
+            grp.setdefault("dicionario", None)
+            indicators["agrupamentos"].append(grp)
+            if progress_callback:
+                progress_callback(processed, total)
+        return indicators
+
+
+def generate_indicators_streaming(
+    chunks: Iterable[pd.DataFrame],
+    progress_callback: Callable[[int, int | None], None] | None = None,
+) -> dict:
+    """
+    Gera os mesmos indicadores de ``generate_indicators`` a partir de blocos.
+
+    Tipos de coluna, coluna de ID e colunas de data são decididos no primeiro
+    bloco. Durante a leitura chama ``progress_callback(linhas, None)``; na
+    finalização, ``progress_callback(processed, total)`` por coluna.
+    """
+    accumulator = IndicatorAccumulator()
+    for chunk in chunks:
+        accumulator.update(chunk)
+        if progress_callback:
+            progress_callback(accumulator.total_rows, None)
+    return accumulator.result(progress_callback)
+
+
+def analyze_file_streaming(
+    file_path: str | Path,
+    chunksize: int = STREAM_CHUNKSIZE,
+    progress_callback: Callable[[int, int | None], None] | None = None,
+) -> dict:
+    """
+    Lê e analisa um arquivo bloco a bloco, normalizando CEPs em cada bloco.
+
+    As colunas de CEP são detectadas no primeiro bloco e reaproveitadas.
+    """
+    cep_cols: list | None = None
+
+    def normalized_chunks():
+        nonlocal cep_cols
+        for chunk in iter_spreadsheet_chunks(file_path, chunksize, progress_callback):
+            if cep_cols is None:
+                cep_cols = detect_cep_columns(chunk)
+            yield normalize_cep_column(chunk.copy(), cep_cols=cep_cols)
+
+    return generate_indicators_streaming(normalized_chunks(), progress_callback)
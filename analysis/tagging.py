@@ -0,0 +1,170 @@
+# analysis/tagging.py
+"""
+Marcação de valores pelo dicionário de sinônimos (autômato de Aho-Corasick).
+
+Os sinônimos de ``domain_synonyms`` (redes, categorias, termos do ramo)
+viram um autômato montado uma única vez, que encontra todas as ocorrências
+de todos os sinônimos num texto em uma só passada. Só os valores distintos
+de cada coluna são percorridos; a marca de cada valor é o tipo do sinônimo
+mais longo encontrado como palavra inteira, e as linhas recebem a marca pelo
+código do valor. Com a marca, valores categóricos podem ser padronizados pela
+chave do dicionário antes do agrupamento aproximado.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from analysis.detector import domain_synonyms, normalize_header
+from config.settings import VALUE_TAG_MIN_LENGTH
+from core.dtypes import is_text_column
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    """Indica se ``pos`` está numa borda de palavra de ``text``."""
+    return pos <= 0 or pos >= len(text) or not text[pos - 1].isalnum() or not text[pos].isalnum()
+
+
+class SynonymAutomaton:
+    """
+    Autômato de Aho-Corasick dos sinônimos normalizados.
+
+    ``goto`` guarda as transições de cada estado, ``fail`` o estado de falha
+    e ``outputs`` os sinônimos (comprimento, tipo) que terminam no estado,
+    já incluindo os herdados pela cadeia de falhas. Sinônimos com menos de
+    ``min_length`` caracteres ficam de fora; um sinônimo repetido fica com o
+    primeiro tipo, como em ``SynonymIndex``.
+    """
+
+    def __init__(self, synonyms: dict[str, list[str]], min_length: int = VALUE_TAG_MIN_LENGTH):
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.outputs: list[tuple[tuple[int, str], ...]] = [()]
+        for tipo, sin_list in synonyms.items():
+            for sin in sin_list:
+                norm = normalize_header(sin)
+                if len(norm) >= min_length:
+                    self._add(norm, tipo)
+        self._link()
+
+    def _add(self, word: str, tipo: str) -> None:
+        state = 0
+        for char in word:
+            nxt = self.goto[state].get(char)
+            if nxt is None:
+                nxt = len(self.goto)
+                self.goto[state][char] = nxt
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append(())
+            state = nxt
+        if not self.outputs[state]:
+            self.outputs[state] = ((len(word), tipo),)
+
+    def _link(self) -> None:
+        """Estados de falha em largura; cada estado herda as saídas do seu estado de falha."""
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(char, 0)
+                self.outputs[nxt] += self.outputs[self.fail[nxt]]
+
+    def find(self, text: str) -> list[tuple[int, int, str]]:
+        """Ocorrências (início, fim, tipo) de sinônimos como palavras inteiras em ``text``."""
+        goto, fail, outputs = self.goto, self.fail, self.outputs
+        found = []
+        state = 0
+        for end, char in enumerate(text, start=1):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for length, tipo in outputs[state]:
+                start = end - length
+                if _is_boundary(text, start) and _is_boundary(text, end):
+                    found.append((start, end, tipo))
+        return found
+
+    def standardize(self, value) -> str | None:
+        """Tipo de ``value`` quando ele inteiro é um sinônimo ("Pharmacy" -> farmacia), ou None."""
+        text = normalize_header(value)
+        for start, end, tipo in self.find(text):
+            if start == 0 and end == len(text):
+                return tipo
+        return None
+
+    def tag(self, value) -> str | None:
+        """Tipo do sinônimo mais longo presente em ``value`` (o primeiro, em empate), ou None."""
+        best, best_length = None, 0
+        for start, end, tipo in self.find(normalize_header(value)):
+            if end - start > best_length:
+                best, best_length = tipo, end - start
+        return best
+
+
+# Autômato do dicionário em uso; refeito quando ``reload_synonyms`` troca o dicionário
+_AUTOMATON: dict = {}
+
+
+def synonym_automaton() -> SynonymAutomaton:
+    """Autômato dos dicionários de sinônimos, montado na primeira consulta."""
+    synonyms = domain_synonyms()
+    if _AUTOMATON.get("synonyms") is not synonyms:
+        _AUTOMATON.update(synonyms=synonyms, automaton=SynonymAutomaton(synonyms))
+    return _AUTOMATON["automaton"]
+
+
+def _tag_codes(series: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """Códigos dos valores de ``series`` (-1 = ausente) e a marca de cada valor distinto."""
+    codes, uniques = pd.factorize(series)
+    automaton = synonym_automaton()
+    tags = np.array([automaton.tag(value) for value in uniques], dtype=object)
+    return codes, tags
+
+
+def tag_values(series: pd.Series) -> pd.Series:
+    """
+    Marca de cada valor de ``series`` pelo dicionário de sinônimos (NA sem marca).
+
+    Cada valor distinto é percorrido uma única vez.
+    """
+    codes, tags = _tag_codes(series)
+    tagged = np.append(tags, None)[codes]
+    return pd.Series(tagged, index=series.index, name=series.name, dtype=object)
+
+
+def tag_counts(values, counts) -> pd.Series:
+    """
+    Linhas por marca do dicionário, dados valores distintos e as linhas de cada um.
+
+    Retorna marca -> linhas, em ordem decrescente (vazia se nada for marcado).
+    """
+    automaton = synonym_automaton()
+    tags = pd.Series([automaton.tag(value) for value in values], dtype=object)
+    totals = pd.Series(np.asarray(counts, dtype=np.int64)).groupby(tags, sort=False).sum()
+    return totals.sort_values(ascending=False, kind="stable")
+
+
+def dictionary_matches(df: pd.DataFrame, columns=None) -> dict:
+    """
+    Contagem de linhas por marca do dicionário em cada coluna de texto.
+
+    Retorna coluna -> Series (marca -> linhas, em ordem decrescente); colunas
+    sem nenhum valor marcado ficam de fora.
+    """
+    result = {}
+    for col in df.columns if columns is None else columns:
+        if not is_text_column(df[col]):
+            continue
+        codes, uniques = pd.factorize(df[col])
+        counts = tag_counts(uniques, np.bincount(codes[codes >= 0], minlength=len(uniques)))
+        if not counts.empty:
+            result[col] = counts.rename(col)
+    return result
@@ -0,0 +1,132 @@
+# analysis/workbook.py
+"""
+Análise de pastas de trabalho com várias abas.
+
+Cada aba é carregada e analisada em um processo do pool; ao processo
+principal voltam apenas os indicadores e, para a combinação, os
+acumuladores de ``analysis.streaming``. No máximo ``workers`` abas ficam em
+memória ao mesmo tempo (em análise ou aguardando a combinação).
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from analysis.indicator import generate_indicators
+from analysis.parallel import resolve_workers
+from analysis.streaming import IndicatorAccumulator
+from config.settings import SHEET_WORKERS
+from core.id_generator import ensure_id_column
+from core.loader import list_sheets, load_spreadsheet
+from core.logging_config import get_logger
+from core.utils import normalize_cep_column
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger("workbook")
+
+
+def analyze_sheet(
+    file_path: str | Path, sheet_name: str | None = None, *, combine: bool = False
+) -> tuple[dict, IndicatorAccumulator | None]:
+    """
+    Carrega, prepara e analisa uma aba (mesmo fluxo da interface).
+
+    Com ``combine`` a aba passa uma única vez pelo acumulador e os
+    indicadores dela saem de ``IndicatorAccumulator.result``; o acumulador
+    volta ao processo principal só com os pares (valor, ID) distintos.
+
+    Returns:
+        Indicadores da aba e, com ``combine``, o acumulador para combinação
+        (None se a aba estiver vazia).
+    """
+    df = load_spreadsheet(file_path, sheet_name=sheet_name)
+    df = ensure_id_column(df)
+    df = normalize_cep_column(df)
+    if not combine or df.empty:
+        return generate_indicators(df, workers=1), None
+    accumulator = IndicatorAccumulator()
+    accumulator.update(df)
+    return accumulator.result(), accumulator
+
+
+def analyze_workbook(
+    file_path: str | Path,
+    progress_callback: Callable[[int, int], None] | None = None,
+    *,
+    workers: int = SHEET_WORKERS,
+    combine: bool = False,
+) -> dict:
+    """
+    Analisa todas as abas de uma pasta de trabalho, em paralelo.
+
+    Chama ``progress_callback(abas concluídas, total de abas)`` a cada aba.
+    Com ``combine`` as abas de mesmo layout são combinadas, na ordem do
+    arquivo, em indicadores únicos; abas incompatíveis ficam de fora da
+    combinação (com aviso no log). Arquivos CSV são tratados como uma aba.
+
+    Returns:
+        ``{"abas": {nome: indicadores}, "combinado": indicadores | None,
+        "combinadas": [nomes das abas na combinação]}``
+    """
+    sheets = list_sheets(file_path) or [None]
+    names = [sheet if sheet is not None else Path(file_path).stem for sheet in sheets]
+    total = len(sheets)
+    workers = min(resolve_workers(workers), total)
+    merged = IndicatorAccumulator() if combine else None
+    results: dict = {}
+    combined: list = []
+
+    def collect(i: int, indicators: dict, accumulator: IndicatorAccumulator | None) -> None:
+        results[names[i]] = indicators
+        if merged is not None and accumulator is not None:
+            try:
+                merged.merge(accumulator)
+            except ValueError as e:
+                logger.warning(f"Aba '{names[i]}' fora da combinação: {e}")
+            else:
+                combined.append(names[i])
+
+    logger.info(f"Analisando {total} abas em {workers} processos")
+    if workers == 1:
+        for i, sheet in enumerate(sheets):
+            collect(i, *analyze_sheet(file_path, sheet, combine=combine))
+            if progress_callback:
+                progress_callback(i + 1, total)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            in_flight: dict = {}
+            ready: dict = {}
+            next_submit = next_collect = completed = 0
+            try:
+                while next_collect < total:
+                    # Abas concluídas aguardando a vez contam no limite de memória
+                    while next_submit < total and len(in_flight) + len(ready) < workers:
+                        future = pool.submit(
+                            analyze_sheet, file_path, sheets[next_submit], combine=combine
+                        )
+                        in_flight[future] = next_submit
+                        next_submit += 1
+                    if in_flight:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            ready[in_flight.pop(future)] = future.result()
+                            completed += 1
+                            if progress_callback:
+                                progress_callback(completed, total)
+                    while next_collect in ready:
+                        collect(next_collect, *ready.pop(next_collect))
+                        next_collect += 1
+            except BaseException:
+                for future in in_flight:
+                    future.cancel()
+                raise
+
+    return {
+        "abas": {name: results[name] for name in names},
+        "combinado": merged.result() if merged is not None and merged.columns else None,
+        "combinadas": combined,
+    }
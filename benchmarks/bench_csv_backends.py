@@ -0,0 +1,80 @@
+# benchmarks/bench_csv_backends.py
+"""
+Benchmark dos leitores CSV de ``core.loader`` (linhas/s por leitor).
+
+Uso:
+    python -m benchmarks.bench_csv_backends                  # arquivos sintéticos
+    python -m benchmarks.bench_csv_backends --rows 100000 5000000
+    python -m benchmarks.bench_csv_backends --file dados.csv # arquivo real
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.loader import CSV_BACKENDS, read_csv, sniff_csv
+
+
+def make_csv(path: Path, rows: int, seed: int = 0) -> Path:
+    """Gera um CSV sintético com colunas numéricas, texto e datas."""
+    rng = np.random.default_rng(seed)
+    cidades = np.array(["São Paulo", "Rio de Janeiro", "Belo Horizonte", "Curitiba", "Recife"])
+    df = pd.DataFrame(
+        {
+            "id": np.arange(1, rows + 1),
+            "cliente": np.char.add("Cliente ", rng.integers(0, 50_000, rows).astype(str)),
+            "cidade": cidades[rng.integers(0, len(cidades), rows)],
+            "valor": rng.random(rows) * 1000,
+            "quantidade": rng.integers(1, 100, rows),
+            "data": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 365, rows), unit="D"),
+        }
+    )
+    df.to_csv(path, index=False)
+    return path
+
+
+def bench_file(path: Path, repeat: int) -> list[tuple[str, int, float]]:
+    """Mede cada leitor no arquivo; retorna (leitor, linhas, melhor tempo)."""
+    dialect = sniff_csv(path)
+    results = []
+    for backend in sorted(CSV_BACKENDS):
+        best = float("inf")
+        rows = 0
+        for _ in range(repeat):
+            start = time.perf_counter()
+            rows = len(read_csv(path, backend=backend, dialect=dialect))
+            best = min(best, time.perf_counter() - start)
+        results.append((backend, rows, best))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--file", type=Path, nargs="*", default=[])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        files = list(args.file) or [
+            make_csv(Path(tmp) / f"bench_{rows}.csv", rows) for rows in args.rows
+        ]
+        print(
+            f"{'arquivo':<28}{'MB':>8}  {'leitor':<10}{'linhas':>12}{'tempo (s)':>12}{'linhas/s':>14}"
+        )
+        for path in files:
+            size_mb = path.stat().st_size / 1024 / 1024
+            for backend, rows, seconds in bench_file(path, args.repeat):
+                print(
+                    f"{path.name:<28}{size_mb:>8.1f}  {backend:<10}{rows:>12,}"
+                    f"{seconds:>12.3f}{rows / seconds:>14,.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# benchmarks/bench_detector.py
+"""
+Benchmark de ``detect_column_types`` em planilhas com muitas colunas.
+
+Compara o índice de sinônimos (árvore de prefixos) com a varredura de todos
+os sinônimos por coluna, e mede a etapa aproximada (cabeçalhos sem sinônimo
+como prefixo contra todos os sinônimos, num único ``cdist``).
+
+Uso:
+    python -m benchmarks.bench_detector                  # 1.000 colunas
+    python -m benchmarks.bench_detector --columns 100 1000 10000
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import unidecode
+
+from analysis.detector import DOMAIN_SYNONYMS, SynonymIndex, detect_column_types, synonym_index
+
+
+def make_headers(columns: int, seed: int = 0) -> pd.DataFrame:
+    """DataFrame vazio com cabeçalhos sintéticos: sinônimos, variações e nomes sem tipo."""
+    rng = np.random.default_rng(seed)
+    synonyms = [sin for sin_list in DOMAIN_SYNONYMS.values() for sin in sin_list]
+    headers = []
+    for i in range(columns):
+        kind = i % 3
+        if kind == 0:
+            headers.append(str(rng.choice(synonyms)).upper())
+        elif kind == 1:
+            headers.append(f"{rng.choice(synonyms)} {i}")
+        else:
+            headers.append(f"coluna_{i}")
+    return pd.DataFrame(columns=headers)
+
+
+def scan_column_types(df: pd.DataFrame) -> dict:
+    """Varredura de todos os sinônimos por coluna (sem índice), como referência."""
+    col_map = {}
+    for col in df.columns:
+        col_norm = unidecode.unidecode(str(col)).lower().strip()
+        found, length = None, -1
+        for tipo, sin_list in DOMAIN_SYNONYMS.items():
+            for sin in sin_list:
+                sin_norm = unidecode.unidecode(str(sin)).lower().strip()
+                if col_norm.startswith(sin_norm) and len(sin_norm) > length:
+                    found, length = tipo, len(sin_norm)
+        col_map[col] = found
+    return col_map
+
+
+def best_time(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--columns", type=int, nargs="+", default=[1_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    build = best_time(lambda: SynonymIndex(DOMAIN_SYNONYMS), args.repeat)
+    synonym_index()
+    print(f"Montagem do índice: {build * 1000:.1f} ms")
+    print(
+        f"{'colunas':>10}{'varredura (s)':>16}{'índice (s)':>14}"
+        f"{'aproximado (s)':>18}{'colunas/s':>14}"
+    )
+    for columns in args.columns:
+        df = make_headers(columns)
+        if scan_column_types(df) != detect_column_types(df, fuzzy=False):
+            raise AssertionError("Índice e varredura classificaram colunas de forma diferente")
+        scan = best_time(lambda df=df: scan_column_types(df), args.repeat)
+        index = best_time(lambda df=df: detect_column_types(df, fuzzy=False), args.repeat)
+        fuzzy = best_time(lambda df=df: detect_column_types(df), args.repeat)
+        print(f"{columns:>10,}{scan:>16.3f}{index:>14.4f}{fuzzy:>18.4f}{columns / index:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# benchmarks/bench_semantic.py
+"""
+Benchmark da busca de vizinhos do agrupamento semântico: exata x LSH.
+
+Mede o tempo de ``cosine_neighbors`` (produtos densos em faixas) e de
+``lsh_cosine_neighbors`` e o recall da busca aproximada: fração dos pares
+(termo, vizinho) da busca exata que a LSH também encontra.
+
+Uso:
+    python -m benchmarks.bench_semantic                         # 20.000 termos
+    python -m benchmarks.bench_semantic --terms 20000 100000 --tables 8 16
+    python -m benchmarks.bench_semantic --embeddings vetores.npy  # embeddings reais
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from analysis.clustering import cosine_neighbors, lsh_cosine_neighbors
+from config.settings import SEMANTIC_LSH_TABLES, SEMANTIC_NEIGHBORS, SEMANTIC_THRESHOLD
+
+
+def make_embeddings(terms: int, dim: int = 384, group: int = 8, seed: int = 0) -> np.ndarray:
+    """Embeddings sintéticos: grupos de variações (~``group`` termos) em torno de centros."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((terms // group + 1, dim))
+    centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+    noise = 0.35 * rng.standard_normal((terms, dim)) / np.sqrt(dim)
+    return (centers[rng.integers(0, len(centers), terms)] + noise).astype(np.float32)
+
+
+def recall(exact: tuple, approx: tuple, n: int) -> float:
+    """Fração dos pares dirigidos da busca exata presentes na aproximada."""
+    expected = exact[0] * n + exact[1]
+    if len(expected) == 0:
+        return 1.0
+    return float(np.isin(expected, approx[0] * n + approx[1]).mean())
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--terms", type=int, nargs="+", default=[20_000])
+    parser.add_argument("--embeddings", help="Arquivo .npy com embeddings (um termo por linha)")
+    parser.add_argument("--tables", type=int, nargs="+", default=[SEMANTIC_LSH_TABLES])
+    parser.add_argument("--threshold", type=float, default=SEMANTIC_THRESHOLD)
+    parser.add_argument("-k", type=int, default=SEMANTIC_NEIGHBORS)
+    args = parser.parse_args()
+
+    if args.embeddings:
+        datasets = [np.load(args.embeddings)]
+    else:
+        datasets = [make_embeddings(terms) for terms in args.terms]
+    print(f"{'termos':>10}{'tabelas':>9}{'exata (s)':>12}{'LSH (s)':>10}{'pares':>12}{'recall':>9}")
+    for vectors in datasets:
+        n = len(vectors)
+        exact, exact_time = timed(lambda v=vectors: cosine_neighbors(v, args.threshold, args.k))
+        for tables in args.tables:
+            approx, lsh_time = timed(
+                lambda v=vectors, t=tables: lsh_cosine_neighbors(
+                    v, args.threshold, args.k, n_tables=t
+                )
+            )
+            print(
+                f"{n:>10,}{tables:>9}{exact_time:>12.2f}{lsh_time:>10.2f}"
+                f"{len(exact[0]):>12,}{recall(exact, approx, n):>9.4f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,14 +12,50 @@
 # ============================================================================
 MAX_ROWS: Final[int] = 10_000_000  # Limite de linhas para processar
 MAX_FILE_SIZE_MB: Final[int] = 1000  # Limite de 1GB
+STREAM_CHUNKSIZE: Final[int] = 200_000  # Linhas por bloco na análise em fluxo
+EXCEL_CHUNKSIZE: Final[int] = 50_000  # Linhas por bloco na leitura de XLSX
+CSV_BACKEND: Final[str] = "auto"  # Leitor CSV: "pandas", "pyarrow" ou "auto" (pyarrow se instalado)
+CSV_SNIFF_BYTES: Final[int] = (
+    64 * 1024
+)  # Bytes por amostra (início, meio e fim) na detecção do dialeto CSV
+COERCE_TYPES: Final[bool] = True  # Converte texto com números/datas pt-BR após o carregamento
+COERCION_SAMPLE_SIZE: Final[int] = 1_000  # Valores amostrados por coluna para decidir o formato
+VALUE_TYPE_SAMPLE_SIZE: Final[int] = (
+    200  # Valores amostrados por coluna para inferir o tipo pelo conteúdo
+)
+VALUE_TYPE_MIN_MATCH: Final[float] = 0.9  # Fração da amostra que precisa seguir o padrão do tipo
+HLL_PRECISION: Final[int] = 14  # Registradores 2**p do HyperLogLog (erro ~1.04/sqrt(2**p) = 0,8%)
+UNIQUE_CHECK_BLOCK: Final[int] = 65_536  # Primeiro bloco da verificação de unicidade por prefixos
+PROFILE_SAMPLE_SIZE: Final[int] = 100  # Valores guardados na amostra do perfil de cada coluna
+COMPOSITE_KEY_MAX_COLUMNS: Final[int] = 3  # Colunas por chave composta (natural) na busca
+COMPOSITE_KEY_MAX_CANDIDATES: Final[int] = 12  # Colunas consideradas para compor a chave
+COMPOSITE_KEY_TIME_BUDGET: Final[float] = 2.0  # Segundos máximos da busca por chave composta
+OPTIMIZE_DTYPES: Final[bool] = True  # Compacta os tipos das colunas após o carregamento
+CATEGORY_MAX_RATIO: Final[float] = 0.5  # Texto com distintos/valores até isso vira category
 
 # ============================================================================
 # Configurações de análise
 # ============================================================================
 FUZZY_THRESHOLD: Final[int] = 88  # Limiar de similaridade fuzzy (0-100)
+# Blocagem (geração de candidatos) do agrupamento fuzzy: recall x velocidade
+FUZZY_BLOCKING_MIN_TERMS: Final[int] = 20_000  # Acima disso usa blocagem em vez de matriz densa
+FUZZY_NGRAM_SIZE: Final[int] = 3  # Tamanho dos n-gramas de caracteres do índice invertido
+FUZZY_PREFIX_NGRAMS: Final[int] = 4  # N-gramas mais raros indexados por termo (+ = mais recall)
+FUZZY_MAX_POSTING: Final[int] = 1_000  # N-gramas presentes em mais termos são ignorados
+FUZZY_MAX_CANDIDATES: Final[int] = 50  # Pares do índice invertido por termo, em média
+FUZZY_SORTED_WINDOW: Final[int] = 5  # Janela da vizinhança ordenada (+ = mais recall)
 SEMANTIC_THRESHOLD: Final[float] = 0.8  # Limiar de similaridade semântica (0-1)
-MAX_TERMS_FUZZY: Final[int] = 500  # Máximo de termos para análise fuzzy
+# Busca aproximada de vizinhos (LSH) do agrupamento semântico: recall x velocidade
+SEMANTIC_ANN_MIN_TERMS: Final[int] = 50_000  # Acima disso usa LSH em vez de produtos densos
+SEMANTIC_NEIGHBORS: Final[int] = 10  # Vizinhos mais próximos mantidos por termo na busca LSH
+SEMANTIC_LSH_TABLES: Final[int] = 16  # Tabelas de hiperplanos aleatórios (+ = mais recall)
+SEMANTIC_LSH_BUCKET: Final[int] = 256  # Termos comparados por bloco dentro de um balde
+MAX_TERMS_FUZZY: Final[int] = 1_500_000  # Máximo de termos fuzzy (1,7 mi medidos: ~1,3 GB)
+FUZZY_WORKERS: Final[int] = -1  # Threads do rapidfuzz.cdist (-1 = todos os núcleos)
+FUZZY_BLOCK_MEMORY_MB: Final[int] = 64  # Memória máxima por bloco da matriz de similaridade
 MAX_TOP_CATEGORIES: Final[int] = 100  # Máximo de categorias top exibidas
+INDICATOR_WORKERS: Final[int] = 1  # Processos por análise de colunas (1 = serial, 0 = todos)
+SHEET_WORKERS: Final[int] = 4  # Abas analisadas em paralelo (limita o pico de memória; 0 = todos)
 
 # ============================================================================
 # Stopwords padrão (português)
@@ -84,6 +120,22 @@
 OUTPUT_DIR: Final[Path] = BASE_DIR / "output"
 LOGS_DIR: Final[Path] = BASE_DIR / "logs"
 
+# ============================================================================
+# Cache de planilhas carregadas (Arrow IPC, requer pyarrow)
+# ============================================================================
+CACHE_ENABLED: Final[bool] = True
+CACHE_DIR: Final[Path] = OUTPUT_DIR / "cache"
+CACHE_MAX_SIZE_MB: Final[int] = 2048  # Entradas mais antigas são removidas acima disso
+
+# ============================================================================
+# Dicionário de sinônimos (tipos de coluna pelo cabeçalho)
+# ============================================================================
+SYNONYMS_FILE: Final[Path] = BASE_DIR / "analysis" / "data" / "domain_synonyms.json"
+USER_SYNONYMS_DIR: Final[Path] = BASE_DIR / "config" / "sinonimos"  # *.json mesclados ao padrão
+HEADER_FUZZY_THRESHOLD: Final[int] = 85  # Similaridade mínima (0-100) na etapa aproximada
+HEADER_FUZZY_MIN_LENGTH: Final[int] = 4  # Prefixos, palavras e sinônimos mais curtos são fracos
+VALUE_TAG_MIN_LENGTH: Final[int] = 3  # Sinônimos mais curtos ("r", "al") não marcam valores
+
 # ============================================================================
 # Servidor web (Dash)
 # ============================================================================
@@ -95,6 +147,9 @@
 # Modelos NLP
 # ============================================================================
 EMBEDDING_MODEL: Final[str] = "paraphrase-multilingual-MiniLM-L12-v2"
+EMBEDDING_DEVICE: Final[str | None] = None  # "cpu", "cuda"... (None = escolha automática)
+EMBEDDING_THREADS: Final[int] = 0  # Threads do torch na inferência (0 = padrão do torch)
+EMBEDDING_WARMUP: Final[bool] = False  # Carrega o modelo em segundo plano ao abrir a interface
 
 # ============================================================================
 # Formatos suportados
@@ -0,0 +1,159 @@
+# core/cache.py
+"""
+Cache em disco de DataFrames já carregados e limpos.
+
+Cada entrada é um arquivo Arrow IPC (sem compressão, para leitura por
+memory-map) identificado pela impressão digital do arquivo de origem
+(hash de amostras do conteúdo + tamanho + mtime) e pelas configurações do
+carregador. O diretório é limitado em tamanho com despejo LRU.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from config.settings import CACHE_DIR, CACHE_MAX_SIZE_MB
+from core.logging_config import get_logger
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc as pa_ipc
+except ImportError:  # pragma: no cover - dependência opcional
+    pa = None
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+logger = get_logger("cache")
+
+# Blocos lidos do início, meio e fim do arquivo para compor o hash
+_SAMPLE_BYTES = 1024 * 1024
+_SUFFIX = ".arrow"
+
+
+def is_available() -> bool:
+    """Indica se o cache pode ser usado (requer ``pyarrow``)."""
+    return pa is not None
+
+
+def file_fingerprint(file_path: str | Path) -> str:
+    """
+    Calcula a impressão digital de um arquivo sem lê-lo por inteiro.
+
+    Combina tamanho, mtime e o hash de blocos do início, meio e fim do
+    conteúdo; arquivos pequenos são lidos completos.
+    """
+    path = Path(file_path)
+    stat = path.stat()
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{stat.st_size}:{stat.st_mtime_ns}".encode())
+    with path.open("rb") as f:
+        if stat.st_size <= 3 * _SAMPLE_BYTES:
+            digest.update(f.read())
+        else:
+            for offset in (0, stat.st_size // 2, stat.st_size - _SAMPLE_BYTES):
+                f.seek(offset)
+                digest.update(f.read(_SAMPLE_BYTES))
+    return digest.hexdigest()
+
+
+def cache_key(file_path: str | Path, settings: dict) -> str:
+    """Chave do cache: impressão digital do arquivo + configurações do carregador."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(file_fingerprint(file_path).encode())
+    digest.update(json.dumps(settings, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _resolve_dir(cache_dir: str | Path | None) -> Path:
+    return Path(cache_dir) if cache_dir is not None else CACHE_DIR
+
+
+def load_cached(key: str, cache_dir: str | Path | None = None) -> pd.DataFrame | None:
+    """Lê uma entrada do cache por memory-map; retorna None se não existir."""
+    if pa is None:
+        return None
+    entry = _resolve_dir(cache_dir) / f"{key}{_SUFFIX}"
+    if not entry.exists():
+        return None
+    try:
+        # O arquivo é mapeado em memória; to_pandas copia os buffers para que o
+        # DataFrame devolvido continue gravável como o de uma leitura normal
+        with pa.memory_map(str(entry), "r") as source:
+            df = pa_ipc.open_file(source).read_all().to_pandas()
+    except (OSError, pa.ArrowException) as e:
+        logger.warning(f"Entrada de cache inválida descartada: {entry.name} ({e})")
+        entry.unlink(missing_ok=True)
+        return None
+    # Atualiza o mtime para a política LRU
+    os.utime(entry)
+    logger.debug(f"Cache encontrado: {entry.name}")
+    return df
+
+
+def store_cached(
+    key: str,
+    df: pd.DataFrame,
+    cache_dir: str | Path | None = None,
+    max_size_mb: int = CACHE_MAX_SIZE_MB,
+) -> bool:
+    """
+    Grava o DataFrame no cache e aplica o limite de tamanho.
+
+    Returns:
+        True se a entrada foi gravada; False se o DataFrame não é
+        representável em Arrow ou se ``pyarrow`` não está instalado.
+    """
+    if pa is None:
+        return False
+    if not all(isinstance(c, str) for c in df.columns):
+        logger.debug("Cache ignorado: nomes de coluna não textuais")
+        return False
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError) as e:
+        logger.debug(f"Cache ignorado: DataFrame não representável em Arrow ({e})")
+        return False
+
+    directory = _resolve_dir(cache_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    entry = directory / f"{key}{_SUFFIX}"
+    tmp = entry.with_suffix(".tmp")
+    with pa.OSFile(str(tmp), "wb") as sink, pa_ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    tmp.replace(entry)
+    logger.debug(f"Cache gravado: {entry.name} ({entry.stat().st_size / 1024 / 1024:.1f} MB)")
+    evict(directory, max_size_mb)
+    return True
+
+
+def evict(cache_dir: str | Path | None = None, max_size_mb: int = CACHE_MAX_SIZE_MB) -> int:
+    """
+    Remove as entradas usadas há mais tempo até o cache caber no limite.
+
+    Returns:
+        Número de entradas removidas.
+    """
+    directory = _resolve_dir(cache_dir)
+    if not directory.exists():
+        return 0
+    entries = sorted(directory.glob(f"*{_SUFFIX}"), key=lambda p: p.stat().st_mtime)
+    total = sum(p.stat().st_size for p in entries)
+    limit = max_size_mb * 1024 * 1024
+    removed = 0
+    for entry in entries:
+        if total <= limit:
+            break
+        total -= entry.stat().st_size
+        entry.unlink(missing_ok=True)
+        removed += 1
+    if removed:
+        logger.info(f"Cache: {removed} entradas antigas removidas")
+    return removed
@@ -0,0 +1,203 @@
+# core/coercion.py
+"""
+Conversão de colunas de texto em números (formato brasileiro) e datas.
+
+Planilhas exportadas no Brasil costumam trazer ``1.234,56``, ``R$ 10,00``,
+``12,5%`` e ``31/12/2024`` como texto; os formatos de data aceitos são os de
+``core.dates.DATE_FORMATS``. Cada coluna de texto tem o formato
+decidido numa amostra de valores; a coluna inteira só é convertida quando
+toda a amostra concorda. A conversão é vetorizada e feita uma vez por valor
+distinto, e o formato escolhido fica registrado para ser reaproveitado (por
+exemplo, nos blocos seguintes da leitura em fluxo).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from config.settings import COERCION_SAMPLE_SIZE
+from core.dates import infer_date_formats, parse_date_texts
+from core.dtypes import distinct_texts, is_text_column, sample_texts
+from core.logging_config import get_logger
+
+logger = get_logger("coercion")
+
+# Número brasileiro: milhar com ponto, decimal com vírgula; zeros à esquerda
+# (códigos, CEPs) não são números
+_NUMBER = r"[+-]?(?!0\d)(?:\d{1,3}(?:\.\d{3})+|\d+)(?:,\d+)?"
+_CURRENCY_PREFIX = r"^([+-]?)\s*R\$\s*"
+
+
+@dataclass(frozen=True)
+class ColumnFormat:
+    """Formato detectado de uma coluna de texto."""
+
+    kind: str  # "numero", "percentual", "moeda" ou "data"
+    date_format: str | None = None
+
+
+def _number_parts(texts: pd.Series) -> tuple[pd.Series, pd.Series, pd.Series]:
+    """Separa prefixo ``R$`` e sufixo ``%``; retorna (número, moeda, percentual)."""
+    currency = texts.str.match(_CURRENCY_PREFIX)
+    percent = texts.str.endswith("%")
+    number = (
+        texts.str.replace(_CURRENCY_PREFIX, r"\1", regex=True).str.removesuffix("%").str.strip()
+    )
+    return number, currency, percent
+
+
+def _detect_numbers(
+    texts: pd.Series, codes: np.ndarray, n_samples: int
+) -> list[ColumnFormat | None]:
+    """Formato numérico de cada amostra (todos os textos precisam ser números)."""
+    number, currency, percent = _number_parts(texts)
+
+    def count(mask) -> np.ndarray:
+        return np.bincount(codes, weights=np.asarray(mask, dtype=bool), minlength=n_samples)
+
+    counts = np.bincount(codes, minlength=n_samples)
+    numbers = count(number.str.fullmatch(_NUMBER)) == counts
+    currencies = count(currency) > 0
+    percents = count(percent) > 0
+    # Só dígitos não basta: provavelmente são códigos guardados como texto
+    separators = count(number.str.contains(r"[.,]")) > 0
+    formats: list[ColumnFormat | None] = [None] * n_samples
+    for i in np.flatnonzero(numbers & (counts > 0)):
+        if currencies[i] and percents[i]:
+            continue
+        if currencies[i]:
+            formats[i] = ColumnFormat("moeda")
+        elif percents[i]:
+            formats[i] = ColumnFormat("percentual")
+        elif separators[i]:
+            formats[i] = ColumnFormat("numero")
+    return formats
+
+
+def detect_format(
+    series: pd.Series, sample_size: int = COERCION_SAMPLE_SIZE
+) -> ColumnFormat | None:
+    """
+    Detecta se uma coluna de texto guarda números ou datas no formato brasileiro.
+
+    Examina até ``sample_size`` valores espalhados pela coluna; retorna None
+    se a coluna não for de texto ou se algum valor da amostra não seguir o
+    mesmo formato.
+    """
+    if not is_text_column(series):
+        return None
+    sample = sample_texts(series, sample_size)
+    if sample.empty:
+        return None
+    return detect_sample_format(sample)
+
+
+def detect_sample_format(sample: pd.Series) -> ColumnFormat | None:
+    """Formato seguido por todos os textos de uma amostra (``sample_texts``), ou None."""
+    return detect_sample_formats(sample, np.zeros(len(sample), dtype=np.intp), 1)[0]
+
+
+def detect_sample_formats(
+    texts: pd.Series, codes: np.ndarray, n_samples: int
+) -> list[ColumnFormat | None]:
+    """
+    ``detect_sample_format`` para várias amostras juntas (uma passada por verificação).
+
+    ``codes`` indica a amostra (0 a ``n_samples - 1``) de cada texto.
+    """
+    formats = _detect_numbers(texts, codes, n_samples)
+    undecided = np.array([fmt is None for fmt in formats])
+    rows = undecided[codes]
+    date_formats = infer_date_formats(texts[rows], codes[rows], n_samples)
+    for i in np.flatnonzero(undecided):
+        if date_formats[i] is not None:
+            formats[i] = ColumnFormat("data", date_formats[i])
+    return formats
+
+
+def apply_format(series: pd.Series, fmt: ColumnFormat, *, strict: bool = True) -> pd.Series | None:
+    """
+    Converte a coluna inteira segundo ``fmt``.
+
+    Percentuais mantêm o número escrito (``12,5%`` vira 12.5). Com ``strict``
+    retorna None se algum valor preenchido não puder ser convertido; sem
+    ``strict`` esses valores viram ausentes.
+    """
+    if not is_text_column(series):
+        # Blocos em que o leitor já inferiu o tipo (por exemplo, só inteiros)
+        if fmt.kind == "data":
+            return pd.to_datetime(series, errors="coerce")
+        return pd.to_numeric(series, errors="coerce").astype(np.float64)
+
+    codes, texts = distinct_texts(series)
+    if fmt.kind == "data":
+        converted = parse_date_texts(texts, fmt.date_format)
+        missing = np.datetime64("NaT", "ns")
+    else:
+        number, _, _ = _number_parts(texts)
+        valid = number.str.fullmatch(_NUMBER)
+        plain = number.where(valid).str.replace(".", "", regex=False).str.replace(",", ".")
+        converted = pd.to_numeric(plain, errors="coerce").astype(np.float64)
+        missing = np.nan
+
+    # Texto vazio (célula só com espaços) conta como ausente, não como falha
+    failed = int((converted.isna() & (texts != "")).sum())
+    if failed:
+        if strict:
+            return None
+        logger.warning(f"Coluna '{series.name}': {failed} valores fora do formato viraram ausentes")
+
+    # Código -1 (ausente) aponta para o valor ausente no fim do vetor
+    values = np.append(converted.to_numpy(), np.array([missing], dtype=converted.dtype))
+    return pd.Series(values[codes], index=series.index, name=series.name)
+
+
+def coerce_columns(
+    df: pd.DataFrame,
+    formats: dict | None = None,
+    *,
+    sample_size: int = COERCION_SAMPLE_SIZE,
+) -> pd.DataFrame:
+    """
+    Converte as colunas de texto com números ou datas no formato brasileiro.
+
+    ``formats`` guarda o formato decidido por coluna (``ColumnFormat`` ou
+    None quando a coluna fica como texto). Colunas já presentes nele não são
+    detectadas de novo e são convertidas sem ``strict``; as demais são
+    detectadas, convertidas por inteiro e registradas. Passe o mesmo
+    dicionário a blocos consecutivos de uma tabela para decidir uma só vez.
+    """
+    if formats is None:
+        formats = {}
+    columns = {}
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series, pd.DataFrame):
+            # Nomes de coluna duplicados: mantém como está
+            continue
+        if col in formats:
+            fmt = formats[col]
+            converted = apply_format(series, fmt, strict=False) if fmt else None
+        else:
+            fmt = detect_format(series, sample_size)
+            converted = apply_format(series, fmt) if fmt else None
+            formats[col] = fmt if converted is not None else None
+            if fmt and converted is None:
+                logger.debug(
+                    f"Coluna '{col}': amostra em formato {fmt.kind}, mas não a coluna toda"
+                )
+        if converted is not None:
+            columns[col] = converted
+
+    if not columns:
+        return df
+    df = df.copy()
+    for col, converted in columns.items():
+        df[col] = converted
+    logger.info(
+        "Colunas convertidas: " + ", ".join(f"{col} ({formats[col].kind})" for col in columns)
+    )
+    return df
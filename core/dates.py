@@ -0,0 +1,106 @@
+# core/dates.py
+"""
+Conversão de colunas de texto em datas, compartilhada por carregador e análise.
+
+O formato é inferido numa amostra da coluna; em seguida só os valores
+distintos são convertidos e o resultado é expandido pelos códigos de
+``pd.factorize``. Colunas já convertidas (``datetime64``) voltam como estão,
+então uma coluna convertida no carregamento não é processada de novo pelos
+indicadores.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from config.settings import COERCION_SAMPLE_SIZE
+from core.dtypes import distinct_texts, is_text_column, sample_texts
+
+# Formatos reconhecidos (formato strptime -> forma do texto), em ordem de teste
+DATE_FORMATS: dict[str, str] = {
+    "%Y-%m-%d": r"\d{4}-\d{2}-\d{2}",
+    "%Y-%m-%d %H:%M:%S": r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}",
+    "%Y-%m-%dT%H:%M:%S": r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}",
+    "%d/%m/%Y": r"\d{1,2}/\d{1,2}/\d{4}",
+    "%d/%m/%Y %H:%M": r"\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}",
+    "%d/%m/%Y %H:%M:%S": r"\d{1,2}/\d{1,2}/\d{4} \d{1,2}:\d{2}:\d{2}",
+    "%d-%m-%Y": r"\d{1,2}-\d{1,2}-\d{4}",
+    "%d/%m/%y": r"\d{1,2}/\d{1,2}/\d{2}",
+}
+
+# Fração mínima da amostra no formato para ``parse_dates`` adotá-lo
+_MIN_VALID = 0.9
+
+
+def infer_date_format(texts: pd.Series, min_valid: float = 1.0) -> str | None:
+    """
+    Primeiro formato de ``DATE_FORMATS`` seguido por ao menos ``min_valid`` da amostra.
+
+    Além da forma do texto, confere dias e meses válidos (descarta, por
+    exemplo, mm/dd/aaaa). Retorna None se nenhum formato servir.
+    """
+    return infer_date_formats(texts, np.zeros(len(texts), dtype=np.intp), 1, min_valid)[0]
+
+
+def infer_date_formats(
+    texts: pd.Series, codes: np.ndarray, n_samples: int, min_valid: float = 1.0
+) -> list[str | None]:
+    """
+    ``infer_date_format`` para várias amostras juntas, uma passada por formato.
+
+    ``codes`` indica a amostra (0 a ``n_samples - 1``) de cada texto.
+    """
+    counts = np.bincount(codes, minlength=n_samples)
+    formats: list[str | None] = [None] * n_samples
+    pending = counts > 0
+    for date_format, pattern in DATE_FORMATS.items():
+        if not pending.any():
+            break
+        rows = pending[codes]
+        matches = np.zeros(len(texts), dtype=bool)
+        matches[rows] = texts[rows].str.fullmatch(pattern).to_numpy(dtype=bool)
+        shares = np.bincount(codes, weights=matches, minlength=n_samples) / np.maximum(counts, 1)
+        candidates = pending & (shares >= min_valid)
+        if not candidates.any():
+            continue
+        rows = matches & candidates[codes]
+        parsed = pd.to_datetime(texts[rows], format=date_format, errors="coerce").notna()
+        valid = np.bincount(codes[rows], weights=parsed.to_numpy(), minlength=n_samples)
+        for i in np.flatnonzero(candidates & (valid >= min_valid * counts)):
+            formats[i] = date_format
+            pending[i] = False
+    return formats
+
+
+def parse_date_texts(texts: pd.Series, date_format: str | None) -> pd.Series:
+    """Converte textos (em geral, os valores distintos de uma coluna); inválidos viram NaT."""
+    return pd.to_datetime(texts, format=date_format, errors="coerce")
+
+
+def parse_dates(
+    series: pd.Series,
+    date_format: str | None = None,
+    *,
+    sample_size: int = COERCION_SAMPLE_SIZE,
+) -> pd.Series:
+    """
+    Converte uma coluna em datas, uma vez por valor distinto.
+
+    Sem ``date_format`` o formato é inferido numa amostra de ``sample_size``
+    valores (tolerando até 10% de valores inválidos); se nenhum formato
+    conhecido servir, o pandas infere a partir do primeiro valor, como
+    ``pd.to_datetime``. Valores inválidos viram NaT.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series.dtype):
+        return series
+    if not is_text_column(series):
+        return pd.to_datetime(series, errors="coerce")
+
+    if date_format is None:
+        date_format = infer_date_format(sample_texts(series, sample_size), _MIN_VALID)
+    codes, texts = distinct_texts(series)
+    parsed = pd.Index(parse_date_texts(texts, date_format))
+    # Código -1 (ausente) vira NaT
+    values = parsed.take(codes, allow_fill=True, fill_value=pd.NaT)
+    return pd.Series(values, index=series.index, name=series.name)
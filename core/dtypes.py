@@ -0,0 +1,183 @@
+# core/dtypes.py
+"""
+Compactação dos tipos de coluna após o carregamento.
+
+Texto de baixa cardinalidade vira ``category``; o restante do texto vira
+``string[pyarrow]`` (com NaN como ausente, como nas colunas ``object``).
+Inteiros são reduzidos ao menor tipo que guarda os valores sem perda.
+Floats continuam float64: em float32 o pandas soma e tira médias em
+precisão simples, o que mudaria as estatísticas dos indicadores. Colunas de
+tipos mistos ficam como estão.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from config.settings import CATEGORY_MAX_RATIO
+from core.logging_config import get_logger
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:  # pragma: no cover - dependência opcional
+    ARROW_STRING = None
+else:
+    try:
+        ARROW_STRING = pd.StringDtype("pyarrow", na_value=np.nan)
+    except TypeError:  # pragma: no cover - pandas < 2.3
+        ARROW_STRING = pd.StringDtype("pyarrow")
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger("dtypes")
+
+
+def is_text_column(series: pd.Series) -> bool:
+    """Indica se a coluna guarda texto (``object``, ``string`` ou ``category``)."""
+    dtype = series.dtype
+    return (
+        pd.api.types.is_object_dtype(dtype)
+        or pd.api.types.is_string_dtype(dtype)
+        or isinstance(dtype, pd.CategoricalDtype)
+    )
+
+
+def text_lengths(series: pd.Series) -> pd.Series:
+    """Comprimento do texto de cada valor, sem converter colunas ``string`` para objeto."""
+    if isinstance(series.dtype, pd.StringDtype):
+        return series.str.len()
+    return series.astype(str).str.len()
+
+
+def sample_texts(series: pd.Series, size: int) -> pd.Series:
+    """Até ``size`` valores preenchidos espalhados pela coluna, como texto sem espaços nas pontas."""
+    values = series.dropna()
+    if len(values) > size:
+        values = values.iloc[np.linspace(0, len(values) - 1, size).astype(np.intp)]
+    texts = values.astype(str).str.strip()
+    return texts[texts != ""]
+
+
+def distinct_texts(series: pd.Series) -> tuple[np.ndarray, pd.Series]:
+    """
+    Códigos por linha (``pd.factorize``) e valores distintos como texto sem espaços nas pontas.
+
+    Ausentes recebem o código -1 e não aparecem entre os valores distintos.
+    """
+    codes, uniques = pd.factorize(series)
+    texts = pd.Series(np.asarray(uniques, dtype=object), dtype=object).astype(str).str.strip()
+    return codes, texts
+
+
+def map_values(series: pd.Series, func: Callable) -> pd.Series:
+    """
+    Aplica ``func`` uma vez por valor distinto, preservando o tipo compacto.
+
+    Colunas ``category`` continuam categóricas e colunas ``string`` mantêm o
+    tipo; ausentes continuam ausentes.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        mapped_codes, categories = pd.factorize(
+            pd.Index([func(v) for v in series.cat.categories], dtype=object)
+        )
+        codes = series.cat.codes.to_numpy()
+        new_codes = np.where(codes >= 0, mapped_codes[codes], -1)
+        return pd.Series(
+            pd.Categorical.from_codes(new_codes, categories=categories),
+            index=series.index,
+            name=series.name,
+        )
+    codes, uniques = pd.factorize(series)
+    # Código -1 (ausente) aponta para o NaN no fim do vetor
+    mapped = np.array([func(v) for v in uniques] + [np.nan], dtype=object)
+    dtype = series.dtype if isinstance(series.dtype, pd.StringDtype) else None
+    return pd.Series(mapped[codes], index=series.index, name=series.name, dtype=dtype)
+
+
+def plain_values(series: pd.Series) -> pd.Series:
+    """Converte ``category`` para o tipo das categorias (para combinar blocos)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(series.cat.categories.dtype)
+    return series
+
+
+def _compact_numeric(series: pd.Series) -> pd.Series:
+    kind = series.dtype.kind
+    if kind == "i":
+        return pd.to_numeric(series, downcast="integer")
+    if kind == "u":
+        return pd.to_numeric(series, downcast="unsigned")
+    return series
+
+
+def _compact_text(series: pd.Series, category_ratio: float) -> pd.Series:
+    values = series.dropna()
+    if values.empty or pd.api.types.infer_dtype(values, skipna=False) != "string":
+        return series
+    if values.nunique() <= category_ratio * len(values):
+        return series.astype("category")
+    if ARROW_STRING is not None:
+        return series.astype(ARROW_STRING)
+    return series
+
+
+def optimize_dtypes(
+    df: pd.DataFrame,
+    *,
+    category_ratio: float = CATEGORY_MAX_RATIO,
+    report: dict | None = None,
+) -> pd.DataFrame:
+    """
+    Retorna o DataFrame com tipos compactos.
+
+    Colunas de texto com até ``category_ratio`` valores distintos por valor
+    preenchido viram ``category``. Em ``report`` (quando informado) cada
+    coluna alterada recebe ``tipo_original``, ``tipo``, ``bytes_antes`` e
+    ``bytes_depois``; o total economizado é registrado no log.
+    """
+    columns = {}
+    saved = 0
+    for col in df.columns:
+        series = df[col]
+        if isinstance(series, pd.DataFrame):
+            # Nomes de coluna duplicados: mantém como está
+            continue
+        if pd.api.types.is_bool_dtype(series.dtype):
+            continue
+        if pd.api.types.is_numeric_dtype(series.dtype) and isinstance(series.dtype, np.dtype):
+            compact = _compact_numeric(series)
+        elif pd.api.types.is_object_dtype(series.dtype) or isinstance(series.dtype, pd.StringDtype):
+            compact = _compact_text(series, category_ratio)
+        else:
+            continue
+        if compact.dtype == series.dtype:
+            continue
+        before = series.memory_usage(deep=True, index=False)
+        after = compact.memory_usage(deep=True, index=False)
+        logger.debug(
+            f"Coluna '{col}': {series.dtype} -> {compact.dtype} "
+            f"({before / 1024:.0f} KB -> {after / 1024:.0f} KB)"
+        )
+        if report is not None:
+            report[col] = {
+                "tipo_original": str(series.dtype),
+                "tipo": str(compact.dtype),
+                "bytes_antes": int(before),
+                "bytes_depois": int(after),
+            }
+        saved += before - after
+        columns[col] = compact
+
+    if not columns:
+        return df
+    df = df.copy()
+    for col, compact in columns.items():
+        df[col] = compact
+    logger.info(
+        f"Tipos compactados em {len(columns)} colunas: {saved / 1024 / 1024:.1f} MB a menos"
+    )
+    return df
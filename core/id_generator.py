@@ -1,10 +1,24 @@
 # core/id_generator.py
 """Funções para detecção e garantia de colunas de identificação única."""
 
-import uuid
+import math
+import time
+from itertools import combinations
 
+import numpy as np
 import pandas as pd
 
+from config.settings import (
+    COMPOSITE_KEY_MAX_CANDIDATES,
+    COMPOSITE_KEY_MAX_COLUMNS,
+    COMPOSITE_KEY_TIME_BUDGET,
+)
+from core.logging_config import get_logger
+from core.profile import column_profile, distinct_estimate, is_unique_column
+from core.sketch import has_duplicates, hash_rows, hash_values
+
+logger = get_logger("id_generator")
+
 # Padrões de nomes que indicam colunas de ID
 ID_COLUMN_PATTERNS = [
     "id",
@@ -42,6 +56,33 @@
     "hash",
 ]
 
+# Coluna criada quando a tabela não tem ID nativo (número da linha, a partir de 1)
+SYNTHETIC_ID_COLUMN = "_synthetic_id"
+# Coluna criada a partir de uma chave composta da tabela (impressão digital int64)
+COMPOSITE_ID_COLUMN = "_composite_id"
+
+
+def synthetic_ids(length: int, start: int = 1) -> np.ndarray:
+    """
+    IDs sintéticos ``start, start + 1, ...`` em int64 (8 bytes por linha).
+
+    Os números só viram texto na exportação (coluna ``ids`` das tabelas de
+    indicadores), então interface, indicadores e painel usam os mesmos IDs.
+    """
+    return np.arange(start, start + length, dtype=np.int64)
+
+
+def _has_id_name(col) -> bool:
+    """Indica se o nome da coluna segue um dos ``ID_COLUMN_PATTERNS``."""
+    col_lower = str(col).lower().strip()
+    col_clean = col_lower.replace("_", "").replace("-", "").replace(" ", "")
+    return any(
+        col_clean == pattern
+        or col_lower.startswith(pattern + "_")
+        or col_lower.endswith("_" + pattern)
+        for pattern in ID_COLUMN_PATTERNS
+    )
+
 
 def detect_native_id_column(df: pd.DataFrame) -> str | None:
     """
@@ -57,34 +98,112 @@ def detect_native_id_column(df: pd.DataFrame) -> str | None:
     """
     if df.empty:
         return None
+    # O ID sintético não é nativo
+    columns = [c for c in df.columns if c != SYNTHETIC_ID_COLUMN]
 
     # 1. Busca por nome de coluna que indica ID
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        col_clean = col_lower.replace("_", "").replace("-", "").replace(" ", "")
-
-        for pattern in ID_COLUMN_PATTERNS:
-            if (
-                col_clean == pattern
-                or col_lower.startswith(pattern + "_")
-                or col_lower.endswith("_" + pattern)
-            ):
-                # Verifica se é realmente única ou quase única (>95%)
-                uniqueness = df[col].nunique() / len(df) if len(df) > 0 else 0
-                if uniqueness >= 0.95:
-                    return col
+    for col in columns:
+        # Verifica se é realmente única ou quase única (>95%): a unicidade
+        # para no primeiro repetido e a estimativa descarta as colunas
+        # claramente repetidas; só as finalistas têm contagem exata. O atalho
+        # da unicidade vale só sem ausentes (que contam como valor nela, mas
+        # não na cobertura de 95%)
+        if _has_id_name(col) and (
+            (not df[col].hasnans and is_unique_column(df, col))
+            or (
+                distinct_estimate(df, col, sketch=False).upper >= 0.95 * len(df)
+                and distinct_estimate(df, col).upper >= 0.95 * len(df)
+                and column_profile(df, col).uniqueness >= 0.95
+            )
+        ):
+            return col
 
     # 2. Busca coluna com 100% valores únicos (primeira encontrada)
-    for col in df.columns:
-        if df[col].is_unique and not df[col].isna().any():
+    for col in columns:
+        # Para no primeiro valor repetido; só as finalistas têm perfil completo
+        if is_unique_column(df, col) and not df[col].hasnans:
             # Prefere colunas numéricas ou strings curtas
             if pd.api.types.is_numeric_dtype(df[col]):
                 return col
-            if df[col].dtype == "object":
-                avg_len = df[col].astype(str).str.len().mean()
-                if avg_len < 50:  # Provavelmente um ID, não um texto longo
-                    return col
+            mean_length = column_profile(df, col).mean_length
+            if mean_length is not None and mean_length < 50:
+                # Provavelmente um ID, não um texto longo
+                return col
+
+    return None
+
+
+def _key_candidates(df: pd.DataFrame, max_candidates: int) -> list:
+    """Colunas que podem compor uma chave, das mais promissoras às menos."""
+    ranked = []
+    for col in df.columns:
+        if col in (SYNTHETIC_ID_COLUMN, COMPOSITE_ID_COLUMN):
+            continue
+        series = df[col]
+        # Medidas (float) e colunas com ausentes não servem de chave
+        if series.dtype.kind == "f" or series.hasnans:
+            continue
+        distinct = distinct_estimate(df, col, sketch=False)
+        if distinct.upper >= 2:
+            ranked.append((not _has_id_name(col), -distinct.estimate, col))
+    ranked.sort(key=lambda item: item[:2])
+    return [col for *_, col in ranked[:max_candidates]]
+
+
+def composite_key_fingerprint(df: pd.DataFrame, columns: list) -> np.ndarray:
+    """
+    Impressão digital int64 de cada linha a partir das colunas da chave.
+
+    Determinística (não depende da execução): recalculada na planilha de
+    origem, com as mesmas colunas na mesma ordem, permite juntar os
+    resultados aos dados originais.
+    """
+    return hash_rows([hash_values(df[col]) for col in columns]).view(np.int64)
+
+
+def detect_composite_key(
+    df: pd.DataFrame,
+    max_columns: int = COMPOSITE_KEY_MAX_COLUMNS,
+    time_budget: float = COMPOSITE_KEY_TIME_BUDGET,
+) -> list | None:
+    """
+    Procura a menor combinação de colunas que identifica cada linha.
+
+    Combinações de 2 até ``max_columns`` colunas são testadas por tamanho,
+    começando pelas colunas com nome de ID e de maior cardinalidade. As que
+    não podem ser únicas (produto dos limites de valores distintos menor que
+    o número de linhas) são descartadas sem ler a coluna; nas demais, os
+    hashes das colunas são combinados por linha e a unicidade para no
+    primeiro repetido. A busca desiste após ``time_budget`` segundos.
+
+    Returns:
+        Colunas da chave, na ordem do DataFrame, ou None se não encontrada.
+    """
+    if len(df) < 2:
+        return None
+    deadline = time.perf_counter() + time_budget
+    candidates = _key_candidates(df, COMPOSITE_KEY_MAX_CANDIDATES)
+    upper = {col: distinct_estimate(df, col, sketch=False).upper for col in candidates}
+    hashes: dict = {}
 
+    for size in range(2, max_columns + 1):
+        for combo in combinations(candidates, size):
+            if time.perf_counter() > deadline:
+                logger.info("Busca por chave composta interrompida pelo limite de tempo")
+                return None
+            if math.prod(upper[col] for col in combo) < len(df):
+                continue
+            for col in combo:
+                if col not in hashes:
+                    hashes[col] = hash_values(df[col])
+            if has_duplicates(pd.Series(hash_rows([hashes[col] for col in combo]))):
+                continue
+            key = [col for col in df.columns if col in combo]
+            # Hashes distintos garantem linhas distintas, exceto em colunas object
+            # (valores hasheados como texto: 1 e 1.0 diferem)
+            if any(df[col].dtype == object for col in key) and df.duplicated(key).any():
+                continue
+            return key
     return None
 
 
@@ -94,7 +213,10 @@ def ensure_id_column(df: pd.DataFrame) -> pd.DataFrame:
 
     Regras:
     1. Se já existe ID nativo detectado -> usa ele (NÃO cria novo)
-    2. Se não existe ID nativo -> cria "_synthetic_id" com UUID
+    2. Se uma combinação de colunas é única -> cria "_composite_id" com a
+       impressão digital da chave (``composite_key_fingerprint``)
+    3. Senão -> cria "_synthetic_id" com o número da linha
+       (``synthetic_ids``), o mesmo ID usado por ``generate_indicators``
 
     A coluna de ID é retornada como primeira coluna do DataFrame.
     """
@@ -112,9 +234,14 @@ def ensure_id_column(df: pd.DataFrame) -> pd.DataFrame:
         return df
 
     # Só cria ID sintético se realmente não existe ID nativo
-    if "_synthetic_id" not in df.columns and "id" not in df.columns:
+    if SYNTHETIC_ID_COLUMN not in df.columns and "id" not in df.columns:
+        key = detect_composite_key(df)
         df = df.copy()
-        df.insert(0, "_synthetic_id", [str(uuid.uuid4()) for _ in range(len(df))])
+        if key:
+            logger.info(f"Chave composta detectada: {', '.join(map(str, key))}")
+            df.insert(0, COMPOSITE_ID_COLUMN, composite_key_fingerprint(df, key))
+        else:
+            df.insert(0, SYNTHETIC_ID_COLUMN, synthetic_ids(len(df)))
 
     return df
 
@@ -129,8 +256,8 @@ def get_id_column_name(df: pd.DataFrame) -> str:
     native_id = detect_native_id_column(df)
     if native_id:
         return native_id
-    if "_synthetic_id" in df.columns:
-        return "_synthetic_id"
+    if SYNTHETIC_ID_COLUMN in df.columns:
+        return SYNTHETIC_ID_COLUMN
     if "id" in df.columns:
         return "id"
     return df.columns[0]  # Fallback para primeira coluna
@@ -6,18 +6,52 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import codecs
+import csv
+import io
+import mmap
+import os
+import re
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 import chardet
+import numpy as np
+import openpyxl
 import pandas as pd
-
-from config.settings import MAX_FILE_SIZE_MB, SUPPORTED_EXTENSIONS
+from openpyxl.cell.cell import TYPE_ERROR, TYPE_NUMERIC
+from pandas.io.parsers import TextParser
+
+from config.settings import (
+    CACHE_ENABLED,
+    COERCE_TYPES,
+    CSV_BACKEND,
+    CSV_SNIFF_BYTES,
+    EXCEL_CHUNKSIZE,
+    MAX_FILE_SIZE_MB,
+    OPTIMIZE_DTYPES,
+    SUPPORTED_EXTENSIONS,
+)
+from core import cache
+from core.coercion import coerce_columns
+from core.dates import parse_dates
+from core.dtypes import optimize_dtypes
 from core.exceptions import FileLoadError, FileSizeError, UnsupportedFormatError
 from core.logging_config import get_logger
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - dependência opcional
+    pa = None
+
 logger = get_logger("loader")
 
+# Incrementar sempre que a leitura/limpeza mudar, invalidando o cache em disco
+LOADER_CACHE_VERSION = 8
+
 
 def validate_file(file_path: str | Path, max_size_mb: int = MAX_FILE_SIZE_MB) -> Path:
     """
@@ -55,68 +89,681 @@ def validate_file(file_path: str | Path, max_size_mb: int = MAX_FILE_SIZE_MB) ->
     return path
 
 
-def load_and_clean_excel(file_path: str | Path) -> pd.DataFrame:
+def _convert_excel_cell(cell):
+    """Converte uma célula como o leitor openpyxl do pandas (vazia -> "", erro -> NaN)."""
+    if cell.value is None:
+        return ""
+    if cell.data_type == TYPE_ERROR:
+        return np.nan
+    if cell.data_type == TYPE_NUMERIC:
+        value = int(cell.value)
+        return value if value == cell.value else float(cell.value)
+    return cell.value
+
+
+def _convert_excel_row(row) -> list:
+    values = [_convert_excel_cell(cell) for cell in row]
+    while values and values[-1] == "":
+        values.pop()
+    return values
+
+
+def iter_excel_chunks(
+    file_path: str | Path,
+    chunksize: int = EXCEL_CHUNKSIZE,
+    progress_callback: Callable[[int, int | None], None] | None = None,
+    sheet_name: str | None = None,
+) -> Iterator[pd.DataFrame]:
     """
-    Carrega arquivo Excel e realiza limpeza básica:
-    - Remove linhas e colunas vazias
-    - Limpa espaços e caracteres invisíveis em strings
-    - Tenta converter colunas de datas
+    Lê uma planilha XLSX em blocos de linhas, sem materializar a pasta inteira.
+
+    Usa o modo somente-leitura do openpyxl, mantendo em memória apenas
+    ``chunksize`` linhas por vez. Conversão de células, nomes de coluna e
+    inferência de tipos seguem ``pd.read_excel``; linhas vazias no fim da aba
+    são descartadas. Os blocos não passam pela limpeza de
+    ``load_and_clean_excel``.
+
+    Args:
+        file_path: Caminho do arquivo
+        chunksize: Número máximo de linhas por bloco
+        progress_callback: Callback (linhas lidas, total estimado pela dimensão da aba)
+        sheet_name: Aba a ler (padrão: a primeira)
+
+    Yields:
+        DataFrames com índice igual à posição da linha de dados na aba
     """
-    # Carrega com openpyxl (pode gerar warnings ignorados)
-    df = pd.read_excel(file_path, engine="openpyxl")
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook[sheet_name] if sheet_name is not None else workbook.worksheets[0]
+        total = max((sheet.max_row or 0) - 1, 0)
+        rows = sheet.iter_rows()
+        header = next(map(_convert_excel_row, rows), None)
+        if header is None:
+            return
+
+        columns: list = []
+        start = 0
+        buffer: list[list] = []
+
+        def emit() -> pd.DataFrame:
+            nonlocal columns, start, buffer
+            width = max([len(columns) or len(header)] + [len(row) for row in buffer])
+            if not columns:
+                data = [_fit_row(row, width) for row in [header, *buffer]]
+                frame = TextParser(data, header=0, skip_blank_lines=False).read()
+                columns = list(frame.columns)
+            else:
+                # Linhas mais largas que as anteriores ganham colunas sem nome
+                columns.extend(f"Unnamed: {i}" for i in range(len(columns), width))
+                data = [_fit_row(row, width) for row in buffer]
+                frame = TextParser(data, header=None, names=columns, skip_blank_lines=False).read()
+            frame.index = pd.RangeIndex(start, start + len(frame))
+            start += len(frame)
+            buffer = []
+            if progress_callback:
+                progress_callback(start, max(total, start))
+            return frame
+
+        # Linhas vazias só entram no bloco se houver dados depois delas
+        pending_empty: list[list] = []
+        for values in map(_convert_excel_row, rows):
+            if not values:
+                pending_empty.append(values)
+                continue
+            buffer.extend(pending_empty)
+            pending_empty = []
+            buffer.append(values)
+            if len(buffer) >= chunksize:
+                yield emit()
+        if buffer or not columns:
+            yield emit()
+    finally:
+        workbook.close()
+
+
+def _fit_row(row: list, width: int) -> list:
+    return row + [""] * (width - len(row)) if len(row) < width else row
+
+
+def _concat_excel_chunks(chunks: list[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Junta os blocos de ``iter_excel_chunks``.
 
+    Colunas cujo tipo inferido varia entre blocos seguem a inferência sobre a
+    aba inteira feita por ``pd.read_excel``: só numéricos (inteiro, real e
+    lógico, como um inteiro com uma célula vazia num bloco) são promovidos ao
+    tipo numérico comum; mistura de texto e números vira ``object`` com NaN
+    como ausente.
+    """
+    if not chunks:
+        return pd.DataFrame()
+    if len(chunks) == 1:
+        return chunks[0]
+    columns = chunks[-1].columns
+    casts = {}
+    for col in columns:
+        dtypes = {chunk[col].dtype for chunk in chunks if col in chunk.columns}
+        if len(dtypes) > 1:
+            numeric = all(isinstance(t, np.dtype) and t.kind in "biuf" for t in dtypes)
+            casts[col] = np.result_type(*dtypes) if numeric else None
+    if casts:
+        normalized = []
+        for chunk in chunks:
+            fixed = chunk.copy()
+            for col, dtype in casts.items():
+                if col not in fixed.columns:
+                    continue
+                if dtype is not None:
+                    fixed[col] = fixed[col].astype(dtype)
+                else:
+                    fixed[col] = fixed[col].astype(object).where(fixed[col].notna(), np.nan)
+            normalized.append(fixed)
+        chunks = normalized
+    return pd.concat(chunks)
+
+
+def _clean_excel_frame(df: pd.DataFrame, drop_empty_columns: bool = True) -> pd.DataFrame:
+    """Limpeza básica aplicada às planilhas Excel (ver ``load_and_clean_excel``)."""
     # Remove linhas e colunas totalmente vazias
-    df.dropna(axis=0, how="all", inplace=True)
-    df.dropna(axis=1, how="all", inplace=True)
+    df = df.dropna(axis=0, how="all")
+    if drop_empty_columns:
+        df = df.dropna(axis=1, how="all")
 
     # Limpa espaços dos nomes das colunas
-    df.columns = df.columns.str.strip()
+    df.columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
 
-    # Limpa strings nas colunas do tipo object
-    for col in df.select_dtypes(include=["object"]).columns:
-        df[col] = df[col].astype(str).str.strip().str.replace(r"[\x00-\x1F]+", "", regex=True)
+    # Limpa strings nas colunas de texto (ausentes continuam ausentes, não "nan")
+    for col in df.select_dtypes(include=["object", "string"]).columns:
+        values = df[col]
+        cleaned = values.astype(str).str.strip().str.replace(r"[\x00-\x1F]+", "", regex=True)
+        df[col] = cleaned.where(values.notna())
 
     # Tenta converter colunas que parecem datas
     for col in df.columns:
-        if "data" in col.lower() or "date" in col.lower():
-            df[col] = pd.to_datetime(df[col], errors="coerce")
+        if "data" in str(col).lower() or "date" in str(col).lower():
+            df[col] = parse_dates(df[col])
+    return df
+
+
+def load_and_clean_excel(
+    file_path: str | Path,
+    progress_callback: Callable[[int, int | None], None] | None = None,
+    sheet_name: str | None = None,
+) -> pd.DataFrame:
+    """
+    Carrega arquivo Excel e realiza limpeza básica:
+    - Remove linhas e colunas vazias
+    - Limpa espaços e caracteres invisíveis em strings
+    - Tenta converter colunas de datas
+
+    Arquivos XLSX são lidos em blocos (``iter_excel_chunks``), com progresso
+    real por linha; XLS usa ``pd.read_excel``. Sem ``sheet_name`` lê a
+    primeira aba.
+    """
+    if Path(file_path).suffix.lower() == ".xls":
+        df = pd.read_excel(file_path, sheet_name=sheet_name if sheet_name is not None else 0)
+        if progress_callback:
+            progress_callback(len(df), len(df))
+    else:
+        df = _concat_excel_chunks(
+            list(
+                iter_excel_chunks(
+                    file_path,
+                    EXCEL_CHUNKSIZE,
+                    progress_callback=progress_callback,
+                    sheet_name=sheet_name,
+                )
+            )
+        )
+
+    df = _clean_excel_frame(df)
 
     logger.debug(f"Excel carregado: {len(df)} linhas, {len(df.columns)} colunas")
     return df
 
 
+# Delimitadores candidatos, em ordem de preferência nos empates
+_DELIMITERS = (",", ";", "\t", "|", ":")
+_UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+# Números com vírgula decimal (100,50 / 1.234,56) e com ponto decimal (100.50 / 1,234.56)
+_COMMA_DECIMAL = re.compile(r"-?(?:\d{1,3}(?:\.\d{3})+|\d+),\d+")
+_DOT_DECIMAL = re.compile(r"-?(?:\d{1,3}(?:,\d{3})+|\d+)\.\d+")
+_DOT_GROUPED = re.compile(r"-?\d{1,3}(?:\.\d{3})+(?:,\d+)?")
+_COMMA_GROUPED = re.compile(r"-?\d{1,3}(?:,\d{3})+(?:\.\d+)?")
+_NUMBER_LIKE = re.compile(r"-?[\d.,]*\d")
+# Abaixo disso o palpite do chardet é descartado em favor de Windows-1252
+_MIN_CHARDET_CONFIDENCE = 0.5
+
+
+@dataclass(frozen=True)
+class CsvDialect:
+    """Configuração exata de leitura de um CSV (ver ``sniff_csv``)."""
+
+    encoding: str = "utf-8"
+    delimiter: str = ","
+    quotechar: str = '"'
+    decimal: str = "."
+    thousands: str | None = None
+    header: bool = True
+
+    def pandas_options(self) -> dict:
+        """Argumentos equivalentes para ``pd.read_csv``."""
+        return {
+            "encoding": self.encoding,
+            "delimiter": self.delimiter,
+            "quotechar": self.quotechar,
+            "decimal": self.decimal,
+            "thousands": self.thousands,
+            "header": 0 if self.header else None,
+        }
+
+
+def _sample_windows(path: Path, window: int) -> list[bytes]:
+    """
+    Lê amostras do início, meio e fim do arquivo por memory-map.
+
+    Cada amostra começa e termina em quebra de linha (exceto nas bordas do
+    arquivo); arquivos pequenos viram uma amostra única.
+    """
+    with path.open("rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return [b""]
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if size <= 3 * window:
+                return [mm[:]]
+            windows = []
+            for start in (0, size // 2, size - window):
+                sample = mm[start : start + window]
+                if start:
+                    sample = sample[sample.find(b"\n") + 1 :]
+                if start + window < size:
+                    sample = sample[: sample.rfind(b"\n") + 1]
+                windows.append(sample)
+            return windows
+
+
+def _sniff_encoding(windows: list[bytes]) -> str:
+    head = windows[0]
+    if head.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if head.startswith(_UTF16_BOMS):
+        return "utf-16"
+    data = b"".join(windows)
+    try:
+        data.decode("utf-8")
+    except UnicodeDecodeError:
+        pass
+    else:
+        return "utf-8"
+    result = chardet.detect(data[:CSV_SNIFF_BYTES])
+    if result["encoding"] and result["confidence"] >= _MIN_CHARDET_CONFIDENCE:
+        return result["encoding"]
+    # Palpite fraco do chardet (comum em texto acentuado curto, que ele costuma
+    # confundir com grego/cirílico): planilhas brasileiras vêm de Windows-1252
+    try:
+        data.decode("cp1252")
+    except UnicodeDecodeError:
+        return "latin-1"
+    return "cp1252"
+
+
+def _sniff_quotechar(text: str) -> str:
+    """Aspas simples só quando envolvem campos e as duplas não aparecem assim."""
+    counts = {
+        q: len(re.findall(rf"(?:^|[,;\t|:]){q}|{q}(?:$|[,;\t|:])", text, re.MULTILINE))
+        for q in ('"', "'")
+    }
+    return "'" if counts["'"] > counts['"'] else '"'
+
+
+def _split_rows(texts: list[str], delimiter: str, quotechar: str) -> list[list[str]]:
+    rows = []
+    for text in texts:
+        rows.extend(
+            row for row in csv.reader(io.StringIO(text), delimiter=delimiter, quotechar=quotechar)
+        )
+    return [row for row in rows if row]
+
+
+def _sniff_delimiter(texts: list[str], quotechar: str) -> str:
+    """
+    Escolhe o delimitador que gera o mesmo número de campos em todas as linhas.
+
+    Critérios, em ordem: o cabeçalho tem o número de campos mais comum, a
+    fração de linhas com esse número e o número de campos.
+    """
+    best, best_score = None, None
+    for delimiter in _DELIMITERS:
+        rows = _split_rows(texts, delimiter, quotechar)
+        if not rows:
+            continue
+        counts = Counter(len(row) for row in rows)
+        fields, frequency = counts.most_common(1)[0]
+        if fields < 2:
+            continue
+        score = (len(rows[0]) == fields, frequency / len(rows), fields)
+        if best_score is None or score > best_score:
+            best, best_score = delimiter, score
+    if best is None:
+        # Sem estrutura consistente: caractere candidato mais frequente
+        sample = texts[0]
+        best = max(_DELIMITERS, key=sample.count)
+    return best
+
+
+def _sniff_numbers(values: list[str], delimiter: str) -> tuple[str, str | None]:
+    """Separadores decimal e de milhar a partir dos valores com cara de número."""
+    numbers = [v for v in values if _NUMBER_LIKE.fullmatch(v)]
+    # "1.234" e "1,234" são ambíguos e não contam como evidência
+    comma = sum(
+        1 for v in numbers if _COMMA_DECIMAL.fullmatch(v) and not _COMMA_GROUPED.fullmatch(v)
+    )
+    dot = sum(1 for v in numbers if _DOT_DECIMAL.fullmatch(v) and not _DOT_GROUPED.fullmatch(v))
+    decimal = "," if comma > dot and delimiter != "," else "."
+
+    # Milhar só se todo número com o separador estiver agrupado corretamente
+    # (datas como 01.02.2024 e versões como 1.5 não podem perder o separador)
+    separator, grouped = (".", _DOT_GROUPED) if decimal == "," else (",", _COMMA_GROUPED)
+    with_separator = [v for v in numbers if separator in v]
+    if separator == delimiter or not with_separator:
+        return decimal, None
+    if all(grouped.fullmatch(v) for v in with_separator):
+        return decimal, separator
+    return decimal, None
+
+
+def _sniff_header(rows: list[list[str]]) -> bool:
+    """
+    Há cabeçalho, exceto quando a primeira linha é numérica nas colunas numéricas.
+
+    Sem evidência (nenhuma coluna numérica) assume cabeçalho, como antes.
+    """
+    first, body = rows[0], rows[1:]
+    votes = 0
+    for i, value in enumerate(first):
+        column = [row[i].strip() for row in body if len(row) > i and row[i].strip()]
+        if column and all(_NUMBER_LIKE.fullmatch(v) for v in column):
+            votes += -1 if _NUMBER_LIKE.fullmatch(value.strip()) else 1
+    return votes >= 0
+
+
+def sniff_csv(file_path: str | Path, encoding: str | None = None) -> CsvDialect:
+    """
+    Detecta encoding, delimitador, aspas, separadores numéricos e cabeçalho.
+
+    Lê por memory-map até três amostras de ``CSV_SNIFF_BYTES`` (início, meio
+    e fim), de modo que arquivos grandes são inspecionados sem leitura
+    completa e o arquivo é depois lido uma única vez com a configuração exata.
+
+    Args:
+        file_path: Caminho do arquivo
+        encoding: Encoding conhecido (pula a detecção)
+    """
+    path = Path(file_path)
+    windows = _sample_windows(path, CSV_SNIFF_BYTES)
+    encoding = encoding or _sniff_encoding(windows)
+    texts = [sample.decode(encoding, errors="replace") for sample in windows]
+    if encoding.lower().replace("_", "-") in ("utf-8-sig", "utf-16"):
+        # BOM só no início do arquivo: as demais amostras usam o codec sem BOM
+        texts = [windows[0].decode(encoding, errors="replace")] + [
+            sample.decode(encoding.lower().replace("-sig", ""), errors="replace")
+            for sample in windows[1:]
+        ]
+
+    quotechar = _sniff_quotechar(texts[0])
+    delimiter = _sniff_delimiter(texts, quotechar)
+    rows = _split_rows(texts, delimiter, quotechar)
+    if not rows:
+        dialect = CsvDialect(encoding=encoding, delimiter=delimiter, quotechar=quotechar)
+    else:
+        values = [value.strip() for row in rows[1:] for value in row]
+        decimal, thousands = _sniff_numbers(values, delimiter)
+        dialect = CsvDialect(
+            encoding=encoding,
+            delimiter=delimiter,
+            quotechar=quotechar,
+            decimal=decimal,
+            thousands=thousands,
+            header=_sniff_header(rows),
+        )
+    logger.debug(f"Dialeto CSV detectado: {dialect}")
+    return dialect
+
+
 def detect_encoding(file_path: str | Path) -> str:
-    """Detecta o encoding de um arquivo de texto."""
-    with open(file_path, "rb") as f:
-        result = chardet.detect(f.read(2048))
-    encoding = result["encoding"] or "utf-8"
+    """Detecta o encoding de um arquivo de texto (ver ``sniff_csv``)."""
+    encoding = _sniff_encoding(_sample_windows(Path(file_path), CSV_SNIFF_BYTES))
     logger.debug(f"Encoding detectado: {encoding}")
     return encoding
 
 
 def detect_delimiter(file_path: str | Path, encoding: str) -> str:
-    """Detecta o delimitador mais provável de um arquivo CSV."""
-    with open(file_path, encoding=encoding) as f:
-        sample = f.read(4096)
-        delimiters = [",", ";", "\t", "|", ":"]
-        delimiter_scores = {d: sample.count(d) for d in delimiters}
-        delimiter = max(delimiter_scores, key=delimiter_scores.get)
-        logger.debug(f"Delimitador detectado: '{delimiter}'")
-        return delimiter
+    """Detecta o delimitador mais provável de um arquivo CSV (ver ``sniff_csv``)."""
+    delimiter = sniff_csv(file_path, encoding=encoding).delimiter
+    logger.debug(f"Delimitador detectado: '{delimiter}'")
+    return delimiter
+
+
+def _column_names(df: pd.DataFrame, dialect: CsvDialect) -> pd.DataFrame:
+    """Sem cabeçalho, nomeia as colunas coluna_1, coluna_2, ..."""
+    if not dialect.header:
+        df.columns = [f"coluna_{i}" for i in range(1, len(df.columns) + 1)]
+    return df
+
+
+def _read_csv_pandas(path: Path, dialect: CsvDialect) -> pd.DataFrame:
+    """Leitor CSV padrão do pandas (parser C, single-thread)."""
+    df = pd.read_csv(path, low_memory=False, **dialect.pandas_options())
+    return _column_names(df, dialect)
+
+
+def _read_csv_pyarrow(path: Path, dialect: CsvDialect) -> pd.DataFrame:
+    """
+    Leitor CSV do pyarrow: entrada por memory-map e parsing multi-thread.
+
+    Textos viram ``string[pyarrow]``; colunas que o Arrow inferiria como
+    data/hora continuam texto, como no leitor do pandas. O pyarrow não trata
+    separador de milhar: esses arquivos são lidos pelo pandas.
+    """
+    if dialect.thousands:
+        logger.debug("Separador de milhar detectado: usando o leitor pandas")
+        return _read_csv_pandas(path, dialect)
+    encoding = dialect.encoding
+    utf8 = encoding.lower().replace("_", "-") in ("utf-8", "utf8", "ascii", "utf-8-sig")
+    read_options = pa_csv.ReadOptions(
+        use_threads=True,
+        encoding="utf8" if utf8 else encoding,
+        autogenerate_column_names=not dialect.header,
+    )
+    parse_options = pa_csv.ParseOptions(delimiter=dialect.delimiter, quote_char=dialect.quotechar)
+
+    def open_source():
+        return pa.memory_map(str(path), "r") if utf8 else pa.OSFile(str(path), "rb")
+
+    with open_source() as source:
+        schema = pa_csv.open_csv(
+            source, read_options=read_options, parse_options=parse_options
+        ).schema
+    temporal = {f.name: pa.string() for f in schema if pa.types.is_temporal(f.type)}
+    convert_options = pa_csv.ConvertOptions(
+        column_types=temporal, strings_can_be_null=True, decimal_point=dialect.decimal
+    )
+
+    with open_source() as source:
+        table = pa_csv.read_csv(
+            source,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+    arrow_strings = pd.StringDtype("pyarrow")
+    df = table.to_pandas(
+        types_mapper={pa.string(): arrow_strings, pa.large_string(): arrow_strings}.get
+    )
+    return _column_names(df, dialect)
+
+
+# Leitores CSV disponíveis: nome -> função(path, dialeto)
+CSV_BACKENDS: dict[str, Callable[[Path, CsvDialect], pd.DataFrame]] = {
+    "pandas": _read_csv_pandas,
+}
+if pa is not None:
+    CSV_BACKENDS["pyarrow"] = _read_csv_pyarrow
+
+
+def resolve_csv_backend(backend: str = CSV_BACKEND) -> str:
+    """Resolve o nome do leitor CSV ("auto" usa pyarrow quando instalado)."""
+    if backend == "auto":
+        return "pyarrow" if "pyarrow" in CSV_BACKENDS else "pandas"
+    if backend not in CSV_BACKENDS:
+        raise ValueError(
+            f"Leitor CSV indisponível: {backend!r} (disponíveis: {', '.join(CSV_BACKENDS)})"
+        )
+    return backend
+
+
+def read_csv(
+    file_path: str | Path,
+    encoding: str | None = None,
+    delimiter: str | None = None,
+    backend: str = CSV_BACKEND,
+    dialect: CsvDialect | None = None,
+) -> pd.DataFrame:
+    """
+    Lê um CSV com o leitor escolhido e o dialeto detectado por ``sniff_csv``.
+
+    ``encoding`` e ``delimiter``, quando informados, prevalecem sobre a detecção.
+
+    Raises:
+        FileLoadError: Se o arquivo não puder ser lido, inclusive na detecção do dialeto
+    """
+    path = Path(file_path)
+    name = resolve_csv_backend(backend)
+    logger.debug(f"Leitor CSV: {name}")
+    try:
+        dialect = dialect or sniff_csv(path, encoding=encoding)
+        if delimiter and delimiter != dialect.delimiter:
+            dialect = replace(dialect, delimiter=delimiter)
+        return CSV_BACKENDS[name](path, dialect)
+    except FileLoadError:
+        raise
+    except Exception as e:
+        raise FileLoadError(str(path), str(e)) from e
+
+
+def list_sheets(file_path: str | Path) -> list[str]:
+    """
+    Lista as abas de uma pasta de trabalho Excel, na ordem do arquivo.
+
+    Arquivos CSV não têm abas: retorna lista vazia.
+    """
+    path = validate_file(file_path)
+    ext = path.suffix.lower()
+    if ext == ".csv":
+        return []
+    try:
+        if ext == ".xlsx":
+            workbook = openpyxl.load_workbook(path, read_only=True, keep_links=False)
+            try:
+                return list(workbook.sheetnames)
+            finally:
+                workbook.close()
+        with pd.ExcelFile(path) as workbook:
+            return [str(name) for name in workbook.sheet_names]
+    except Exception as e:
+        raise FileLoadError(str(path), str(e)) from e
+
+
+def iter_spreadsheet_chunks(
+    file_path: str | Path,
+    chunksize: int,
+    progress_callback: Callable[[int, int | None], None] | None = None,
+    *,
+    coerce: bool = COERCE_TYPES,
+) -> Iterator[pd.DataFrame]:
+    """
+    Lê uma planilha em blocos de até ``chunksize`` linhas, sem concatená-los.
+
+    Permite processar arquivos maiores que a memória disponível: apenas um
+    bloco fica carregado por vez. CSV e XLSX são lidos de forma incremental;
+    arquivos XLS são carregados e fatiados.
+
+    Args:
+        file_path: Caminho do arquivo
+        chunksize: Número máximo de linhas por bloco
+        progress_callback: Função de callback para progresso (linhas lidas, total)
+        coerce: Converte números e datas pt-BR (formatos decididos no primeiro bloco)
+
+    Yields:
+        DataFrames com blocos consecutivos de linhas (índice global preservado)
+
+    Raises:
+        FileLoadError: Se houver erro no carregamento
+        UnsupportedFormatError: Se o formato não for suportado
+    """
+    path = validate_file(file_path)
+    ext = path.suffix.lower()
+
+    logger.info(f"Lendo arquivo em blocos de {chunksize} linhas: {path.name}")
+
+    # Formatos pt-BR decididos no primeiro bloco e reaproveitados nos seguintes
+    formats: dict = {}
+
+    def convert(chunk: pd.DataFrame) -> pd.DataFrame:
+        return coerce_columns(chunk, formats) if coerce else chunk
+
+    try:
+        if ext == ".csv":
+            dialect = sniff_csv(path)
+            total_rows = 0
+            for raw_chunk in pd.read_csv(
+                path, chunksize=chunksize, low_memory=False, **dialect.pandas_options()
+            ):
+                chunk = _column_names(raw_chunk, dialect)
+                total_rows += len(chunk)
+                if progress_callback:
+                    progress_callback(total_rows, None)
+                yield convert(chunk)
+        elif ext == ".xlsx":
+            keep = None
+            for chunk in iter_excel_chunks(path, chunksize, progress_callback):
+                # Colunas sem cabeçalho e vazias no primeiro bloco são descartadas
+                if keep is None:
+                    keep = [
+                        c
+                        for c in chunk.columns
+                        if not (str(c).startswith("Unnamed: ") and chunk[c].isna().all())
+                    ]
+                yield convert(_clean_excel_frame(chunk[keep], drop_empty_columns=False))
+        elif ext == ".xls":
+            df = load_and_clean_excel(path)
+            for start in range(0, len(df), chunksize):
+                if progress_callback:
+                    progress_callback(min(start + chunksize, len(df)), len(df))
+                yield convert(df.iloc[start : start + chunksize])
+        else:
+            raise UnsupportedFormatError(ext)
+
+    except (UnsupportedFormatError, FileSizeError, FileLoadError):
+        raise
+    except Exception as e:
+        logger.error(f"Erro ao carregar arquivo: {e}")
+        raise FileLoadError(str(path), str(e)) from e
+
+
+def _loader_settings(
+    ext: str,
+    backend: str,
+    sheet_name: str | None = None,
+    *,
+    optimize: bool = OPTIMIZE_DTYPES,
+    coerce: bool = COERCE_TYPES,
+) -> dict:
+    """Configurações que afetam o DataFrame produzido (compõem a chave do cache)."""
+    settings = {
+        "versao": LOADER_CACHE_VERSION,
+        "formato": ext,
+        "tipos_compactos": optimize,
+        "conversao_ptbr": coerce,
+    }
+    if ext == ".csv":
+        settings["leitor_csv"] = resolve_csv_backend(backend)
+    elif sheet_name is not None:
+        settings["aba"] = sheet_name
+    return settings
 
 
 def load_spreadsheet(
     file_path: str | Path,
     chunksize: int | None = None,
     progress_callback: Callable[[int, int | None], None] | None = None,
+    use_cache: bool = CACHE_ENABLED,
+    backend: str = CSV_BACKEND,
+    *,
+    sheet_name: str | None = None,
+    optimize: bool = OPTIMIZE_DTYPES,
+    coerce: bool = COERCE_TYPES,
 ) -> pd.DataFrame:
     """
     Carrega uma planilha (CSV, XLSX, XLS) e retorna um DataFrame.
 
+    Com ``coerce`` colunas de texto com números (``1.234,56``, ``R$ 10,00``,
+    ``12,5%``) ou datas (``31/12/2024``) no formato brasileiro são convertidas.
+    Com ``optimize`` o texto vira ``category``/``string[pyarrow]`` e os números
+    são reduzidos ao menor tipo sem perda. Com ``use_cache`` (e ``pyarrow``
+    instalado) o resultado é guardado em ``CACHE_DIR``; reabrir o mesmo
+    arquivo lê o cache por memory-map.
+
     Args:
         file_path: Caminho do arquivo
         chunksize: Tamanho dos chunks para leitura incremental (CSV apenas)
         progress_callback: Função de callback para progresso (processed, total)
+        use_cache: Usa o cache em disco de planilhas já carregadas
+        backend: Leitor CSV ("pandas", "pyarrow" ou "auto")
+        sheet_name: Aba do Excel a carregar (padrão: a primeira; ver ``list_sheets``)
+        optimize: Compacta os tipos das colunas (``core.dtypes.optimize_dtypes``)
+        coerce: Converte números e datas pt-BR (``core.coercion.coerce_columns``)
 
     Returns:
         DataFrame com os dados carregados
@@ -128,33 +775,54 @@ def load_spreadsheet(
     path = validate_file(file_path)
     ext = path.suffix.lower()
 
+    key = None
+    if use_cache and cache.is_available():
+        settings = _loader_settings(ext, backend, sheet_name, optimize=optimize, coerce=coerce)
+        key = cache.cache_key(path, settings)
+        df = cache.load_cached(key)
+        if df is not None:
+            logger.info(f"Arquivo carregado do cache: {len(df)} linhas, {len(df.columns)} colunas")
+            if progress_callback:
+                progress_callback(len(df), len(df))
+            return df
+
+    df = _read_spreadsheet(path, ext, chunksize, progress_callback, backend, sheet_name=sheet_name)
+    if coerce:
+        df = coerce_columns(df)
+    if optimize:
+        df = optimize_dtypes(df)
+
+    if key is not None:
+        try:
+            cache.store_cached(key, df)
+        except OSError as e:
+            logger.warning(f"Não foi possível gravar o cache: {e}")
+    return df
+
+
+def _read_spreadsheet(
+    path: Path,
+    ext: str,
+    chunksize: int | None,
+    progress_callback: Callable[[int, int | None], None] | None,
+    backend: str = CSV_BACKEND,
+    *,
+    sheet_name: str | None = None,
+) -> pd.DataFrame:
+    """Lê e limpa a planilha do disco (sem cache)."""
+    if chunksize and ext == ".csv":
+        chunks = list(iter_spreadsheet_chunks(path, chunksize, progress_callback, coerce=False))
+        df = pd.concat(chunks, ignore_index=True)
+        logger.info(f"Arquivo carregado: {len(df)} linhas, {len(df.columns)} colunas")
+        return df
+
     logger.info(f"Carregando arquivo: {path.name}")
 
     try:
         if ext == ".csv":
-            encoding = detect_encoding(path)
-            delimiter = detect_delimiter(path, encoding)
-            if chunksize:
-                chunks = []
-                total_rows = 0
-                for chunk in pd.read_csv(
-                    path,
-                    encoding=encoding,
-                    delimiter=delimiter,
-                    chunksize=chunksize,
-                    low_memory=False,
-                ):
-                    chunks.append(chunk)
-                    total_rows += len(chunk)
-                    if progress_callback:
-                        progress_callback(total_rows, None)
-                df = pd.concat(chunks, ignore_index=True)
-            else:
-                df = pd.read_csv(path, encoding=encoding, delimiter=delimiter, low_memory=False)
+            df = read_csv(path, backend=backend)
         elif ext in [".xlsx", ".xls"]:
-            df = load_and_clean_excel(path)
-            if progress_callback:
-                progress_callback(len(df), len(df))
+            df = load_and_clean_excel(path, progress_callback, sheet_name)
         else:
             raise UnsupportedFormatError(ext)
 
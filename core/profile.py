@@ -0,0 +1,221 @@
+# core/profile.py
+"""
+Perfil de colunas calculado em uma passada e reaproveitado entre módulos.
+
+Detecção de ID, indicadores e detecção de CEP consultam as mesmas
+estatísticas (ausentes, valores distintos, unicidade, comprimento do texto,
+amostra). ``column_profile`` calcula tudo a partir de um único
+``pd.factorize``; ``distinct_estimate`` (HyperLogLog) e ``is_unique_column``
+(unicidade com parada no primeiro repetido) são mais baratos e servem para
+descartar colunas antes da verificação exata.
+
+Os resultados ficam guardados por DataFrame (identidade do objeto) e por
+versão da coluna (os arrays de valores): substituir uma coluna invalida o
+que foi calculado para ela. Alterações in-place dos valores
+(``df.loc[...] =``) não mudam a versão; nesse caso use ``clear_profiles``.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from config.settings import HLL_PRECISION, PROFILE_SAMPLE_SIZE, UNIQUE_CHECK_BLOCK
+from core.dtypes import is_text_column, text_lengths
+from core.sketch import HyperLogLog, has_duplicates, hash_is_slow
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# id(DataFrame) -> (referência fraca ao DataFrame, {coluna: (valores, {tipo: resultado})})
+_PROFILES: dict[int, tuple[weakref.ref, dict]] = {}
+_LOCK = threading.Lock()
+# Fração mínima da coluna usada no prefixo de ``distinct_estimate``
+_PREFIX_FRACTION = 0.1
+
+
+@dataclass(frozen=True)
+class ColumnProfile:
+    """Estatísticas de uma coluna (ver ``column_profile``)."""
+
+    dtype: object
+    length: int
+    null_count: int
+    distinct: int  # Valores distintos preenchidos (como ``nunique()``)
+    is_unique: bool  # Como ``Series.is_unique`` (ausentes contam como valor)
+    mean_length: float | None  # Comprimento médio do texto preenchido (None se não for texto)
+    max_length: int | None
+    sample: pd.Series  # Primeiros valores preenchidos (até ``PROFILE_SAMPLE_SIZE``)
+
+    @property
+    def uniqueness(self) -> float:
+        """Valores distintos por linha (0 em colunas vazias)."""
+        return self.distinct / self.length if self.length else 0.0
+
+
+@dataclass(frozen=True)
+class DistinctEstimate:
+    """Número de valores distintos preenchidos, com limites de confiança."""
+
+    estimate: float
+    lower: float
+    upper: float
+    exact: bool = False
+
+
+def _column_values(series: pd.Series):
+    """Valores da coluna sem cópia; servem de versão da coluna no cache."""
+    if isinstance(series.dtype, np.dtype):
+        return series.to_numpy()
+    return series.array
+
+
+def _same_values(a, b) -> bool:
+    if isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
+        # Views distintas dos mesmos dados: compara endereço, forma, passos e tipo
+        return a.__array_interface__ == b.__array_interface__
+    return a is b
+
+
+def _compute_profile(series: pd.Series, sample_size: int) -> ColumnProfile:
+    codes, uniques = pd.factorize(series)
+    filled = codes >= 0
+    null_count = int(len(codes) - filled.sum())
+    distinct = len(uniques)
+
+    mean_length = max_length = None
+    if is_text_column(series) and distinct:
+        lengths = text_lengths(pd.Series(uniques)).to_numpy(dtype=np.float64)
+        counts = np.bincount(codes[filled], minlength=distinct)
+        mean_length = float((lengths * counts).sum() / counts.sum())
+        max_length = int(lengths.max())
+
+    positions = np.flatnonzero(filled)[:sample_size]
+    return ColumnProfile(
+        dtype=series.dtype,
+        length=len(series),
+        null_count=null_count,
+        distinct=distinct,
+        is_unique=distinct + (null_count > 0) == len(series),
+        mean_length=mean_length,
+        max_length=max_length,
+        sample=series.iloc[positions],
+    )
+
+
+def _frame_entry(df: pd.DataFrame) -> dict:
+    key = id(df)
+    entry = _PROFILES.get(key)
+    if entry is None or entry[0]() is not df:
+        entry = (weakref.ref(df), {})
+        _PROFILES[key] = entry
+        # Remove as entradas quando o DataFrame é coletado
+        weakref.finalize(df, _PROFILES.pop, key, None)
+    return entry[1]
+
+
+def _cached(df: pd.DataFrame, col, kind: str, compute: Callable[[pd.Series], object]):
+    """Resultado de ``compute(df[col])`` guardado por DataFrame, coluna e versão."""
+    series = df[col]
+    values = _column_values(series)
+    with _LOCK:
+        cached = _frame_entry(df).get(col)
+    if cached is None or not _same_values(cached[0], values):
+        cached = (values, {})
+    results = cached[1]
+    if kind not in results:
+        results[kind] = compute(series)
+        with _LOCK:
+            # Guarda os valores junto: enquanto vivos, o endereço não é reutilizado
+            _frame_entry(df)[col] = cached
+    return results[kind]
+
+
+def _peek(df: pd.DataFrame, col, kind: str):
+    """Resultado já guardado para a versão atual da coluna, sem calcular."""
+    with _LOCK:
+        cached = _frame_entry(df).get(col)
+    if cached is None or not _same_values(cached[0], _column_values(df[col])):
+        return None
+    return cached[1].get(kind)
+
+
+def column_profile(df: pd.DataFrame, col) -> ColumnProfile:
+    """
+    Perfil da coluna ``col``, calculado uma vez por versão da coluna.
+
+    Chamadas seguintes para o mesmo DataFrame e a mesma coluna (sem
+    substituição dos valores) devolvem o perfil guardado.
+    """
+    return _cached(df, col, "perfil", lambda s: _compute_profile(s, PROFILE_SAMPLE_SIZE))
+
+
+def _prefix_bounds(series: pd.Series) -> DistinctEstimate:
+    """Limites exatos a partir do prefixo da coluna (e estimativa por extrapolação)."""
+    size = max(UNIQUE_CHECK_BLOCK, int(len(series) * _PREFIX_FRACTION))
+    prefix = series.iloc[:size]
+    distinct = prefix.nunique()
+    if size >= len(series):
+        return DistinctEstimate(distinct, distinct, distinct, exact=True)
+    # Cada valor repetido no prefixo também é repetido na coluna inteira
+    upper = int(series.count()) - (int(prefix.count()) - distinct)
+    return DistinctEstimate(min(upper, distinct * len(series) / size), distinct, upper)
+
+
+def _sketch_bounds(series: pd.Series, bounds: DistinctEstimate) -> DistinctEstimate:
+    sketch = HyperLogLog(HLL_PRECISION)
+    sketch.update(series)
+    estimate = sketch.count()
+    # 4 desvios padrão (mais folga absoluta para poucos valores)
+    margin = 4 * sketch.relative_error
+    lower = max(bounds.lower, estimate * (1 - margin) - 2)
+    upper = min(bounds.upper, estimate * (1 + margin) + 2)
+    return DistinctEstimate(min(max(estimate, lower), upper), lower, upper)
+
+
+def distinct_estimate(df: pd.DataFrame, col, *, sketch: bool = True) -> DistinctEstimate:
+    """
+    Número de valores distintos preenchidos, com limites para descartar colunas.
+
+    Primeiro conta os distintos de um prefixo (``UNIQUE_CHECK_BLOCK`` linhas
+    ou 10% da coluna): os limites são exatos e baratos. Com ``sketch`` os
+    limites são refinados por um HyperLogLog da coluna inteira. Se o perfil
+    exato já foi calculado (ou se a coluna é de texto não categórico, em que
+    o hash custa tanto quanto a contagem exata), devolve a contagem exata.
+    """
+    profile = _peek(df, col, "perfil")
+    if profile is None:
+        bounds = _cached(df, col, "limites", _prefix_bounds)
+        if bounds.exact or not sketch:
+            return bounds
+        if not hash_is_slow(df[col]):
+            return _cached(df, col, "estimativa", lambda s: _sketch_bounds(s, bounds))
+        profile = column_profile(df, col)
+    distinct = float(profile.distinct)
+    return DistinctEstimate(distinct, distinct, distinct, exact=True)
+
+
+def is_unique_column(df: pd.DataFrame, col) -> bool:
+    """
+    Como ``df[col].is_unique``, mas para no primeiro bloco com valor repetido.
+
+    Reaproveita o perfil exato quando já calculado.
+    """
+    profile = _peek(df, col, "perfil")
+    if profile is not None:
+        return profile.is_unique
+    return _cached(df, col, "unico", lambda s: not has_duplicates(s))
+
+
+def clear_profiles(df: pd.DataFrame | None = None) -> None:
+    """Descarta os perfis guardados de ``df`` (ou de todos os DataFrames)."""
+    with _LOCK:
+        if df is None:
+            _PROFILES.clear()
+        else:
+            _PROFILES.pop(id(df), None)
@@ -0,0 +1,129 @@
+# core/sketch.py
+"""
+Estruturas aproximadas para contar valores distintos sem tabela hash completa.
+
+``HyperLogLog`` estima a cardinalidade de uma coluna com memória fixa
+(``2 ** precision`` bytes) a partir dos hashes de 64 bits dos valores;
+``has_duplicates`` verifica a unicidade por prefixos de tamanho crescente e
+para no primeiro bloco com valor repetido.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pandas as pd
+
+from config.settings import HLL_PRECISION, UNIQUE_CHECK_BLOCK
+from core.dtypes import is_text_column
+
+
+def hash_values(series: pd.Series) -> np.ndarray:
+    """Hash de 64 bits de cada valor (ausentes têm um hash fixo)."""
+    if series.dtype.kind == "f":
+        # -0.0 e 0.0 são iguais para o pandas, mas têm bits diferentes
+        series = series + 0.0
+    return pd.util.hash_pandas_object(series, index=False, categorize=False).to_numpy()
+
+
+def hash_rows(hashes: list[np.ndarray]) -> np.ndarray:
+    """
+    Combina os hashes de várias colunas (``hash_values``) em um hash por linha.
+
+    Mesma combinação de tuplas usada por ``hash_pandas_object`` em DataFrames:
+    depende da ordem das colunas e mistura todos os bits de cada uma.
+    """
+    combined = np.full(len(hashes[0]), 0x345678, dtype=np.uint64)
+    mult = np.uint64(1_000_003)
+    for i, column in enumerate(hashes):
+        combined ^= column
+        combined *= mult
+        mult += np.uint64(82_520 + 2 * (len(hashes) - i))
+    return combined + np.uint64(97_531)
+
+
+class HyperLogLog:
+    """Estimador de cardinalidade HyperLogLog (erro relativo ~1.04 / sqrt(2 ** precision))."""
+
+    def __init__(self, precision: int = HLL_PRECISION):
+        # Com precision >= 11 os 64 - p bits restantes cabem exatos num float64
+        if not 11 <= precision <= 18:
+            raise ValueError("precision deve estar entre 11 e 18")
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8)
+
+    @property
+    def relative_error(self) -> float:
+        """Desvio padrão relativo da estimativa."""
+        return 1.04 / math.sqrt(len(self.registers))
+
+    def update_hashes(self, hashes: np.ndarray) -> None:
+        """Adiciona hashes de 64 bits (``hash_values``)."""
+        if len(hashes) == 0:
+            return
+        p = self.precision
+        buckets = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+        # Posição do primeiro bit 1 nos 64 - p bits restantes (frexp = comprimento em bits)
+        _, bit_length = np.frexp(rest.astype(np.float64))
+        ranks = (64 - p - bit_length + 1).astype(np.uint8)
+        np.maximum.at(self.registers, buckets, ranks)
+
+    def update(self, series: pd.Series) -> None:
+        """Adiciona os valores preenchidos de uma coluna."""
+        self.update_hashes(hash_values(series[series.notna()]))
+
+    def merge(self, other: HyperLogLog) -> None:
+        """Combina com outro estimador de mesma precisão (união dos conjuntos)."""
+        if other.precision != self.precision:
+            raise ValueError("Estimadores com precisões diferentes")
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> float:
+        """Estimativa do número de valores distintos adicionados."""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.ldexp(1.0, -self.registers.astype(np.int64)).sum()
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * m and zeros:
+            # Poucos valores: contagem linear é mais precisa
+            return m * math.log(m / zeros)
+        return float(estimate)
+
+
+def hash_is_slow(series: pd.Series) -> bool:
+    """Texto não categórico: o hash custa tanto quanto a tabela hash exata do pandas."""
+    return is_text_column(series) and not isinstance(series.dtype, pd.CategoricalDtype)
+
+
+def has_duplicates(series: pd.Series, first_block: int = UNIQUE_CHECK_BLOCK) -> bool:
+    """
+    Indica se a coluna tem valores repetidos, como ``not series.is_unique``.
+
+    Examina prefixos que dobram de tamanho a partir de ``first_block`` linhas
+    e para no primeiro com valor repetido: colunas com repetições cedo custam
+    só o primeiro bloco. Os hashes já vistos ficam ordenados e um hash
+    repetido é confirmado com ``is_unique`` no próprio prefixo; hashes
+    distintos garantem valores distintos, exceto em colunas ``object`` (os
+    valores são hasheados como texto: 1 e 1.0 diferem), confirmadas no fim.
+    Em colunas de texto, em que o hash é caro, só o primeiro bloco é
+    verificado à parte, seguido do ``is_unique`` da coluna inteira.
+    """
+    n = len(series)
+    if hash_is_slow(series):
+        return not (series.iloc[:first_block].is_unique and series.is_unique)
+
+    seen = np.empty(0, dtype=np.uint64)
+    start, size = 0, first_block
+    while start < n:
+        stop = min(n, start + size)
+        block = np.sort(hash_values(series.iloc[start:stop]))
+        # Dois trechos ordenados: o sort estável (timsort) apenas os intercala
+        seen = np.sort(np.concatenate([seen, block]), kind="stable")
+        if (seen[1:] == seen[:-1]).any() and not series.iloc[:stop].is_unique:
+            return True
+        start, size = stop, size * 2
+    if series.dtype == object:
+        return not series.is_unique
+    return False
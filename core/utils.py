@@ -4,6 +4,9 @@
 
 import pandas as pd
 
+from core.dtypes import map_values
+from core.profile import column_profile
+
 
 def validate_file(file_path, max_rows, max_size_mb):
     size_mb = os.path.getsize(file_path) / 1024 / 1024
@@ -12,18 +15,25 @@ def validate_file(file_path, max_rows, max_size_mb):
     return True
 
 
+def detect_cep_columns(df):
+    """Retorna as colunas cuja amostra tem ao menos 80% de valores com cara de CEP."""
+    cep_cols = []
+    for col in df.columns:
+        sample = column_profile(df, col).sample.astype(str)
+        cnt = sum(1 for val in sample if re.fullmatch(r"\d{7,8}(\.0)?", val))
+        if cnt >= len(sample) * 0.8:
+            cep_cols.append(col)
+    return cep_cols
+
+
 def normalize_cep_column(df, cep_cols=None):
     """
     Detecta e normaliza colunas de CEP no DataFrame.
     Converte valores para strings, remove '.0', mantém só números e preenche zeros à esquerda.
+    A formatação roda uma vez por valor distinto e preserva colunas ``category``/``string``.
     """
     if cep_cols is None:
-        cep_cols = []
-        for col in df.columns:
-            sample = df[col].dropna().astype(str).head(100)
-            cnt = sum(1 for val in sample if re.fullmatch(r"\d{7,8}(\.0)?", val))
-            if cnt >= len(sample) * 0.8:
-                cep_cols.append(col)
+        cep_cols = detect_cep_columns(df)
     for col in cep_cols:
 
         def format_cep(val):
@@ -35,5 +45,5 @@ def format_cep(val):
             s = s.zfill(8)  # Completa com zeros à esquerda para 8 dígitos
             return s
 
-        df[col] = df[col].map(format_cep)
+        df[col] = map_values(df[col], format_cep)
     return df
@@ -21,9 +21,12 @@
     QWidget,
 )
 
+from analysis.embeddings import warm_up
 from analysis.indicator import generate_indicators
+from analysis.workbook import analyze_workbook
+from config.settings import EMBEDDING_WARMUP
 from core.id_generator import ensure_id_column
-from core.loader import load_spreadsheet
+from core.loader import list_sheets, load_spreadsheet
 from core.utils import normalize_cep_column
 
 
@@ -36,6 +39,11 @@ def prepare_indicators_for_json(indicators):
             entry["tabela"] = entry["tabela"].to_dict(orient="records")
         agrup.append(entry)
     copy["agrupamentos"] = agrup
+    if indicators.get("abas_fora"):
+        copy["abas_fora"] = [
+            {"aba": a["aba"], "indicadores": prepare_indicators_for_json(a["indicadores"])}
+            for a in indicators["abas_fora"]
+        ]
     return copy
 
 
@@ -50,14 +58,35 @@ def __init__(self, filepath):
 
     def run(self):
         try:
-            df = load_spreadsheet(self.filepath, progress_callback=self._on_progress)
-            df = ensure_id_column(df)
-            df = normalize_cep_column(df)
-            indicators = generate_indicators(df, progress_callback=self._on_progress)
+            if len(list_sheets(self.filepath)) > 1:
+                indicators = self._analyze_sheets()
+            else:
+                df = load_spreadsheet(self.filepath, progress_callback=self._on_progress)
+                df = ensure_id_column(df)
+                df = normalize_cep_column(df)
+                indicators = generate_indicators(df, progress_callback=self._on_progress)
             self.finished.emit(indicators)
         except Exception as e:
             self.error.emit(str(e))
 
+    def _analyze_sheets(self):
+        # Abas analisadas em paralelo e combinadas; o progresso é por aba
+        result = analyze_workbook(self.filepath, progress_callback=self._on_progress, combine=True)
+        abas = result["abas"]
+        # Sem combinação (abas vazias), mostra a primeira aba
+        combinadas = result["combinadas"] or list(abas)[:1]
+        indicators = result["combinado"] or abas[combinadas[0]]
+        indicators["abas"] = [
+            {"aba": nome, "total_linhas": abas[nome]["total_linhas"]} for nome in combinadas
+        ]
+        # Abas de layout diferente ficam de fora, com os próprios indicadores
+        indicators["abas_fora"] = [
+            {"aba": nome, "indicadores": ind}
+            for nome, ind in abas.items()
+            if nome not in combinadas
+        ]
+        return indicators
+
     def _on_progress(self, processed, total=None):
         if total:
             self.progress.emit(processed, total)
@@ -154,6 +183,9 @@ def __init__(self):
 
         # Dash background starter
         threading.Thread(target=self._start_dash, daemon=True).start()
+        # Modelo de embeddings carregado em segundo plano enquanto a janela abre
+        if EMBEDDING_WARMUP:
+            warm_up()
 
     def create_footer(self):
         rodape = QWidget()
@@ -334,14 +366,49 @@ def analysis_finished(self, indicators):
         <div style="font-family: JetBrains Mono, Consolas, monospace; font-size: 13px; color: #FFFFFF;">
         """)
 
-        if not indicators.get("agrupamentos"):
+        if indicators.get("abas"):
+            abas = ", ".join(f"{a['aba']} ({a['total_linhas']})" for a in indicators["abas"])
+            append(f"""
+            <div style="margin-top:4px; color:#B9BBBE;">
+                <b>{len(indicators["abas"])} abas combinadas:</b> {abas}
+            </div>
+            """)
+
+        self._append_groups(append, indicators.get("agrupamentos"))
+
+        for fora in indicators.get("abas_fora", []):
+            ind = fora["indicadores"]
+            append(f"""
+            <div style="margin-top:24px; color:#FAA61A; font-size:15px;">
+                <b>Aba {fora["aba"]} (fora da combinação):</b>
+                <span style="color:#B9BBBE; font-size:12px;">{ind["total_linhas"]} linhas, ID {ind["id_coluna"]}</span>
+            </div>
+            """)
+            self._append_groups(append, ind.get("agrupamentos"))
+        append("</div>")
+        self.output.setHtml("".join(resumo))
+
+        # Mantém envio para Dash
+        try:
+            url = "http://127.0.0.1:8050/update_data"
+            headers = {"Content-Type": "application/json"}
+            json_data = prepare_indicators_for_json(indicators)
+            requests.post(url, json=json_data, headers=headers, timeout=5)
+        except Exception:
+            pass  # Dashboard pode não estar rodando
+        finally:
+            self.progress.setVisible(False)
+            self.analyze_btn.setEnabled(True)
+
+    def _append_groups(self, append, agrupamentos):
+        if not agrupamentos:
             append("""
             <div style="color:#FF5E5B; margin-top:8px;">
                 <b>Aviso:</b> Nenhuma coluna com valores repetidos ou relevantes para agrupamento detectada.
             </div>
             """)
         else:
-            for grp in indicators["agrupamentos"]:
+            for grp in agrupamentos:
                 append(f"""
                 <div style="margin-top:18px; margin-bottom:2px; font-weight:bold; color:#A3A3FF; font-size:15px;">
                     {grp["coluna"]} <span style="color:#B9BBBE; font-size:12px;">({grp.get("tipo", "-")})</span>
@@ -354,6 +421,11 @@ def analysis_finished(self, indicators):
                     for k, v in grp["estatisticas"].items():
                         append(f"<li><b>{k.capitalize()}:</b> {v}</li>")
                     append("</ul>")
+                if grp.get("dicionario"):
+                    marcas = ", ".join(f"{tag} ({n})" for tag, n in grp["dicionario"].items())
+                    append(
+                        f'<div style="margin-left:18px; color:#B9BBBE; font-size:12px;"><b>Dicionário:</b> {marcas}</div>'
+                    )
                 if grp.get("tabela") is not None:
                     df = grp["tabela"]
                     cols = df.columns[:3]
@@ -382,20 +454,6 @@ def analysis_finished(self, indicators):
                             f'<tr><td colspan="{len(cols)}" style="color:#AAAAAA; font-style:italic; padding-left:6px;">... e mais {len(df) - 8} registros.</td></tr>'
                         )
                     append("</table>")
-        append("</div>")
-        self.output.setHtml("".join(resumo))
-
-        # Mantém envio para Dash
-        try:
-            url = "http://127.0.0.1:8050/update_data"
-            headers = {"Content-Type": "application/json"}
-            json_data = prepare_indicators_for_json(indicators)
-            requests.post(url, json=json_data, headers=headers, timeout=5)
-        except Exception:
-            pass  # Dashboard pode não estar rodando
-        finally:
-            self.progress.setVisible(False)
-            self.analyze_btn.setEnabled(True)
 
     def show_error(self, msg):
         self.output.setPlainText(f"Erro na análise: {msg}")
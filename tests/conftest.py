@@ -10,6 +10,15 @@
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Direciona o cache de planilhas (e do índice de sinônimos) para um diretório temporário."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr("core.cache.CACHE_DIR", cache_dir)
+    monkeypatch.setattr("analysis.detector.CACHE_DIR", cache_dir)
+    return cache_dir
+
+
 @pytest.fixture
 def sample_dataframe() -> pd.DataFrame:
     """Cria um DataFrame de exemplo para testes."""
@@ -0,0 +1,214 @@
+"""
+Testes para o módulo analysis.clustering
+"""
+
+import numpy as np
+import pytest
+
+from analysis.clustering import (
+    blocked_similarity_edges,
+    candidate_pairs,
+    cluster_indices,
+    connected_components,
+    cosine_edges,
+    cosine_neighbors,
+    greedy_clusters,
+    greedy_cosine_clusters,
+    iter_candidate_pairs,
+    lsh_cosine_neighbors,
+    neighbor_pairs,
+    similarity_edges,
+)
+
+
+class TestSimilarityEdges:
+    """Testes para a função similarity_edges."""
+
+    def test_upper_triangle_only(self) -> None:
+        """Deve retornar apenas pares i < j acima do limiar."""
+        rows, cols = similarity_edges(["casa", "casa", "rua"], threshold=90)
+
+        assert rows.tolist() == [0]
+        assert cols.tolist() == [1]
+
+    def test_small_memory_budget_gives_same_edges(self) -> None:
+        """Blocos pequenos devem produzir os mesmos pares que um bloco único."""
+        terms = [f"termo {i % 7}{i % 3}" for i in range(200)]
+        full = similarity_edges(terms, threshold=85)
+        blocked = similarity_edges(terms, threshold=85, memory_mb=0)
+
+        assert sorted(zip(*full, strict=True)) == sorted(zip(*blocked, strict=True))
+
+
+class TestCosineClusters:
+    """Testes para os pares e grupos por similaridade de cosseno."""
+
+    def test_edges_match_pairwise_cosine(self) -> None:
+        """Pares em blocos devem ser os da matriz de cossenos completa; vetor nulo não tem par."""
+        rng = np.random.default_rng(3)
+        vectors = rng.normal(size=(120, 8))
+        vectors[5] = 0
+        unit = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+        expected = np.argwhere(np.triu(unit @ unit.T >= 0.4, k=1))
+
+        rows, cols = cosine_edges(vectors, 0.4, memory_mb=0)
+        assert sorted(zip(rows, cols, strict=True)) == [tuple(pair) for pair in expected]
+        assert 5 not in rows and 5 not in cols
+
+    def test_greedy_clusters_without_edges(self) -> None:
+        """A atribuição por faixas deve reproduzir a gulosa sobre todos os pares."""
+        rng = np.random.default_rng(4)
+        centers = rng.normal(size=(6, 16))
+        vectors = centers[rng.integers(0, 6, 3000)] + 0.6 * rng.normal(size=(3000, 16))
+
+        rows, cols = cosine_edges(vectors, 0.8)
+        expected = greedy_clusters(len(vectors), rows, cols)
+        assert greedy_cosine_clusters(vectors, 0.8, memory_mb=0) == expected
+        assert greedy_cosine_clusters(vectors[:0], 0.8) == []
+
+    def test_cluster_terms_by_embedding(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Cada termo livre absorve os seguintes livres acima do limiar."""
+        from analysis import semantic
+
+        vectors = {"a": [1, 0], "b": [0.9, 0.1], "c": [0, 1], "d": [0.1, 1], "e": [-1, 0]}
+        monkeypatch.setattr(semantic, "embed_terms", lambda terms: [vectors[t] for t in terms])
+
+        terms = list(vectors)
+        assert semantic.cluster_terms_by_embedding(terms) == [["a", "b"], ["c", "d"], ["e"]]
+        assert semantic.cluster_terms_by_embedding(terms, 0.05, method="components") == [
+            ["a", "b", "c", "d"],
+            ["e"],
+        ]
+        assert semantic.cluster_terms_by_embedding(terms, ann=True) == [
+            ["a", "b"],
+            ["c", "d"],
+            ["e"],
+        ]
+        assert semantic.cluster_terms_by_embedding([]) == []
+
+
+class TestCosineNeighbors:
+    """Testes para a busca de vizinhos exata e aproximada (LSH)."""
+
+    @staticmethod
+    def _groups() -> np.ndarray:
+        rng = np.random.default_rng(5)
+        centers = rng.normal(size=(300, 32))
+        centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+        return centers[rng.integers(0, 300, 3000)] + 0.05 * rng.normal(size=(3000, 32))
+
+    def test_exact_top_k_above_threshold(self) -> None:
+        """No máximo k vizinhos por termo, acima do limiar, do mais ao menos similar."""
+        vectors = self._groups()
+        rows, cols, sims = cosine_neighbors(vectors, 0.8, k=3, memory_mb=0)
+
+        assert np.bincount(rows).max() <= 3
+        assert (sims >= 0.8).all() and (rows != cols).all()
+        unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.testing.assert_allclose(sims, np.einsum("ij,ij->i", unit[rows], unit[cols]))
+        same_row = rows[1:] == rows[:-1]
+        assert (sims[1:][same_row] <= sims[:-1][same_row]).all()
+
+    def test_lsh_recall_against_exact(self) -> None:
+        """A LSH acha quase todos os vizinhos da busca exata e nenhum abaixo do limiar."""
+        vectors = self._groups()
+        exact = cosine_neighbors(vectors, 0.8, k=5)
+        approx = lsh_cosine_neighbors(vectors, 0.8, k=5, bucket_size=64)
+
+        n = len(vectors)
+        found = np.isin(exact[0] * n + exact[1], approx[0] * n + approx[1]).mean()
+        assert found > 0.95
+        assert (approx[2] >= 0.8).all() and np.bincount(approx[0]).max() <= 5
+        assert lsh_cosine_neighbors(vectors[:1], 0.8)[0].size == 0
+
+    def test_neighbor_pairs_are_undirected(self) -> None:
+        """Vizinhos dirigidos viram pares i < j sem repetição."""
+        rows, cols = neighbor_pairs(np.array([0, 1, 2, 2]), np.array([1, 0, 0, 1]))
+
+        assert list(zip(rows, cols, strict=True)) == [(0, 1), (0, 2), (1, 2)]
+
+
+class TestBlocking:
+    """Testes para a geração de candidatos (blocagem)."""
+
+    def test_blocked_edges_are_subset_of_dense(self) -> None:
+        """Pares da blocagem devem ser exatamente pares similares da matriz densa."""
+        rng = np.random.default_rng(7)
+        letters = list("abcdefghijklmnopqrstuvwxyz")
+        bases = ["".join(rng.choice(letters, rng.integers(8, 20))) for _ in range(60)]
+        terms = []
+        for _ in range(300):
+            term = list(bases[rng.integers(len(bases))])
+            term[rng.integers(len(term))] = letters[rng.integers(len(letters))]
+            terms.append("".join(term))
+        terms = list(dict.fromkeys(terms))
+        dense = set(zip(*similarity_edges(terms, threshold=88), strict=True))
+        blocked = set(zip(*blocked_similarity_edges(terms, threshold=88), strict=True))
+
+        assert blocked <= dense
+        assert len(blocked) >= 0.9 * len(dense)
+
+    def test_stats_report_pruned_pairs(self) -> None:
+        """Deve registrar pares possíveis, avaliados e podados."""
+        terms = ["sao paulo", "sao paulu", "rio de janeiro", "curitiba", "recife"]
+        stats: dict = {}
+        rows, _ = blocked_similarity_edges(terms, threshold=88, stats=stats)
+
+        assert stats["pares_possiveis"] == 10
+        assert stats["pares_avaliados"] + stats["pares_podados"] == 10
+        assert stats["pares_similares"] == len(rows) == 1
+
+    def test_length_filter_prunes_impossible_pairs(self) -> None:
+        """Pares com comprimentos muito diferentes não devem ser candidatos."""
+        rows, cols = candidate_pairs(["abc", "abcdefghijklmnop"], threshold=88, window=5)
+
+        assert len(rows) == len(cols) == 0
+
+    def test_small_batches_give_same_candidates(self) -> None:
+        """Lotes pequenos devem cobrir os mesmos pares que um único lote."""
+        terms = [f"rua {i % 50} numero {i % 7}" for i in range(400)]
+        batches = list(iter_candidate_pairs(terms, 80, batch_pairs=100))
+        rows, cols = candidate_pairs(terms, 80)
+
+        assert len(batches) > 1
+        found = set()
+        for batch_rows, batch_cols in batches:
+            assert (batch_rows < batch_cols).all()
+            found.update(zip(batch_rows.tolist(), batch_cols.tolist(), strict=True))
+        assert found == set(zip(rows.tolist(), cols.tolist(), strict=True))
+
+    def test_candidate_budget_is_linear(self) -> None:
+        """O índice invertido gera no máximo ``max_candidates`` pares por termo, em média."""
+        terms = [f"cliente {i % 300:03d}x{i}" for i in range(3000)]
+        rows, _ = candidate_pairs(terms, 0, window=0, max_candidates=2)
+        unbounded, _ = candidate_pairs(terms, 0, window=0, max_candidates=10**6)
+
+        assert 0 < len(rows) <= 2 * len(terms) < len(unbounded)
+
+    @pytest.mark.parametrize("terms", [[], ["a"], ["a", "a"]])
+    def test_degenerate_inputs(self, terms: list[str]) -> None:
+        """Sem dois termos distintos não há pares, e o agrupamento com blocagem não falha."""
+        from analysis.indicator import fuzzy_cluster_terms
+
+        rows, cols = blocked_similarity_edges(list(dict.fromkeys(terms)), threshold=88)
+
+        assert len(rows) == len(cols) == 0
+        assert fuzzy_cluster_terms(terms, 88, blocking=True) == ([["a"]] if terms else [])
+
+
+class TestConnectedComponents:
+    """Testes para a função connected_components."""
+
+    def test_labels_are_component_minimum(self) -> None:
+        """Cada nó deve receber o menor índice da sua componente."""
+        rows = np.array([4, 1, 5])
+        cols = np.array([2, 4, 6])
+        labels = connected_components(7, rows, cols)
+
+        assert labels.tolist() == [0, 1, 1, 3, 1, 5, 5]
+
+    def test_invalid_method(self) -> None:
+        """Deve rejeitar método desconhecido."""
+        empty = np.empty(0, dtype=np.int64)
+        with pytest.raises(ValueError):
+            cluster_indices(2, empty, empty, method="kmeans")
@@ -0,0 +1,88 @@
+# tests/test_coercion.py
+"""
+Testes para o módulo core.coercion
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from core.coercion import ColumnFormat, coerce_columns, detect_format
+from core.loader import iter_spreadsheet_chunks, load_spreadsheet
+
+
+class TestCoerceColumns:
+    """Testes para a função coerce_columns."""
+
+    def test_numbers_currency_percent_and_dates(self) -> None:
+        """Deve converter números, moeda, percentuais e datas pt-BR."""
+        df = pd.DataFrame(
+            {
+                "valor": ["1.234,56", "10", None, "-0,5"],
+                "preco": ["R$ 1.234,56", "R$ 3", "R$ -10,00", None],
+                "taxa": ["12,5%", "3%", "100%", "0,5%"],
+                "quando": ["31/12/2024", "01/02/2024", None, "5/6/2023"],
+            }
+        )
+        formats = {}
+        result = coerce_columns(df, formats)
+
+        np.testing.assert_array_equal(result["valor"], [1234.56, 10.0, np.nan, -0.5])
+        np.testing.assert_array_equal(result["preco"], [1234.56, 3.0, -10.0, np.nan])
+        np.testing.assert_array_equal(result["taxa"], [12.5, 3.0, 100.0, 0.5])
+        assert result["quando"].tolist()[:2] == [
+            pd.Timestamp("2024-12-31"),
+            pd.Timestamp("2024-02-01"),
+        ]
+        assert pd.isna(result["quando"].iloc[2])
+        assert formats["preco"] == ColumnFormat("moeda")
+        assert formats["taxa"] == ColumnFormat("percentual")
+        assert formats["quando"] == ColumnFormat("data", "%d/%m/%Y")
+
+    def test_keeps_codes_and_text(self) -> None:
+        """Códigos com zeros à esquerda, só dígitos e texto livre continuam texto."""
+        df = pd.DataFrame(
+            {
+                "cep": ["01310100", "22041080", "30130000"],
+                "codigo": ["123", "456", "789"],
+                "nome": ["Ana", "Bia", "Caio"],
+                "data_us": ["12/31/2024", "01/15/2024", "02/20/2024"],
+            }
+        )
+        formats = {}
+        result = coerce_columns(df, formats)
+
+        pd.testing.assert_frame_equal(result, df)
+        assert set(formats.values()) == {None}
+
+    def test_whole_column_must_agree(self) -> None:
+        """Coluna fica como texto se valores fora da amostra não seguirem o formato."""
+        series = pd.Series(["1,5"] * 50 + ["abc"] + ["2,5"] * 50)
+
+        assert detect_format(series, sample_size=10) == ColumnFormat("numero")
+        assert coerce_columns(series.to_frame("x"), sample_size=10)["x"].iloc[50] == "abc"
+
+    def test_categorical_column(self) -> None:
+        """Colunas category também são convertidas."""
+        df = pd.DataFrame({"x": pd.Categorical(["1,5", "2,5", None, "1,5"])})
+
+        np.testing.assert_array_equal(coerce_columns(df)["x"], [1.5, 2.5, np.nan, 1.5])
+
+
+class TestLoaderCoercion:
+    """Conversão no carregamento e na leitura em blocos."""
+
+    def test_load_and_stream_same_types(self, tmp_path: Path) -> None:
+        """load_spreadsheet e os blocos devem chegar aos mesmos valores convertidos."""
+        rows = [f"{i};R$ {i},{i % 100:02d};{i % 28 + 1:02d}/03/2024" for i in range(1, 301)]
+        path = tmp_path / "vendas.csv"
+        path.write_text("pedido;total;emissao\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+        df = load_spreadsheet(path, use_cache=False, optimize=False)
+        chunks = list(iter_spreadsheet_chunks(path, chunksize=50))
+
+        assert df["total"].dtype == np.float64
+        assert pd.api.types.is_datetime64_any_dtype(df["emissao"])
+        assert df["total"].iloc[0] == 1.01
+        pd.testing.assert_frame_equal(pd.concat(chunks), df)
@@ -0,0 +1,101 @@
+# tests/test_content.py
+"""
+Testes para o módulo analysis.content
+"""
+
+import numpy as np
+import pandas as pd
+
+from analysis.content import detect_value_types, infer_value_type
+from analysis.indicator import generate_indicators
+from analysis.streaming import generate_indicators_streaming
+
+
+def _check_digit(digits: list[int], weights: list[int]) -> int:
+    remainder = sum(d * w for d, w in zip(digits, weights, strict=True)) % 11
+    return 0 if remainder < 2 else 11 - remainder
+
+
+def _cnpj(base: int) -> str:
+    """CNPJ formatado com dígitos verificadores válidos para a raiz ``base``."""
+    digits = [int(c) for c in f"{base:08d}0001"]
+    digits.append(_check_digit(digits, [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]))
+    digits.append(_check_digit(digits, [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2]))
+    s = "".join(map(str, digits))
+    return f"{s[:2]}.{s[2:5]}.{s[5:8]}/{s[8:12]}-{s[12:]}"
+
+
+class TestDetectValueTypes:
+    """Testes para detect_value_types e infer_value_type."""
+
+    def test_detects_codes_and_formats(self) -> None:
+        """Cada coluna de texto recebe o tipo dos seus valores; texto livre fica de fora."""
+        df = pd.DataFrame(
+            {
+                "a": ["529.982.247-25", "52998224725", None],
+                "b": ["11.222.333/0001-81", "11222333000181", ""],
+                "c": ["01310-100", "20040-002", "30130-010"],
+                "d": ["ana@exemplo.com.br", "joao@empresa.com", "x@y.org"],
+                "e": ["(11) 98765-4321", "21 3456-7890", "(31)99876-5432"],
+                "f": ["123e4567-e89b-12d3-a456-426614174000"] * 3,
+                "g": ["R$ 1.234,56", "R$ 10,00", "R$ 0,99"],
+                "h": ["31/12/2023", "01/02/2024", "15/06/2024"],
+                "i": ["centro", "norte", "sul"],
+                "j": [1, 2, 3],
+            }
+        )
+
+        assert detect_value_types(df) == {
+            "a": "cpf",
+            "b": "cnpj",
+            "c": "cep",
+            "d": "email",
+            "e": "telefone",
+            "f": "uuid",
+            "g": "moeda",
+            "h": "data",
+        }
+        assert detect_value_types(df, ["c", "i", "j"]) == {"c": "cep"}
+
+    def test_invalid_check_digits_are_not_documents(self) -> None:
+        """CPFs com dígito verificador errado ou repetidos não são CPF."""
+        assert infer_value_type(pd.Series(["529.982.247-26", "123.456.789-00"])) is None
+        assert infer_value_type(pd.Series(["111.111.111-11", "000.000.000-00"])) is None
+        assert infer_value_type(pd.Series(["529.982.247-25"])) == "cpf"
+
+
+class TestValueTypeRouting:
+    """Testes para o ramo de análise escolhido pelo tipo inferido."""
+
+    def test_codes_are_grouped_without_fuzzy_merge(self) -> None:
+        """CNPJs parecidos não são unidos; o tipo vem dos valores quando o cabeçalho não diz."""
+        values = [_cnpj(base) for base in (11222333, 11222334, 11222335)]
+        df = pd.DataFrame({"codigo": np.arange(9), "Campo 7": values * 3})
+
+        result = generate_indicators(df)
+        (grupo,) = result["agrupamentos"]
+        assert grupo["tipo"] == "cnpj"
+        assert len(grupo["tabela"]) == 3
+
+        chunks = (df.iloc[i : i + 4] for i in range(0, len(df), 4))
+        (streamed,) = generate_indicators_streaming(chunks)["agrupamentos"]
+        assert streamed["tipo"] == "cnpj"
+        pd.testing.assert_frame_equal(
+            streamed["tabela"].reset_index(drop=True), grupo["tabela"].reset_index(drop=True)
+        )
+
+    def test_money_text_gets_numeric_statistics(self) -> None:
+        """Valores em reais no formato brasileiro vão para o ramo numérico."""
+        df = pd.DataFrame(
+            {
+                "codigo": np.arange(40),
+                "Campo 2": [f"R$ {v:,.2f}".translate(str.maketrans(",.", ".,")) for v in range(40)],
+            }
+        )
+
+        (grupo,) = generate_indicators(df)["agrupamentos"]
+        assert grupo["tipo"] == "moeda"
+        assert grupo["estatisticas"] == {"min": 0.0, "max": 39.0, "media": 19.5}
+        chunks = (df.iloc[i : i + 15] for i in range(0, len(df), 15))
+        (streamed,) = generate_indicators_streaming(chunks)["agrupamentos"]
+        assert streamed["estatisticas"] == grupo["estatisticas"]
@@ -0,0 +1,46 @@
+# tests/test_dates.py
+"""
+Testes para o módulo core.dates
+"""
+
+import pandas as pd
+
+from analysis.indicator import generate_indicators
+from core.dates import infer_date_format, parse_dates
+
+
+class TestParseDates:
+    """Testes para infer_date_format e parse_dates."""
+
+    def test_infer_format(self) -> None:
+        """Deve inferir ISO e dd/mm/aaaa, recusando mm/dd/aaaa."""
+        assert infer_date_format(pd.Series(["2024-01-15", "2024-12-31"])) == "%Y-%m-%d"
+        assert infer_date_format(pd.Series(["15/01/2024", "01/02/2024"])) == "%d/%m/%Y"
+        assert infer_date_format(pd.Series(["01/15/2024", "02/20/2024"])) is None
+
+    def test_matches_to_datetime(self) -> None:
+        """Deve dar o mesmo resultado de pd.to_datetime com o formato da amostra."""
+        valores = ["01/02/2024", None, "31/12/2024", "15/03/2024"] * 5 + ["xx"]
+        series = pd.Series(valores, name="data")
+        expected = pd.to_datetime(series, format="%d/%m/%Y", errors="coerce")
+
+        result = parse_dates(series)
+
+        pd.testing.assert_series_equal(result, expected)
+        pd.testing.assert_series_equal(parse_dates(series.astype("category")), expected)
+
+    def test_datetime_column_is_reused(self) -> None:
+        """Colunas já convertidas voltam sem nova conversão."""
+        series = pd.Series(pd.to_datetime(["2024-01-15", "2024-02-20"]))
+
+        assert parse_dates(series) is series
+
+    def test_indicators_on_loaded_dates(self) -> None:
+        """Indicadores de datas convertidas ou em texto devem coincidir."""
+        texto = pd.DataFrame({"data": ["15/01/2024", "02/03/2024", None]})
+        convertido = texto.assign(data=parse_dates(texto["data"]))
+
+        estatisticas = generate_indicators(texto)["agrupamentos"][0]["estatisticas"]
+
+        assert estatisticas == {"min": "2024-01-15 00:00:00", "max": "2024-03-02 00:00:00"}
+        assert generate_indicators(convertido)["agrupamentos"][0]["estatisticas"] == estatisticas
@@ -0,0 +1,164 @@
+# tests/test_detector.py
+"""
+Testes para o módulo analysis.detector
+"""
+
+import json
+from collections.abc import Generator
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from analysis import detector
+from analysis.detector import (
+    SynonymIndex,
+    detect_column_types,
+    domain_synonyms,
+    reload_synonyms,
+    synonym_index,
+)
+
+
+@pytest.fixture
+def user_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Generator[Path, None, None]:
+    """Diretório de dicionários do usuário, com índice e dicionário recarregados."""
+    directory = tmp_path / "sinonimos"
+    directory.mkdir()
+    monkeypatch.setattr("analysis.detector.USER_SYNONYMS_DIR", directory)
+    reload_synonyms()
+    yield directory
+    monkeypatch.undo()
+    reload_synonyms()
+
+
+class TestDetectColumnTypes:
+    """Testes para detect_column_types e o índice de sinônimos."""
+
+    def test_longest_synonym_wins(self) -> None:
+        """Cabeçalhos iguais ou com prefixo de sinônimo; vale o sinônimo mais longo."""
+        df = pd.DataFrame(
+            columns=["Farmácia Veterinária Central", " FARMACIA ", "CEP", "Endereço Completo"]
+        )
+
+        assert detect_column_types(df) == {
+            "Farmácia Veterinária Central": "farmacia_veterinaria",
+            " FARMACIA ": "farmacia",
+            "CEP": "cep",
+            "Endereço Completo": "endereco_completo",
+        }
+
+    def test_index_prefix_lookup(self) -> None:
+        """Sinônimo repetido fica com o primeiro tipo; sem prefixo, None."""
+        index = SynonymIndex({"loja": ["Loja", "Ponto"], "ponto": ["Ponto", "Ponto de Venda"]})
+
+        assert index.classify("Ponto") == "loja"
+        assert index.classify("Ponto de Venda 2") == "ponto"
+        assert index.classify("Lojas") == "loja"
+        assert index.classify("Lo") is None
+        assert synonym_index() is synonym_index()
+
+    def test_fuzzy_stage_for_unmatched_headers(self) -> None:
+        """Cabeçalhos com erro de digitação recebem o tipo do sinônimo mais parecido."""
+        df = pd.DataFrame(columns=["Cidde", "Muncipio", "Telefnoe", "coluna_5", "CEP"])
+
+        assert detect_column_types(df) == {
+            "Cidde": "cidade",
+            "Muncipio": "cidade",
+            "Telefnoe": "telefone",
+            "coluna_5": None,
+            "CEP": "cep",
+        }
+        assert detect_column_types(df, fuzzy=False)["Cidde"] is None
+        index = SynonymIndex({"pedido": ["Número do Pedido"]})
+        assert index.closest(["pedido do numero", "numero pedido", "pedra"]) == [
+            "pedido",
+            "pedido",
+            None,
+        ]
+
+    def test_weak_prefixes_go_to_fuzzy_stage(self) -> None:
+        """Prefixos que terminam no meio de uma palavra não decidem o tipo sozinhos."""
+        df = pd.DataFrame(
+            columns=["Endreço Entrega", "Qtd", "x1", "qtd_vendida", "Valores", "Telefone1"]
+        )
+
+        assert detect_column_types(df) == {
+            "Endreço Entrega": "endereco",
+            "Qtd": None,
+            "x1": None,
+            "qtd_vendida": None,
+            "Valores": "valor",
+            "Telefone1": "telefone",
+        }
+        index = SynonymIndex({"quiktrip": ["QuikTrip"], "qtd": ["Qtd"]})
+        assert index.closest(["qtd", "quicktrip"]) == [None, "quiktrip"]
+
+    def test_whole_word_prefixes_skip_fuzzy_stage(self) -> None:
+        """Sinônimo curto que é uma palavra inteira vale, sem etapa aproximada nas demais."""
+        df = pd.DataFrame(
+            columns=[
+                "cpf_cliente",
+                "CPF Cliente",
+                "cep_entrega",
+                "id_pedido",
+                "tel_cliente",
+                "sku_produto",
+                "Nº Pedido Cliente",
+                "Ano 2020",
+            ]
+        )
+
+        assert detect_column_types(df) == {
+            "cpf_cliente": "cnpj",
+            "CPF Cliente": "cnpj",
+            "cep_entrega": "cep",
+            "id_pedido": "id",
+            "tel_cliente": "telefone",
+            "sku_produto": "sku",
+            "Nº Pedido Cliente": "numero",
+            "Ano 2020": "ano",
+        }
+
+
+class TestSynonymDictionaries:
+    """Testes para os dicionários em arquivo, do usuário e o índice em cache."""
+
+    def test_user_dictionary_is_merged(self, user_dir: Path) -> None:
+        """Tipos novos e sinônimos repetidos do usuário têm precedência."""
+        (user_dir / "loja.json").write_text(
+            json.dumps({"filial": ["Farmácia", "Filial"], "cep": ["Código de Endereçamento"]}),
+            encoding="utf-8",
+        )
+        (user_dir / "quebrado.json").write_text("[1, 2", encoding="utf-8")
+        reload_synonyms()
+
+        df = pd.DataFrame(columns=["Farmácia", "Filial 3", "Código de Endereçamento", "CEP"])
+        assert detect_column_types(df) == {
+            "Farmácia": "filial",
+            "Filial 3": "filial",
+            "Código de Endereçamento": "cep",
+            "CEP": "cep",
+        }
+        assert domain_synonyms()["cep"][:2] == ["Código de Endereçamento", "CEP"]
+        assert detector.DOMAIN_SYNONYMS is domain_synonyms()
+
+    def test_index_cache_follows_dictionaries(
+        self, user_dir: Path, isolated_cache_dir: Path
+    ) -> None:
+        """O índice é reaproveitado do cache e refeito quando um dicionário muda."""
+        extra = user_dir / "extra.json"
+        extra.write_text(json.dumps({"lote": ["Lote"]}), encoding="utf-8")
+        reload_synonyms()
+        assert synonym_index().classify("Lote 7") == "lote"
+        (entry,) = isolated_cache_dir.glob("sinonimos-*.pickle")
+
+        reload_synonyms()
+        assert detector._load_index(entry) is not None
+        assert synonym_index().classify("Lote 7") == "lote"
+
+        extra.write_text(json.dumps({"quadra": ["Lote"]}), encoding="utf-8")
+        reload_synonyms()
+        assert synonym_index().classify("Lote 7") == "quadra"
+        assert list(isolated_cache_dir.glob("sinonimos-*.pickle")) != [entry]
+        assert not entry.exists()
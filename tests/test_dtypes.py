@@ -0,0 +1,79 @@
+"""
+Testes para o módulo core.dtypes
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from analysis.indicator import generate_indicators
+from core.dtypes import ARROW_STRING, optimize_dtypes
+from core.id_generator import detect_native_id_column
+from core.utils import normalize_cep_column
+
+
+@pytest.fixture
+def mixed_dataframe() -> pd.DataFrame:
+    """DataFrame com texto, números, nulos e uma coluna de tipos mistos."""
+    rng = np.random.default_rng(5)
+    n = 2000
+    return pd.DataFrame(
+        {
+            "codigo": [f"C{i:05d}" for i in range(n)],
+            "cidade": rng.choice(["São Paulo", "Sao Paulo", "Rio de Janeiro", None], n),
+            "cep": rng.choice([1310100, 22041080, 30130000], n),
+            "faixa": rng.integers(0, 4, n),
+            "nota": rng.choice([0.5, 1.5, np.nan], n),
+            "valor": rng.random(n),
+            "misto": [1 if i % 2 else "a" for i in range(n)],
+        }
+    )
+
+
+class TestOptimizeDtypes:
+    """Testes para a função optimize_dtypes."""
+
+    def test_compact_types_and_report(self, mixed_dataframe: pd.DataFrame) -> None:
+        """Deve compactar texto e números e reportar a memória por coluna."""
+        report = {}
+        df = optimize_dtypes(mixed_dataframe, report=report)
+
+        assert isinstance(df["cidade"].dtype, pd.CategoricalDtype)
+        assert df["faixa"].dtype == np.int8
+        assert df["cep"].dtype == np.int32
+        # Floats (mesmo os exatos em float32) e colunas mistas ficam como estão
+        assert df["nota"].dtype == np.float64
+        assert df["valor"].dtype == np.float64
+        assert df["misto"].dtype == object
+        if ARROW_STRING is not None:
+            assert df["codigo"].dtype == ARROW_STRING
+        assert report["cidade"]["bytes_depois"] < report["cidade"]["bytes_antes"]
+        assert "valor" not in report
+        assert pd.isna(df["cidade"]).sum() == mixed_dataframe["cidade"].isna().sum()
+
+    def test_float_statistics_unchanged(self) -> None:
+        """Inteiros com ausentes (float64) mantêm a média calculada em precisão dupla."""
+        rng = np.random.default_rng(3)
+        values = rng.integers(0, 25_000, 200_000).astype(float)
+        values[::97] = np.nan
+        df = pd.DataFrame({"codigo": np.arange(len(values)), "qtd": values})
+
+        compact = optimize_dtypes(df)
+        assert compact["qtd"].dtype == np.float64
+        assert compact["qtd"].mean() == df["qtd"].mean()
+
+    def test_analysis_on_compact_types(self, mixed_dataframe: pd.DataFrame) -> None:
+        """CEP, ID e indicadores devem funcionar sobre os tipos compactos."""
+        original = normalize_cep_column(mixed_dataframe.drop(columns="misto"))
+        compact = normalize_cep_column(optimize_dtypes(mixed_dataframe.drop(columns="misto")))
+
+        assert detect_native_id_column(compact) == "codigo"
+        assert compact["cep"].tolist() == original["cep"].tolist()
+
+        expected = generate_indicators(original)
+        result = generate_indicators(compact)
+        assert result["id_coluna"] == expected["id_coluna"]
+        for exp, res in zip(expected["agrupamentos"], result["agrupamentos"], strict=True):
+            assert res["estatisticas"] == exp["estatisticas"]
+            if exp["tabela"] is not None:
+                pd.testing.assert_frame_equal(res["tabela"], exp["tabela"])
@@ -0,0 +1,82 @@
+# tests/test_embeddings.py
+"""
+Testes para o módulo analysis.embeddings
+"""
+
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from analysis import embeddings
+
+
+class FakeModel:
+    def __init__(self, name: str, device: str | None) -> None:
+        self.name = name
+        self.device = device
+
+
+@pytest.fixture
+def loads(monkeypatch: pytest.MonkeyPatch) -> Generator[list, None, None]:
+    """Substitui o carregamento real por um lento que registra cada chamada."""
+    calls = []
+
+    def fake_load(name: str, device: str | None) -> FakeModel:
+        calls.append((name, device))
+        time.sleep(0.05)
+        return FakeModel(name, device)
+
+    embeddings.clear_models()
+    monkeypatch.setattr(embeddings, "_load_model", fake_load)
+    yield calls
+    embeddings.clear_models()
+
+
+class TestGetModel:
+    """Testes para get_model e warm_up."""
+
+    def test_concurrent_callers_share_one_load(self, loads: list) -> None:
+        """Threads simultâneas recebem a mesma instância, carregada uma vez por chave."""
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(embeddings.get_model("m")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 8 and all(model is results[0] for model in results)
+        assert embeddings.get_model("m", "cpu") is not results[0]
+        assert loads == [("m", None), ("m", "cpu")]
+
+    def test_warm_up_loads_in_background(self, loads: list) -> None:
+        """O pré-carregamento deixa o modelo pronto para o primeiro uso."""
+        assert not embeddings.is_loaded("m")
+        embeddings.warm_up("m").join()
+
+        assert embeddings.is_loaded("m")
+        assert embeddings.get_model("m").name == "m"
+        assert loads == [("m", None)]
+
+    def test_import_does_not_load_models(self) -> None:
+        """Importar a análise semântica não importa sentence_transformers nem torch."""
+        code = (
+            "import sys, analysis.semantic; "
+            "print('sentence_transformers' in sys.modules or 'torch' in sys.modules)"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parents[1],
+        )
+
+        assert result.stdout.strip() == "False"
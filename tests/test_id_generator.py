@@ -0,0 +1,72 @@
+# tests/test_id_generator.py
+"""
+Testes para o módulo core.id_generator
+"""
+
+import numpy as np
+import pandas as pd
+
+from core.id_generator import (
+    COMPOSITE_ID_COLUMN,
+    composite_key_fingerprint,
+    detect_composite_key,
+    detect_native_id_column,
+    ensure_id_column,
+    get_id_column_name,
+)
+
+
+def _orders() -> pd.DataFrame:
+    """Itens de pedido: só (filial, pedido, item) identifica a linha."""
+    rng = np.random.default_rng(6)
+    filial, pedido, item = np.meshgrid(np.arange(3), np.arange(500), np.arange(1, 3))
+    rows = rng.permutation(filial.size)
+    return pd.DataFrame(
+        {
+            "filial": np.array(["Centro", "Norte", "Sul"])[filial.ravel()[rows]],
+            "pedido": pedido.ravel()[rows],
+            "item": item.ravel()[rows],
+            "valor": rng.integers(0, 50, filial.size) / 10,
+        }
+    )
+
+
+class TestCompositeKey:
+    """Testes para detect_composite_key e a coluna de impressão digital."""
+
+    def test_detects_smallest_unique_combination(self) -> None:
+        """Deve achar a combinação mínima, na ordem das colunas."""
+        df = _orders()
+
+        assert detect_composite_key(df) == ["filial", "pedido", "item"]
+        assert detect_composite_key(df, max_columns=2) is None
+        assert detect_composite_key(df, time_budget=0) is None
+
+    def test_ensure_id_column_adds_fingerprint(self) -> None:
+        """O ID composto deve ser int64, único e reproduzível a partir da origem."""
+        df = _orders()
+        result = ensure_id_column(df)
+        fingerprint = result[COMPOSITE_ID_COLUMN]
+
+        assert result.columns[0] == COMPOSITE_ID_COLUMN
+        assert fingerprint.dtype == np.int64 and fingerprint.is_unique
+        assert get_id_column_name(result) == COMPOSITE_ID_COLUMN
+        origem = composite_key_fingerprint(df, ["filial", "pedido", "item"])
+        np.testing.assert_array_equal(fingerprint.to_numpy(), origem)
+
+    def test_object_values_are_compared_by_value(self) -> None:
+        """1 e 1.0 em colunas object são o mesmo valor na chave."""
+        df = pd.DataFrame({"a": [1, 1.0, 2, 2], "b": ["x", "x", "y", "z"]}, dtype=object)
+
+        assert detect_composite_key(df) is None
+
+
+class TestNativeIdColumn:
+    """Testes para detect_native_id_column."""
+
+    def test_named_column_with_missing_values_needs_coverage(self) -> None:
+        """Ausentes não contam como valores únicos para atingir os 95%."""
+        df = pd.DataFrame({"codigo": [*range(1, 10), None], "v": [1] * 10})
+
+        assert detect_native_id_column(df) is None
+        assert detect_native_id_column(df.fillna({"codigo": 10})) == "codigo"
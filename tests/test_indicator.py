@@ -3,15 +3,20 @@
 Testes para o módulo analysis.indicator
 """
 
+import numpy as np
 import pandas as pd
+from rapidfuzz import fuzz
 
 from analysis.indicator import (
+    _process_categorical_column,
     fuzzy_cluster_terms,
+    generate_indicators,
     is_date_candidate,
     is_id_column,
     is_numerical,
     normalize_generic,
 )
+from core.id_generator import SYNTHETIC_ID_COLUMN, ensure_id_column, get_id_column_name
 
 
 class TestIsIdColumn:
@@ -111,3 +116,181 @@ def test_max_terms_limit(self) -> None:
 
         # Quando excede o limite, cada termo vira um cluster individual
         assert len(clusters) == 600
+
+    def test_matches_legacy_greedy_algorithm(self) -> None:
+        """Deve reproduzir o algoritmo original (laço O(n²)) em entradas pequenas."""
+
+        def legacy(terms, threshold):
+            clusters, used = [], set()
+            for term in terms:
+                if term in used:
+                    continue
+                cluster = [term]
+                used.add(term)
+                for candidate in terms:
+                    if candidate in used:
+                        continue
+                    if fuzz.ratio(term, candidate) >= threshold:
+                        cluster.append(candidate)
+                        used.add(candidate)
+                clusters.append(cluster)
+            return clusters
+
+        rng = np.random.default_rng(42)
+        bases = ["sao paulo", "rio de janeiro", "belo horizonte", "curitiba", "recife"]
+        letters = list("abcdefghijklmnopqrstuvwxyz ")
+        terms = []
+        for _ in range(300):
+            base = list(bases[rng.integers(len(bases))])
+            base[rng.integers(len(base))] = letters[rng.integers(len(letters))]
+            terms.append("".join(base))
+
+        for threshold in (80, 88, 95):
+            assert fuzzy_cluster_terms(terms, threshold=threshold) == legacy(terms, threshold)
+
+    def test_components_method_chains_variants(self) -> None:
+        """Com componentes conexas, variações encadeadas ficam no mesmo grupo."""
+        terms = ["abcdefghij", "abcdefghxx", "abcdefxxxx"]
+        greedy = fuzzy_cluster_terms(terms, threshold=80)
+        components = fuzzy_cluster_terms(terms, threshold=80, method="components")
+
+        assert greedy == [["abcdefghij", "abcdefghxx"], ["abcdefxxxx"]]
+        assert components == [["abcdefghij", "abcdefghxx", "abcdefxxxx"]]
+
+    def test_blocking_groups_variants(self) -> None:
+        """Com blocagem, variações próximas continuam agrupadas."""
+        terms = ["sao paulo", "rio de janeiro", "sao paulu", "rio de janeir"]
+        clusters = fuzzy_cluster_terms(terms, threshold=88, blocking=True)
+
+        assert clusters == [["sao paulo", "sao paulu"], ["rio de janeiro", "rio de janeir"]]
+
+
+class TestProcessCategoricalColumn:
+    """Testes para a função _process_categorical_column."""
+
+    @staticmethod
+    def _legacy(df, col, id_col):
+        valores = df[[col, id_col]].dropna()
+        vc = valores[col].value_counts()
+        if len(vc) > 200:
+            top = vc.head(100).index
+            valores = valores[valores[col].isin(top)]
+        mapping = {}
+        for _, row in valores.iterrows():
+            orig = str(row[col]).strip()
+            norm = normalize_generic(orig)
+            rec = mapping.setdefault(norm, {"originais": set(), "ids": set()})
+            rec["originais"].add(orig)
+            rec["ids"].add(str(row[id_col]))
+        tabela = []
+        for cluster in fuzzy_cluster_terms(list(mapping), threshold=88):
+            vars_, ids = set(), set()
+            for norm in cluster:
+                vars_.update(mapping[norm]["originais"])
+                ids.update(mapping[norm]["ids"])
+            tabela.append(
+                {
+                    "termo_base": max(cluster, key=len).upper(),
+                    "variantes": "; ".join(sorted(vars_)),
+                    "frequencia": len(ids),
+                    "ids": ",".join(sorted(ids)),
+                }
+            )
+        return pd.DataFrame(tabela).sort_values("frequencia", ascending=False)
+
+    def test_matches_row_by_row_implementation(self, sample_dataframe: pd.DataFrame) -> None:
+        """Deve produzir a mesma tabela que a versão com iterrows."""
+        df = sample_dataframe.copy()
+        df.loc[2, "cidade"] = None
+        for col in ("nome", "cidade", "data"):
+            expected = self._legacy(df, col, "id")
+            result = _process_categorical_column(df, col, "id")
+            pd.testing.assert_frame_equal(result, expected)
+
+    def test_matches_legacy_with_many_categories(self) -> None:
+        """Deve manter o corte das categorias mais frequentes e os IDs textuais."""
+        rng = np.random.default_rng(3)
+        n = 2000
+        df = pd.DataFrame(
+            {
+                "codigo": [f"C{i:05d}" for i in rng.permutation(n)],
+                "cliente": [f" Cliente {int(v)} " for v in rng.zipf(1.5, n) % 400],
+                "faixa": rng.integers(0, 5, n).astype(float),
+            }
+        )
+        for col in ("cliente", "faixa"):
+            expected = self._legacy(df, col, "codigo")
+            result = _process_categorical_column(df, col, "codigo")
+            pd.testing.assert_frame_equal(result, expected)
+
+    def test_integer_ids_keep_text_order(self) -> None:
+        """IDs inteiros devem sair na mesma ordem textual dos IDs convertidos em texto."""
+        rng = np.random.default_rng(4)
+        n = 1500
+        df = pd.DataFrame(
+            {"num": rng.permutation(n) * 7, "cor": rng.choice(["azul", "verde", "Azul "], n)}
+        )
+        expected = self._legacy(df, "cor", "num")
+        pd.testing.assert_frame_equal(_process_categorical_column(df, "cor", "num"), expected)
+
+    def test_mixed_bool_and_numbers_stay_apart(self) -> None:
+        """True, 1 e 1.0 numa coluna object são grupos diferentes, como na versão por texto."""
+        df = pd.DataFrame(
+            {
+                "id": range(8),
+                "ativo": pd.Series([True, 1, 1.0, True, "sim", 1, False, 0], dtype=object),
+            }
+        )
+        expected = self._legacy(df, "ativo", "id")
+        result = _process_categorical_column(df, "ativo", "id")
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert len(result) == 6
+
+    def test_empty_column_returns_none(self) -> None:
+        """Coluna sem valores deve retornar None."""
+        df = pd.DataFrame({"id": [1, 2], "obs": [None, None]})
+        assert _process_categorical_column(df, "obs", "id") is None
+
+
+class TestGenerateIndicators:
+    """Testes para a função generate_indicators."""
+
+    def test_parallel_matches_serial(self, sample_dataframe: pd.DataFrame) -> None:
+        """O modo com pool de processos deve gerar os mesmos indicadores."""
+        calls = []
+        serial = generate_indicators(sample_dataframe)
+        parallel = generate_indicators(
+            sample_dataframe,
+            progress_callback=lambda processed, total: calls.append((processed, total)),
+            workers=2,
+        )
+
+        assert calls == [(1, 4), (2, 4), (3, 4), (4, 4)]
+        assert [g["coluna"] for g in parallel["agrupamentos"]] == [
+            "nome",
+            "cidade",
+            "valor",
+            "data",
+        ]
+        for expected, result in zip(serial["agrupamentos"], parallel["agrupamentos"], strict=True):
+            assert result["estatisticas"] == expected["estatisticas"]
+            if expected["tabela"] is None:
+                assert result["tabela"] is None
+            else:
+                pd.testing.assert_frame_equal(result["tabela"], expected["tabela"])
+
+    def test_synthetic_id_shared_with_ensure_id_column(self) -> None:
+        """O ID de ensure_id_column deve ser reconhecido como sintético, com os mesmos IDs."""
+        df = pd.DataFrame({"cor": ["azul", "verde", "azul"] * 4})
+        com_id = ensure_id_column(df)
+
+        assert com_id[SYNTHETIC_ID_COLUMN].dtype == np.int64
+        assert get_id_column_name(com_id) == SYNTHETIC_ID_COLUMN
+        expected = generate_indicators(df)
+        result = generate_indicators(com_id)
+        assert result["id_coluna"] == expected["id_coluna"] == SYNTHETIC_ID_COLUMN
+        assert result["id_is_synthetic"] and expected["id_is_synthetic"]
+        pd.testing.assert_frame_equal(
+            result["agrupamentos"][0]["tabela"], expected["agrupamentos"][0]["tabela"]
+        )
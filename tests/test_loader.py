@@ -3,16 +3,26 @@
 Testes para o módulo core.loader
 """
 
+import os
+from datetime import datetime
 from pathlib import Path
 
+import openpyxl
 import pandas as pd
 import pytest
 
 from core.exceptions import UnsupportedFormatError
 from core.loader import (
+    CSV_BACKENDS,
+    _clean_excel_frame,
     detect_delimiter,
     detect_encoding,
+    iter_excel_chunks,
+    iter_spreadsheet_chunks,
+    list_sheets,
     load_spreadsheet,
+    read_csv,
+    sniff_csv,
     validate_file,
 )
 
@@ -64,6 +74,55 @@ def test_detect_semicolon(self, temp_csv_semicolon: Path) -> None:
         assert delimiter == ";"
 
 
+class TestSniffCsv:
+    """Testes para a detecção de dialeto CSV."""
+
+    def test_brazilian_numbers(self, tmp_path: Path) -> None:
+        """Vírgula decimal e ponto de milhar devem virar números."""
+        csv_path = tmp_path / "br.csv"
+        csv_path.write_text(
+            "id;descricao;valor;data\n"
+            '1;"Item; com separador";1.234,56;15/01/2024\n'
+            "2;Outro;100,50;16/01/2024\n"
+            "3;Mais um;-2.000,00;17/01/2024\n",
+            encoding="cp1252",
+        )
+        dialect = sniff_csv(csv_path)
+
+        assert (dialect.delimiter, dialect.decimal, dialect.thousands) == (";", ",", ".")
+        assert dialect.header
+        df = read_csv(csv_path)
+        assert df["valor"].tolist() == [1234.56, 100.5, -2000.0]
+        assert df["descricao"].iloc[0] == "Item; com separador"
+
+    def test_dotted_dates_disable_thousands(self, tmp_path: Path) -> None:
+        """Valores com ponto que não são milhar não podem perder o ponto."""
+        csv_path = tmp_path / "datas.csv"
+        csv_path.write_text("id;data;valor\n1;01.02.2024;10,5\n2;03.04.2024;1.000,0\n")
+
+        assert sniff_csv(csv_path).thousands is None
+
+    def test_without_header(self, tmp_path: Path) -> None:
+        """Arquivo sem cabeçalho deve ganhar nomes de coluna genéricos."""
+        csv_path = tmp_path / "sem_cabecalho.csv"
+        csv_path.write_text("1,10.5,a\n2,20.5,b\n3,30.5,c\n")
+
+        assert not sniff_csv(csv_path).header
+        df = read_csv(csv_path)
+        assert df.columns.tolist() == ["coluna_1", "coluna_2", "coluna_3"]
+        assert len(df) == 3
+
+    def test_samples_middle_and_tail(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Arquivos grandes devem ser amostrados em janelas alinhadas às linhas."""
+        monkeypatch.setattr("core.loader.CSV_SNIFF_BYTES", 256)
+        csv_path = tmp_path / "grande.csv"
+        linhas = [f"{i};cliente {i};{i},25" for i in range(2000)]
+        csv_path.write_text("id;cliente;valor\n" + "\n".join(linhas) + "\n")
+        dialect = sniff_csv(csv_path)
+
+        assert (dialect.delimiter, dialect.decimal) == (";", ",")
+
+
 class TestLoadSpreadsheet:
     """Testes para a função load_spreadsheet."""
 
@@ -95,3 +154,186 @@ def test_load_unsupported_format(self, tmp_path: Path) -> None:
 
         with pytest.raises(UnsupportedFormatError):
             load_spreadsheet(txt_file)
+
+
+@pytest.fixture
+def temp_xlsx_file(tmp_path: Path) -> Path:
+    """Planilha XLSX com cabeçalhos sujos, linhas vazias e tipos mistos."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["nome ", " valor", "data_cadastro", None, "obs", "obs"])
+    for i in range(250):
+        if i == 120:
+            sheet.append([])
+        sheet.append(
+            [
+                f" item {i % 7} ",
+                i * 1.5,
+                datetime(2024, 1, 1 + i % 28),
+                None,
+                "x" if i % 3 else None,
+                i,
+            ]
+        )
+    sheet.append([])
+    xlsx_path = tmp_path / "dados.xlsx"
+    workbook.save(xlsx_path)
+    return xlsx_path
+
+
+class TestExcelStreaming:
+    """Testes para a leitura de XLSX em blocos."""
+
+    def test_same_result_as_read_excel(self, temp_xlsx_file: Path) -> None:
+        """Blocos concatenados devem equivaler ao ``pd.read_excel`` original."""
+        expected = _clean_excel_frame(pd.read_excel(temp_xlsx_file, engine="openpyxl"))
+        calls = []
+        df = load_spreadsheet(
+            temp_xlsx_file,
+            use_cache=False,
+            progress_callback=lambda p, t: calls.append((p, t)),
+            optimize=False,
+        )
+
+        pd.testing.assert_frame_equal(df, expected)
+        assert calls[-1] == (251, 251)
+
+    def test_missing_text_is_not_nan_string(self, temp_xlsx_file: Path) -> None:
+        """Células vazias em colunas de texto devem continuar ausentes."""
+        df = load_spreadsheet(temp_xlsx_file, use_cache=False)
+
+        assert df["obs"].isna().sum() == 84
+        assert "nan" not in df["obs"].dropna().tolist()
+
+    def test_chunks_are_bounded(self, temp_xlsx_file: Path) -> None:
+        """Cada bloco deve ter no máximo ``chunksize`` linhas e índice global."""
+        chunks = list(iter_excel_chunks(temp_xlsx_file, chunksize=100))
+
+        assert [len(c) for c in chunks] == [100, 100, 51]
+        assert chunks[1].index[0] == 100
+        assert chunks[0].columns.tolist() == [
+            "nome ",
+            " valor",
+            "data_cadastro",
+            "Unnamed: 3",
+            "obs",
+            "obs.1",
+        ]
+
+    def test_numeric_dtype_change_between_chunks(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Inteiros que ganham vazio ou decimais depois do primeiro bloco continuam números."""
+        monkeypatch.setattr("core.loader.EXCEL_CHUNKSIZE", 50)
+        workbook = openpyxl.Workbook()
+        workbook.active.append(["codigo", "qtd", "preco", "obs"])
+        for i in range(120):
+            qtd = None if i == 90 else i % 7
+            preco = 10.5 if i == 110 else i % 5 + 1
+            obs = 3 if i == 100 else f"obs {i % 3}"
+            workbook.active.append([i, qtd, preco, obs])
+        xlsx_path = tmp_path / "tipos.xlsx"
+        workbook.save(xlsx_path)
+
+        expected = _clean_excel_frame(pd.read_excel(xlsx_path, engine="openpyxl"))
+        df = load_spreadsheet(xlsx_path, use_cache=False, optimize=False, coerce=False)
+
+        assert df["qtd"].dtype == "float64"
+        assert df["preco"].dtype == "float64"
+        pd.testing.assert_frame_equal(df, expected)
+
+    def test_spreadsheet_chunks_are_cleaned(self, temp_xlsx_file: Path) -> None:
+        """Os blocos de ``iter_spreadsheet_chunks`` já vêm limpos."""
+        chunks = list(iter_spreadsheet_chunks(temp_xlsx_file, chunksize=100))
+        expected = load_spreadsheet(temp_xlsx_file, use_cache=False, optimize=False)
+
+        pd.testing.assert_frame_equal(pd.concat(chunks), expected)
+
+    def test_sheet_selection(self, tmp_path: Path) -> None:
+        """Deve listar as abas e carregar a aba pedida."""
+        workbook = openpyxl.Workbook()
+        workbook.active.title = "Jan"
+        workbook.active.append(["id", "valor"])
+        workbook.active.append([1, 10])
+        segunda = workbook.create_sheet("Fev")
+        segunda.append(["id", "valor"])
+        segunda.append([2, 20])
+        xlsx_path = tmp_path / "abas.xlsx"
+        workbook.save(xlsx_path)
+
+        assert list_sheets(xlsx_path) == ["Jan", "Fev"]
+        assert load_spreadsheet(xlsx_path)["valor"].tolist() == [10]
+        assert load_spreadsheet(xlsx_path, sheet_name="Fev")["valor"].tolist() == [20]
+
+
+class TestCsvBackends:
+    """Testes para os leitores CSV plugáveis."""
+
+    @pytest.mark.parametrize("backend", sorted(CSV_BACKENDS))
+    def test_backends_read_same_data(self, temp_csv_semicolon: Path, backend: str) -> None:
+        """Todos os leitores devem produzir os mesmos valores."""
+        df = read_csv(temp_csv_semicolon, backend=backend)
+
+        assert df.columns.tolist() == ["id", "nome", "cidade", "valor"]
+        assert df["id"].tolist() == [1, 2, 3]
+        assert df["valor"].tolist() == [100.5, 200.75, 150.0]
+
+    @pytest.mark.skipif("pyarrow" not in CSV_BACKENDS, reason="pyarrow não instalado")
+    def test_pyarrow_keeps_dates_as_text(self, tmp_path: Path) -> None:
+        """O leitor pyarrow não deve converter datas que o pandas mantém como texto."""
+        csv_path = tmp_path / "datas.csv"
+        csv_path.write_text("id,data,obs\n1,2024-01-15,\n2,2024-02-20,ok\n", encoding="utf-8")
+        df = read_csv(csv_path, backend="pyarrow")
+
+        assert df["data"].tolist() == ["2024-01-15", "2024-02-20"]
+        assert pd.isna(df["obs"].iloc[0])
+
+    def test_missing_file_raises_load_error(self, tmp_path: Path) -> None:
+        """Arquivo inexistente deve levantar FileLoadError, já na detecção do dialeto."""
+        from core.exceptions import FileLoadError
+
+        with pytest.raises(FileLoadError):
+            read_csv(tmp_path / "nao_existe.csv")
+
+    def test_unknown_backend(self, temp_csv_file: Path) -> None:
+        """Deve rejeitar leitor desconhecido."""
+        with pytest.raises(ValueError):
+            read_csv(temp_csv_file, backend="polars")
+
+
+class TestSpreadsheetCache:
+    """Testes para o cache em disco de planilhas carregadas."""
+
+    def test_second_load_reads_cache(
+        self, temp_csv_file: Path, isolated_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Reabrir o mesmo arquivo não deve reprocessar o CSV."""
+        first = load_spreadsheet(temp_csv_file)
+        assert list(isolated_cache_dir.glob("*.arrow"))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("CSV relido apesar do cache")
+
+        monkeypatch.setattr("core.loader.pd.read_csv", fail)
+        second = load_spreadsheet(temp_csv_file)
+
+        pd.testing.assert_frame_equal(first, second, check_dtype=False)
+
+    def test_modified_file_invalidates_cache(self, temp_csv_file: Path) -> None:
+        """Alterar o arquivo deve gerar nova leitura."""
+        load_spreadsheet(temp_csv_file)
+        temp_csv_file.write_text("id,nome\n1,Novo\n", encoding="utf-8")
+
+        df = load_spreadsheet(temp_csv_file)
+        assert df["nome"].tolist() == ["Novo"]
+
+    def test_eviction_respects_size_limit(self, tmp_path: Path) -> None:
+        """Entradas antigas devem ser removidas acima do limite."""
+        from core import cache
+
+        df = pd.DataFrame({"valor": range(100_000)})
+        cache.store_cached("antiga", df, cache_dir=tmp_path, max_size_mb=1)
+        os.utime(tmp_path / "antiga.arrow", (0, 0))
+        cache.store_cached("nova", df, cache_dir=tmp_path, max_size_mb=1)
+
+        assert [p.stem for p in tmp_path.glob("*.arrow")] == ["nova"]
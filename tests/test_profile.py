@@ -0,0 +1,112 @@
+# tests/test_profile.py
+"""
+Testes para o módulo core.profile
+"""
+
+import gc
+
+import numpy as np
+import pandas as pd
+
+from core import profile as profile_module
+from core.id_generator import detect_native_id_column, get_id_column_name
+from core.profile import clear_profiles, column_profile, distinct_estimate, is_unique_column
+from core.sketch import HyperLogLog, has_duplicates
+
+
+class TestColumnProfile:
+    """Testes para a função column_profile."""
+
+    def test_matches_pandas_statistics(self, sample_dataframe: pd.DataFrame) -> None:
+        """Deve coincidir com nunique, is_unique, isna e comprimento do texto."""
+        df = sample_dataframe.assign(
+            cidade=sample_dataframe["cidade"].astype("category"),
+            nota=[1.0, np.nan, 1.0, np.nan, 2.0],
+        )
+        for col in df.columns:
+            profile = column_profile(df, col)
+            series = df[col]
+
+            assert profile.distinct == series.nunique()
+            assert profile.is_unique == series.is_unique
+            assert profile.null_count == series.isna().sum()
+            assert profile.sample.tolist() == series.dropna().head(100).tolist()
+        assert column_profile(df, "nome").mean_length == df["nome"].str.len().mean()
+        assert column_profile(df, "valor").mean_length is None
+
+    def test_cached_until_column_changes(self, sample_dataframe: pd.DataFrame) -> None:
+        """Deve reaproveitar o perfil e recalcular quando a coluna é substituída."""
+        df = sample_dataframe.copy()
+        first = column_profile(df, "nome")
+
+        assert column_profile(df, "nome") is first
+        assert get_id_column_name(df) == detect_native_id_column(df) == "id"
+
+        df["nome"] = ["a", "b", "c", "d", "e"]
+        assert column_profile(df, "nome").distinct == 5
+
+        clear_profiles(df)
+        assert column_profile(df, "nome") is not first
+
+    def test_released_with_dataframe(self, sample_dataframe: pd.DataFrame) -> None:
+        """As entradas do cache somem quando o DataFrame é coletado."""
+        df = sample_dataframe.copy()
+        column_profile(df, "id")
+        key = id(df)
+
+        del df
+        gc.collect()
+
+        assert key not in profile_module._PROFILES
+
+
+class TestDistinctSketches:
+    """Testes para HyperLogLog, has_duplicates e os limites de distintos."""
+
+    def test_hyperloglog_accuracy(self) -> None:
+        """A estimativa deve ficar a poucos desvios padrão da contagem exata."""
+        rng = np.random.default_rng(3)
+        for n in (20, 5_000, 300_000):
+            series = pd.Series(rng.integers(0, n, 2 * n))
+            sketch = HyperLogLog()
+            sketch.update(series)
+
+            exact = series.nunique()
+            assert abs(sketch.count() - exact) <= 4 * sketch.relative_error * exact + 2
+
+    def test_has_duplicates_matches_is_unique(self) -> None:
+        """Deve coincidir com is_unique, inclusive em casos de borda."""
+        cases = [
+            pd.Series(np.arange(200_000)),
+            pd.Series(np.r_[np.arange(199_999), 7]),
+            pd.Series([0.0, -0.0]),
+            pd.Series([np.nan, 1.0, np.nan]),
+            pd.Series([1, 1.0, "a"], dtype=object),
+            pd.Series(["a", "b", None]),
+            pd.Series(pd.Categorical(["x", "y", "x"])),
+        ]
+        for series in cases:
+            assert has_duplicates(series, first_block=1_000) == (not series.is_unique)
+
+    def test_bounds_contain_exact_count(self) -> None:
+        """Os limites (prefixo e HyperLogLog) devem conter o número exato de distintos."""
+        rng = np.random.default_rng(4)
+        df = pd.DataFrame(
+            {"poucos": rng.integers(0, 10, 300_000), "muitos": rng.integers(0, 10**6, 300_000)}
+        )
+        for col in df.columns:
+            exact = df[col].nunique()
+            for sketch in (False, True):
+                bounds = distinct_estimate(df, col, sketch=sketch)
+                assert bounds.lower <= exact <= bounds.upper
+            assert is_unique_column(df, col) is False
+
+    def test_id_detection_rules_out_without_exact_count(self) -> None:
+        """Colunas com nome de ID e muitos repetidos não devem ter perfil completo."""
+        rng = np.random.default_rng(5)
+        n = 300_000
+        df = pd.DataFrame({"codigo_loja": rng.integers(0, 50, n), "pedido": rng.permutation(n)})
+
+        assert detect_native_id_column(df) == "pedido"
+        assert profile_module._peek(df, "codigo_loja", "perfil") is None
+        assert profile_module._peek(df, "pedido", "perfil") is None
@@ -0,0 +1,127 @@
+"""
+Testes para o módulo analysis.streaming
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from analysis.indicator import generate_indicators
+from analysis.streaming import (
+    CategoricalAccumulator,
+    IndicatorAccumulator,
+    analyze_file_streaming,
+    generate_indicators_streaming,
+)
+from core.id_generator import ensure_id_column
+
+
+def _assert_same_indicators(expected: dict, result: dict) -> None:
+    for key in ("id_coluna", "id_is_synthetic", "total_linhas", "total_colunas"):
+        assert result[key] == expected[key]
+    for exp, res in zip(expected["agrupamentos"], result["agrupamentos"], strict=True):
+        assert res["coluna"] == exp["coluna"]
+        if exp["estatisticas"] is not None:
+            assert res["estatisticas"].keys() == exp["estatisticas"].keys()
+            for key, value in exp["estatisticas"].items():
+                if isinstance(value, float):
+                    assert np.isclose(res["estatisticas"][key], value)
+                else:
+                    assert res["estatisticas"][key] == value
+        if exp["tabela"] is None:
+            assert res["tabela"] is None
+        else:
+            pd.testing.assert_frame_equal(
+                res["tabela"].reset_index(drop=True), exp["tabela"].reset_index(drop=True)
+            )
+
+
+class TestGenerateIndicatorsStreaming:
+    """Testes para a função generate_indicators_streaming."""
+
+    def test_matches_in_memory_analysis(self, sample_dataframe: pd.DataFrame) -> None:
+        """Blocos devem produzir os mesmos indicadores que o DataFrame inteiro."""
+        chunks = (sample_dataframe.iloc[i : i + 2] for i in range(0, len(sample_dataframe), 2))
+
+        _assert_same_indicators(
+            generate_indicators(sample_dataframe), generate_indicators_streaming(chunks)
+        )
+
+    def test_top_categories_and_numeric_categories(self) -> None:
+        """Deve manter o corte de categorias frequentes e colunas numéricas categóricas."""
+        rng = np.random.default_rng(11)
+        n = 3000
+        df = pd.DataFrame(
+            {
+                "codigo": np.arange(n),
+                "cliente": [f"cliente {v}" for v in rng.zipf(1.4, n) % 500],
+                "faixa": rng.integers(0, 4, n),
+                "valor": rng.random(n),
+            }
+        )
+        chunks = (df.iloc[i : i + 700] for i in range(0, n, 700))
+
+        _assert_same_indicators(generate_indicators(df), generate_indicators_streaming(chunks))
+
+    def test_categorical_pairs_grow_linearly(self, monkeypatch) -> None:
+        """Os pares consolidados são refeitos poucas vezes: trabalho linear nos pares."""
+        sizes = []
+        compact = CategoricalAccumulator._compact
+
+        def counted(self) -> None:
+            compact(self)
+            sizes.append(len(self.pairs))
+
+        monkeypatch.setattr(CategoricalAccumulator, "_compact", counted)
+        acc = CategoricalAccumulator("cor", "id")
+        n_chunks, size = 300, 20
+        for i in range(n_chunks):
+            ids = np.arange(i * size, (i + 1) * size)
+            # Pares repetidos dentro do bloco são descartados antes de acumular
+            acc.update(pd.DataFrame({"cor": ["azul", "verde"] * size, "id": np.repeat(ids, 2)}))
+
+        total = 2 * n_chunks * size
+        assert acc.n_distinct == 2
+        assert acc.counts == [n_chunks * size, n_chunks * size]
+        assert len(sizes) < 30
+        assert sum(sizes) < 3 * total
+        tabela = acc.result()
+        assert tabela["frequencia"].tolist() == [total // 2, total // 2]
+
+    def test_synthetic_id_across_chunks(self) -> None:
+        """Sem ID nativo, o ID sintético deve continuar a numeração entre blocos."""
+        df = pd.DataFrame({"cor": ["azul", "azul", "verde", "verde", "azul", "verde"]})
+        chunks = (df.iloc[i : i + 4] for i in range(0, len(df), 4))
+        result = generate_indicators_streaming(chunks)
+
+        tabela = result["agrupamentos"][0]["tabela"]
+        assert result["id_coluna"] == "_synthetic_id"
+        assert sorted(tabela["ids"]) == ["1,2,5", "3,4,6"]
+
+    def test_merge_continues_synthetic_ids(self) -> None:
+        """Tabelas com ID sintético combinadas devem numerar como se concatenadas."""
+        df = pd.DataFrame({"cor": ["azul", "verde", "azul", "verde", "verde", "azul"] * 3})
+        partes = [ensure_id_column(df.iloc[:7]), ensure_id_column(df.iloc[7:])]
+        combinado = IndicatorAccumulator()
+        for parte in partes:
+            acumulador = IndicatorAccumulator()
+            acumulador.update(parte)
+            combinado.merge(acumulador)
+
+        _assert_same_indicators(generate_indicators(df), combinado.result())
+
+
+class TestAnalyzeFileStreaming:
+    """Testes para a função analyze_file_streaming."""
+
+    def test_analyze_csv_in_chunks(self, temp_csv_file: Path) -> None:
+        """Deve analisar o CSV bloco a bloco."""
+        progress = []
+        result = analyze_file_streaming(
+            temp_csv_file, chunksize=1, progress_callback=lambda p, t: progress.append((p, t))
+        )
+
+        assert result["id_coluna"] == "id"
+        assert result["total_linhas"] == 3
+        assert (3, None) in progress
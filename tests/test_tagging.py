@@ -0,0 +1,96 @@
+# tests/test_tagging.py
+"""
+Testes para o módulo analysis.tagging
+"""
+
+import pandas as pd
+
+from analysis.indicator import generate_indicators
+from analysis.streaming import generate_indicators_streaming
+from analysis.tagging import (
+    SynonymAutomaton,
+    dictionary_matches,
+    synonym_automaton,
+    tag_values,
+)
+
+
+class TestSynonymAutomaton:
+    """Testes para o autômato de sinônimos."""
+
+    def test_finds_overlapping_whole_words(self) -> None:
+        """Todas as ocorrências como palavra inteira; a marca é a do sinônimo mais longo."""
+        automaton = SynonymAutomaton(
+            {
+                "loja": ["Loja", "Loja de Conveniência"],
+                "conveniencia": ["Conveniência"],
+                "pronome": ["he", "she", "hers"],
+            },
+            min_length=2,
+        )
+
+        assert automaton.find("loja de conveniencia 24h") == [
+            (0, 4, "loja"),
+            (0, 20, "loja"),
+            (8, 20, "conveniencia"),
+        ]
+        assert automaton.find("he ushers hers") == [(0, 2, "pronome"), (10, 14, "pronome")]
+        assert automaton.find("lojas") == []
+        assert automaton.tag("Loja de Conveniência Centro") == "loja"
+        assert automaton.tag(None) is None
+
+    def test_short_synonyms_are_ignored(self) -> None:
+        """Sinônimos abaixo do comprimento mínimo não marcam valores."""
+        automaton = SynonymAutomaton({"rua": ["R", "Rua"]}, min_length=3)
+
+        assert automaton.tag("R. das Flores") is None
+        assert automaton.tag("Rua das Flores") == "rua"
+
+
+class TestValueTagging:
+    """Testes para tag_values e dictionary_matches com o dicionário padrão."""
+
+    def test_tags_and_counts_per_column(self) -> None:
+        """Linhas recebem a marca do seu valor; a contagem ignora colunas sem marca."""
+        df = pd.DataFrame(
+            {
+                "estabelecimento": ["Farmácia Pague Menos", "FARMACIA pague menos", None, "Xyz"],
+                "obs": ["nada", "texto", "alguma", "aqui"],
+                "valor": [1, 2, 3, 4],
+            }
+        )
+
+        tags = tag_values(df["estabelecimento"])
+        assert tags.tolist() == ["farmacia", "farmacia", None, None]
+        assert tags.index.equals(df.index)
+        matches = dictionary_matches(df)
+        assert list(matches) == ["estabelecimento"]
+        assert matches["estabelecimento"].to_dict() == {"farmacia": 2}
+        assert synonym_automaton() is synonym_automaton()
+
+
+class TestDictionaryInIndicators:
+    """Testes para o dicionário de sinônimos na geração de indicadores."""
+
+    def test_synonyms_are_standardized_and_counted(self) -> None:
+        """Sinônimos inteiros viram a chave antes do agrupamento; a contagem por marca é reportada."""
+        df = pd.DataFrame(
+            {
+                "codigo": range(7),
+                "loja": ["Farmácia", "Pharmacy", "DRUGSTORE", "Shell", "Posto Shell", "Xyz", "x"],
+            }
+        )
+
+        (grupo,) = generate_indicators(df)["agrupamentos"]
+        farmacia = grupo["tabela"].iloc[0]
+        assert farmacia["termo_base"] == "FARMACIA"
+        assert farmacia["variantes"] == "DRUGSTORE; Farmácia; Pharmacy"
+        assert farmacia["ids"] == "0,1,2"
+        assert "POSTO SHELL" in grupo["tabela"]["termo_base"].tolist()
+        assert grupo["dicionario"] == {"farmacia": 3, "shell": 2}
+
+        (streamed,) = generate_indicators_streaming([df.iloc[:3], df.iloc[3:]])["agrupamentos"]
+        assert streamed["dicionario"] == grupo["dicionario"]
+        pd.testing.assert_frame_equal(
+            streamed["tabela"].reset_index(drop=True), grupo["tabela"].reset_index(drop=True)
+        )
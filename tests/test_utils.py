@@ -40,3 +40,13 @@ def test_normalize_cep_preserves_nan(self) -> None:
         assert result["cep"].iloc[0] == "01310100"
         assert pd.isna(result["cep"].iloc[1])
         assert result["cep"].iloc[2] == "30130000"
+
+    def test_normalize_cep_keeps_category(self) -> None:
+        """Colunas category devem continuar categóricas."""
+        df = pd.DataFrame({"cep": pd.Categorical(["1310100", None, "1310100.0", "30130000"])})
+        result = normalize_cep_column(df, cep_cols=["cep"])
+
+        assert isinstance(result["cep"].dtype, pd.CategoricalDtype)
+        assert result["cep"].tolist()[0] == "01310100"
+        assert pd.isna(result["cep"].iloc[1])
+        assert result["cep"].tolist()[2:] == ["01310100", "30130000"]
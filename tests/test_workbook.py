@@ -0,0 +1,99 @@
+"""
+Testes para o módulo analysis.workbook
+"""
+
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from analysis.indicator import generate_indicators
+from analysis.streaming import generate_indicators_streaming
+from analysis.workbook import analyze_workbook
+from core.id_generator import ensure_id_column
+from core.loader import load_spreadsheet
+
+
+@pytest.fixture
+def temp_workbook(tmp_path: Path) -> Path:
+    """Pasta de trabalho com três abas de mesmo layout."""
+    workbook = openpyxl.Workbook()
+    workbook.remove(workbook.active)
+    for month, offset in (("Jan", 0), ("Fev", 100), ("Mar", 200)):
+        sheet = workbook.create_sheet(month)
+        sheet.append(["codigo", "cidade", "valor"])
+        for i in range(40):
+            cidade = ["São Paulo", "Sao Paulo", "Rio de Janeiro", "Curitiba"][i % 4]
+            sheet.append([offset + i, cidade, i * 2.5])
+    path = tmp_path / "mensal.xlsx"
+    workbook.save(path)
+    return path
+
+
+class TestAnalyzeWorkbook:
+    """Testes para a função analyze_workbook."""
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_analyzes_every_sheet(self, temp_workbook: Path, workers: int) -> None:
+        """Cada aba deve ser analisada, com progresso por aba."""
+        progress = []
+        result = analyze_workbook(
+            temp_workbook, progress_callback=lambda p, t: progress.append((p, t)), workers=workers
+        )
+
+        assert list(result["abas"]) == ["Jan", "Fev", "Mar"]
+        assert all(ind["total_linhas"] == 40 for ind in result["abas"].values())
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert result["combinado"] is None
+
+    def test_combined_matches_concatenated_sheets(self, temp_workbook: Path) -> None:
+        """A combinação deve equivaler à análise das abas concatenadas."""
+        result = analyze_workbook(temp_workbook, workers=2, combine=True)
+        sheets = [
+            ensure_id_column(load_spreadsheet(temp_workbook, sheet_name=name))
+            for name in ("Jan", "Fev", "Mar")
+        ]
+        expected = generate_indicators_streaming(sheets)
+
+        combinado = result["combinado"]
+        assert combinado["total_linhas"] == 120
+        for exp, res in zip(expected["agrupamentos"], combinado["agrupamentos"], strict=True):
+            assert res["coluna"] == exp["coluna"]
+            assert res["estatisticas"] == exp["estatisticas"]
+            if exp["tabela"] is not None:
+                pd.testing.assert_frame_equal(res["tabela"], exp["tabela"])
+
+    def test_incompatible_sheet_stays_out(self, temp_workbook: Path) -> None:
+        """Abas de outro layout ficam fora de ``combinadas``, com os próprios indicadores."""
+        workbook = openpyxl.load_workbook(temp_workbook)
+        sheet = workbook.create_sheet("Notas", 1)
+        sheet.append(["codigo", "observacao"])
+        for i in range(10):
+            sheet.append([i, ["ok", "pendente"][i % 2]])
+        workbook.save(temp_workbook)
+
+        result = analyze_workbook(temp_workbook, workers=1, combine=True)
+
+        assert list(result["abas"]) == ["Jan", "Notas", "Fev", "Mar"]
+        assert result["combinadas"] == ["Jan", "Fev", "Mar"]
+        assert result["combinado"]["total_linhas"] == 120
+        notas = result["abas"]["Notas"]
+        expected = generate_indicators(
+            ensure_id_column(load_spreadsheet(temp_workbook, sheet_name="Notas"))
+        )
+        assert notas["total_linhas"] == 10
+        for exp, res in zip(expected["agrupamentos"], notas["agrupamentos"], strict=True):
+            assert res["coluna"] == exp["coluna"]
+            assert res["estatisticas"] == exp["estatisticas"]
+            pd.testing.assert_frame_equal(
+                res["tabela"].reset_index(drop=True), exp["tabela"].reset_index(drop=True)
+            )
+
+    def test_csv_is_a_single_sheet(self, temp_csv_file: Path) -> None:
+        """Arquivos CSV devem ser tratados como uma única aba."""
+        result = analyze_workbook(temp_csv_file, combine=True)
+
+        assert list(result["abas"]) == ["test_data"]
+        assert result["combinadas"] == ["test_data"]
+        assert result["combinado"]["total_linhas"] == 3